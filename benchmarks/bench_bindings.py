@@ -0,0 +1,95 @@
+"""
+Per-call overhead of methods on a three element list for each argument binding strategy, compared with the builtin or
+itertools call they wrap. Each method is called four ways:
+
+* ``builtin``: the equivalent call written by hand.
+* ``bound``: the callable bound by the method's binding strategy, e.g. the ``rpartial`` of
+  :class:`RightPartialIterableBindingStrategy`, then called.
+* ``generic``: :meth:`MethodStrategy.__call__`, which binds, formats and calls through ``partial`` and ``safe_call``.
+* ``compiled``: the method of a collection returned by ``collect``.
+
+Methods bound with :class:`PartialInstanceBindingStrategy` store intermediate results on the collection, so each call
+first restores its iterable. The same wrapper is timed around the builtin. Ratios are to the builtin, and the
+geometric mean of each strategy is printed last.
+
+Run with::
+
+    python -m benchmarks.bench_bindings [number]
+
+"""
+import heapq
+import itertools
+import operator
+import statistics
+import sys
+import timeit
+from functools import reduce
+
+from iterable_collections import collect
+from iterable_collections.factory import default_registry
+
+
+def double(x):
+    return x * 2
+
+
+def chunked(data, length):
+    iterator = iter(data)
+    return list(iter(lambda: list(itertools.islice(iterator, length)), []))
+
+
+CASES = (
+    ('len', [1, 2, 3], (), len),
+    ('contains', [1, 2, 3], (2,), operator.contains),
+    ('any', [1, 2, 3], (), any),
+    ('sorted', [3, 1, 2], (), sorted),
+    ('filter', [1, 0, 2], (None,), lambda data, func: filter(func, data)),
+    ('join', ['a', 'b', 'c'], (',',), lambda data, sep: sep.join(data)),
+    ('map', [1, 2, 3], (double,), lambda data, func: map(func, data)),
+    ('reduce', [1, 2, 3], (operator.add,), lambda data, func: reduce(func, data)),
+    ('top_k', [1, 2, 3], (2,), lambda data, n: heapq.nlargest(n, data)),
+    ('chunks', [1, 2, 3], (2,), chunked),
+    ('concat', [1, 2, 3], ([4],), lambda data, other: list(itertools.chain(data, other))),
+    ('diff', [1, 2, 3], ([2],), lambda data, other: set(data) - set(other)),
+)
+
+
+def measure(func, instance, data, number):
+    def call():
+        instance._iterable = data
+        return func()
+    return min(timeit.repeat(call, number=number, repeat=3)) / number * 1e9
+
+
+def main(number=100000):
+    registry = default_registry()
+    ratios = {}
+    print('{:<41} {:<9} {:>9} {:>9} {:>9} {:>9} {:>8} {:>8}'.format(
+        'strategy', 'method', 'builtin', 'bound', 'generic', 'compiled', 'generic', 'compiled'
+    ))
+    for name, data, args, builtin in CASES:
+        strategy = registry[name]
+        binding = strategy.iterable_binding_strategy
+        instance = collect(data)
+        method = getattr(instance, name)
+        timings = [
+            measure(func, instance, data, number) for func in (
+                lambda: builtin(data, *args),
+                lambda: binding.bind(strategy.callable, instance)(*args),
+                lambda: strategy(instance, *args, store=False, ret=True),
+                lambda: method(*args, store=False, ret=True),
+            )
+        ]
+        row = (timings[2] / timings[0], timings[3] / timings[0])
+        ratios.setdefault(type(binding).__name__, []).append(row)
+        print('{:<41} {:<9} {:>6.0f} ns {:>6.0f} ns {:>6.0f} ns {:>6.0f} ns {:>7.1f}x {:>7.1f}x'.format(
+            type(binding).__name__, name, *timings, *row
+        ))
+    print()
+    print('{:<41} {:>8} {:>8}'.format('strategy', 'generic', 'compiled'))
+    for binding, rows in ratios.items():
+        print('{:<41} {:>7.1f}x {:>7.1f}x'.format(binding, *map(statistics.geometric_mean, zip(*rows))))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,33 @@
+"""
+Throughput of long method chains on small inputs, measured in chains per second.
+
+Run with::
+
+    python -m benchmarks.bench_chain [number]
+
+"""
+import sys
+import timeit
+
+from iterable_collections import collect
+from iterable_collections.collection import Collection
+from iterable_collections.factory import default_registry
+
+
+def chain(c):
+    return c.map(abs).filter(bool).map(str).list_().map(len).filter(bool).sorted().list()
+
+
+def report(label, seconds, number):
+    print('{:<40} {:>12,.0f} chains/s'.format(label, number / seconds))
+
+
+def main(number=50000):
+    data = [1, -2, 3, 0, 5]
+    registry = default_registry()
+    report('Collection.__getattr__', timeit.timeit(lambda: chain(Collection(data, registry)), number=number), number)
+    report('collect() descriptors', timeit.timeit(lambda: chain(collect(data)), number=number), number)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,42 @@
+"""
+Per-call cost of building the strategies used by :func:`collect`.
+
+Run with::
+
+    python -m benchmarks.bench_collect [number]
+
+"""
+import sys
+import timeit
+
+from iterable_collections import collect
+from iterable_collections.collection import Collection
+from iterable_collections.factory import DefaultMethodStrategyFactory
+
+
+def rebuild(iterable):
+    return Collection(iterable, DefaultMethodStrategyFactory().create())
+
+
+def report(label, seconds, number):
+    print('{:<40} {:>10.3f} us/call'.format(label, seconds / number * 1e6))
+
+
+def main(number=20000):
+    data = [1, 2, 3]
+    report('collect() rebuilding strategies', timeit.timeit(lambda: rebuild(data), number=number), number)
+    report('collect() with shared registry', timeit.timeit(lambda: collect(data), number=number), number)
+    report(
+        'collect().len() rebuilding strategies',
+        timeit.timeit(lambda: rebuild(data).len(), number=number),
+        number
+    )
+    report(
+        'collect().len() with shared registry',
+        timeit.timeit(lambda: collect(data).len(), number=number),
+        number
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,34 @@
+"""
+Per-call overhead of trivial methods through the generic :class:`MethodStrategy` call path, the compiled fast path
+and the raw builtin.
+
+Run with::
+
+    python -m benchmarks.bench_compiled [number]
+
+"""
+import sys
+import timeit
+
+from iterable_collections import collect
+from iterable_collections.collection import Collection
+from iterable_collections.factory import default_registry
+
+
+def main(number=200000):
+    data = [1, 2, 3]
+    generic = Collection(data, default_registry())
+    compiled = collect(data)
+    cases = (
+        ('len', lambda: len(data), generic.len, compiled.len),
+        ('any', lambda: any(data), generic.any, compiled.any),
+        ('contains', lambda: 2 in data, lambda: generic.contains(2), lambda: compiled.contains(2)),
+    )
+    print('{:<10} {:>12} {:>12} {:>12} {:>8}'.format('method', 'builtin', 'generic', 'compiled', 'ratio'))
+    for name, builtin, slow, fast in cases:
+        timings = [timeit.timeit(f, number=number) / number * 1e9 for f in (builtin, slow, fast)]
+        print('{:<10} {:>9.0f} ns {:>9.0f} ns {:>9.0f} ns {:>7.1f}x'.format(name, *timings, timings[2] / timings[0]))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
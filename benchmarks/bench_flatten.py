@@ -0,0 +1,55 @@
+"""
+Throughput of flatten on deeply nested and very wide inputs, compared with a recursive flatten which copies each
+nested sequence to a list.
+
+Run with::
+
+    python -m benchmarks.bench_flatten [size]
+
+"""
+import sys
+import time
+from collections.abc import Sequence
+
+from iterable_collections import collect
+
+
+def recursive_flatten(iterable):
+    flat_list = []
+    for i in iterable:
+        flat_list += recursive_flatten(list(i)) if isinstance(i, Sequence) and not isinstance(i, (str, bytes)) else [i]
+    return flat_list
+
+
+def inputs(size):
+    deep = [0]
+    for i in range(1, size // 100):
+        deep = [i, deep]
+    return (
+        ('wide', [[i, i, i, i] for i in range(size // 4)]),
+        ('wide nested', [[[i, [i]], i] for i in range(size // 3)]),
+        ('deep', deep),
+    )
+
+
+def measure(func, data):
+    start = time.perf_counter()
+    try:
+        count = len(func(data))
+    except RecursionError:
+        return None, None
+    return count, time.perf_counter() - start
+
+
+def main(size=1000000):
+    print('{:<14} {:>20} {:>20}'.format('input', 'recursive', 'flatten'))
+    for label, data in inputs(size):
+        rates = []
+        for func in (recursive_flatten, lambda d: collect(d).flatten().list()):
+            count, elapsed = measure(func, data)
+            rates.append('RecursionError' if count is None else '{:,.0f} el/s'.format(count / elapsed))
+        print('{:<14} {:>20} {:>20}'.format(label, *rates))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
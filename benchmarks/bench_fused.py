@@ -0,0 +1,45 @@
+"""
+Throughput of element-wise chains executed as nested builtin iterators versus a single fused kernel.
+
+Run with::
+
+    python -m benchmarks.bench_fused [size]
+
+"""
+import sys
+import time
+
+from iterable_collections import collect
+from iterable_collections.collection import LazyCollection
+from iterable_collections.plan import PlanOptimizer, FuseStagesRule
+
+
+def chains(size):
+    data = dict.fromkeys(range(size), 1)
+    return (
+        ('map/filter/map', range(size), lambda c: c.map(lambda x: x + 1).filter(lambda x: x % 3).map(lambda x: x * 2)),
+        ('emap/filter', range(size), lambda c: c.emap(lambda i, x: i + x).filter(lambda x: x % 3)),
+        ('map_items/filter', data, lambda c: c.map_items(lambda k, v: k + v).filter(lambda x: x % 3)),
+        ('filter_items/map', data, lambda c: c.filter_items(lambda k, v: k % 3).map(lambda x: x[0])),
+    )
+
+
+def measure(collection, chain):
+    start = time.perf_counter()
+    for _ in chain(collection):
+        pass
+    return time.perf_counter() - start
+
+
+def main(size=10000000):
+    print('{:<20} {:>16} {:>16} {:>8}'.format('chain', 'nested', 'fused', 'speedup'))
+    for label, data, chain in chains(size):
+        nested = measure(collect(data), chain)
+        fused = measure(LazyCollection(collect(data), optimizer=PlanOptimizer(rules=(FuseStagesRule(),))), chain)
+        print('{:<20} {:>10,.0f} el/s {:>10,.0f} el/s {:>7.2f}x'.format(
+            label, size / nested, size / fused, nested / fused
+        ))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
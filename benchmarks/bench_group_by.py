@@ -0,0 +1,45 @@
+"""
+Throughput of grouping with sorted_and_groupby, which sorts before grouping, versus the hash based group_by, both
+collecting each group to a list and counting each group.
+
+Run with::
+
+    python -m benchmarks.bench_group_by [size] [groups]
+
+"""
+import sys
+import time
+
+from iterable_collections import collect
+
+
+def cases(groups):
+    def key(x):
+        return x % groups
+
+    return (
+        ('lists', lambda d: collect(d).sorted_and_groupby(key).map(lambda g: (g[0], list(g[1]))).dict(),
+         lambda d: collect(d).group_by(key).iterable),
+        ('count', lambda d: collect(d).sorted_and_groupby(key).map(lambda g: (g[0], sum(1 for _ in g[1]))).dict(),
+         lambda d: collect(d).group_by(key, 'count').iterable),
+    )
+
+
+def measure(func, data):
+    start = time.perf_counter()
+    func(data)
+    return time.perf_counter() - start
+
+
+def main(size=1000000, groups=1000):
+    data = [i * 2654435761 % size for i in range(size)]
+    print('{:<8} {:>20} {:>16} {:>8}'.format('case', 'sorted_and_groupby', 'group_by', 'speedup'))
+    for label, sorting, hashing in cases(groups):
+        sorted_time, hash_time = measure(sorting, data), measure(hashing, data)
+        print('{:<8} {:>14,.0f} el/s {:>10,.0f} el/s {:>7.2f}x'.format(
+            label, size / sorted_time, size / hash_time, sorted_time / hash_time
+        ))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""
+Throughput of reading and writing JSON Lines with collect_jsonl and to_jsonl, compared with decoding and encoding
+one line at a time.
+
+Run with::
+
+    python -m benchmarks.bench_jsonl [lines]
+
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from iterable_collections import collect, collect_jsonl
+
+
+def records(lines):
+    return ({'id': i, 'name': 'user {}'.format(i), 'tags': ['a', 'b'][:i % 3], 'score': i / 7} for i in range(lines))
+
+
+def write_lines(path, lines):
+    with open(path, 'w') as f:
+        for record in records(lines):
+            f.write(json.dumps(record) + '\n')
+
+
+def read_lines(path):
+    with open(path) as f:
+        return collect([json.loads(line) for line in f]).len()
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(lines=200000):
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        print('{:<8} {:>16} {:>16}'.format('', 'per line', 'batched'))
+        write = (
+            measure(write_lines, path, lines),
+            measure(lambda: collect(records(lines)).to_jsonl(path)),
+        )
+        print('{:<8} {:>13.3f} s {:>13.3f} s'.format('write', *write))
+        read = (
+            measure(read_lines, path),
+            measure(lambda: collect_jsonl(path).list_().len()),
+        )
+        print('{:<8} {:>13.3f} s {:>13.3f} s'.format('read', *read))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,369 @@
+"""
+Time every method registered by DefaultMethodStrategyFactory against the equivalent hand written Python, over input
+sizes and kinds of input, and compare the results with a stored baseline.
+
+Each case runs a method on a new collection, consuming any iterator it returns, and the same work written with
+builtins, itertools and heapq. The time of each is the best of ``--repeat`` runs of ``timeit`` lasting at least
+``--min-time`` seconds, and their ratio is what is compared with the baseline, so results from different machines
+remain comparable. A case whose ratio grew by more than ``--threshold`` is flagged as a regression and the exit status
+is 1. pmap, pfilter and preduce start a process pool on each call and dominate the run at small sizes; leave them out
+with ``--methods`` when iterating.
+
+Run with::
+
+    python -m benchmarks.bench_methods --sizes 10 1000 100000 10000000 --output results.json
+    python -m benchmarks.bench_methods --methods map filter --kinds list generator --baseline results.json
+
+"""
+import argparse
+import csv
+import functools
+import heapq
+import itertools
+import json
+import operator
+import os
+import platform
+import sys
+import tempfile
+import timeit
+from array import array
+from collections import OrderedDict, namedtuple
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from iterable_collections import collect
+from iterable_collections.factory import default_registry
+from iterable_collections.reducers import Count, Sum
+from iterable_collections.utils import DictItem
+
+ITERABLES = ('list', 'tuple', 'set', 'dict', 'generator')
+NON_MAPPINGS = ('list', 'tuple', 'set', 'generator')
+SIZED = ('list', 'tuple', 'set', 'dict')
+SEQUENCES = ('list', 'tuple')
+MAPPINGS = ('dict',)
+DEFAULT_SIZES = (10, 1000, 100000)
+
+Case = namedtuple('Case', 'method run baseline kinds prepare')
+Case.__new__.__defaults__ = (ITERABLES, None)
+
+
+def double(x):
+    return x * 2
+
+
+def is_even(x):
+    return not x % 2
+
+
+def is_even_item(k, v):
+    return not v % 2
+
+
+def pairs(values):
+    return [values[i:i + 2] for i in range(0, len(values), 2)]
+
+
+def rows(values):
+    return [{'id': x, 'name': str(x)} for x in values]
+
+
+def strings(values):
+    return list(map(str, values))
+
+
+def as_sequence(d):
+    return d if isinstance(d, Sequence) else list(d)
+
+
+def count_and_sum(d):
+    count = total = 0
+    for x in d:
+        count += 1
+        total += x
+    return count, total
+
+
+def chunked(d, length):
+    iterator = iter(d)
+    return list(iter(lambda: list(itertools.islice(iterator, length)), []))
+
+
+def flatten(d):
+    return [x for pair in d for x in pair]
+
+
+def group(d, key):
+    groups = {}
+    for x in d:
+        groups.setdefault(key(x), []).append(x)
+    return groups
+
+
+def unique(d):
+    return list(dict.fromkeys(d))
+
+
+def write_csv(d, path):
+    with open(path, 'w', newline='') as f:
+        writer = None
+        for row in d:
+            if writer is None:
+                writer = csv.DictWriter(f, list(row))
+                writer.writeheader()
+            writer.writerow(row)
+
+
+def write_jsonl(d, path):
+    with open(path, 'w') as f:
+        for row in d:
+            f.write(json.dumps(row) + '\n')
+
+
+def pmap(d):
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(double, d))
+
+
+def pfilter(d):
+    with ProcessPoolExecutor() as executor:
+        return list(itertools.compress(d, list(executor.map(is_even, d))))
+
+
+def tmap(d):
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(double, d))
+
+
+def tfilter(d):
+    with ThreadPoolExecutor() as executor:
+        return list(itertools.compress(d, list(executor.map(is_even, d))))
+
+
+def output_path(name):
+    return os.path.join(tempfile.gettempdir(), 'bench_methods.{}'.format(name))
+
+
+CASES = (
+    Case('aggregate', lambda d, o: collect(d).aggregate(n=Count(), total=Sum()), lambda d, o: count_and_sum(d)),
+    Case('all', lambda d, o: collect(d).all(), lambda d, o: all(d)),
+    Case('any', lambda d, o: collect(d).any(), lambda d, o: any(d)),
+    Case('array_', lambda d, o: collect(d).array_('q'), lambda d, o: array('q', d)),
+    Case('bottom_k', lambda d, o: collect(d).bottom_k(10).list(), lambda d, o: heapq.nsmallest(10, d)),
+    Case('chunks', lambda d, o: collect(d).chunks(100).list(), lambda d, o: chunked(d, 100), NON_MAPPINGS),
+    Case('chunks_dict', lambda d, o: collect(d).chunks_dict(100).list(), lambda d, o: chunked(d.items(), 100),
+         MAPPINGS),
+    Case('chunks_iter', lambda d, o: collect(iter(d)).chunks_iter(100).list(), lambda d, o: chunked(d, 100)),
+    Case('chunks_seq', lambda d, o: collect(d).chunks_seq(100).list(), lambda d, o: chunked(d, 100), SEQUENCES),
+    Case('concat', lambda d, o: collect(d).concat(o).list(), lambda d, o: list(itertools.chain(d, o)), NON_MAPPINGS),
+    Case('concat_dict', lambda d, o: collect(d).concat_dict(o).dict(), lambda d, o: {**d, **o}, MAPPINGS),
+    Case('concat_iter', lambda d, o: collect(d).concat_iter(iter(o)).list(),
+         lambda d, o: list(itertools.chain(d, iter(o)))),
+    Case('concat_seq', lambda d, o: collect(d).concat_seq(o).list(), lambda d, o: list(d) + o, NON_MAPPINGS),
+    Case('contains', lambda d, o: collect(d).contains(-1), lambda d, o: -1 in d),
+    Case('dict', lambda d, o: collect(d).dict(), lambda d, o: dict(d), MAPPINGS),
+    Case('dict_', lambda d, o: collect(d).dict_().iterable, lambda d, o: dict(d), MAPPINGS),
+    Case('diff', lambda d, o: collect(d).diff(o).list(), lambda d, o: list(set(d) - set(o)), SEQUENCES + ('set',)),
+    Case('diff_dict', lambda d, o: collect(d).diff_dict(o).list(), lambda d, o: list(d.items() - o.items()),
+         MAPPINGS),
+    Case('diff_iter', lambda d, o: collect(d).diff_iter(iter(o)).list(), lambda d, o: list(set(d) - set(iter(o)))),
+    Case('diff_seq', lambda d, o: collect(d).diff_seq(o).list(), lambda d, o: list(set(d) - set(o))),
+    Case('emap', lambda d, o: collect(d).emap(operator.add).list(),
+         lambda d, o: [i + x for i, x in enumerate(d)]),
+    Case('empty', lambda d, o: collect(d).empty(), lambda d, o: not d, SIZED),
+    Case('enumerate', lambda d, o: collect(d).enumerate().list(), lambda d, o: list(enumerate(d))),
+    Case('filter', lambda d, o: collect(d).filter(is_even).list(), lambda d, o: list(filter(is_even, d))),
+    Case('filter_items', lambda d, o: collect(d).filter_items(is_even_item).list(),
+         lambda d, o: [(k, v) for k, v in d.items() if is_even_item(k, v)], MAPPINGS),
+    Case('filter_nt_items', lambda d, o: collect(d).filter_nt_items(lambda item: is_even(item.value)).list(),
+         lambda d, o: [DictItem(k, v) for k, v in d.items() if is_even(v)], MAPPINGS),
+    Case('first', lambda d, o: collect(d).first(), lambda d, o: d[0], SEQUENCES),
+    Case('first_item', lambda d, o: collect(d).first_item(), lambda d, o: next(iter(d.items())), MAPPINGS),
+    Case('first_nt_item', lambda d, o: collect(d).first_nt_item(), lambda d, o: DictItem(*next(iter(d.items()))),
+         MAPPINGS),
+    Case('flatten', lambda d, o: collect(d).flatten().list(), lambda d, o: flatten(d), SEQUENCES + ('generator',),
+         pairs),
+    Case('getitem', lambda d, o: collect(d).getitem(0), lambda d, o: d[0], SEQUENCES + MAPPINGS),
+    Case('group_by', lambda d, o: collect(d).group_by(is_even).dict(), lambda d, o: group(d, is_even)),
+    Case('groupby', lambda d, o: collect(d).groupby(is_even).list(), lambda d, o: list(itertools.groupby(d, is_even))),
+    Case('intersect', lambda d, o: collect(d).intersect(o).list(), lambda d, o: list(set(d) & set(o)),
+         SEQUENCES + ('set',)),
+    Case('intersect_dict', lambda d, o: collect(d).intersect_dict(o).list(), lambda d, o: list(d.items() & o.items()),
+         MAPPINGS),
+    Case('intersect_iter', lambda d, o: collect(d).intersect_iter(iter(o)).list(),
+         lambda d, o: list(set(d) & set(iter(o)))),
+    Case('intersect_seq', lambda d, o: collect(d).intersect_seq(o).list(), lambda d, o: list(set(d) & set(o))),
+    Case('islice', lambda d, o: collect(d).islice(0, None, 2).list(),
+         lambda d, o: list(itertools.islice(d, 0, None, 2))),
+    Case('items', lambda d, o: collect(d).items().list(), lambda d, o: list(d.items()), MAPPINGS),
+    Case('iter', lambda d, o: list(collect(d).iter()), lambda d, o: list(iter(d))),
+    Case('iter_', lambda d, o: collect(d).iter_().list(), lambda d, o: list(iter(d))),
+    Case('join', lambda d, o: collect(d).join(','), lambda d, o: ','.join(d), ITERABLES, strings),
+    Case('last', lambda d, o: collect(d).last(), lambda d, o: d[-1], SEQUENCES),
+    Case('last_item', lambda d, o: collect(d).last_item(), lambda d, o: tuple(d.items())[-1], MAPPINGS),
+    Case('last_nt_item', lambda d, o: collect(d).last_nt_item(), lambda d, o: DictItem(*tuple(d.items())[-1]),
+         MAPPINGS),
+    Case('len', lambda d, o: collect(d).len(), lambda d, o: len(d), SIZED),
+    Case('list', lambda d, o: collect(d).list(), lambda d, o: list(d)),
+    Case('list_', lambda d, o: collect(d).list_().iterable, lambda d, o: list(d)),
+    Case('map', lambda d, o: collect(d).map(double).list(), lambda d, o: list(map(double, d))),
+    Case('map_items', lambda d, o: collect(d).map_items(operator.add).list(),
+         lambda d, o: [k + v for k, v in d.items()], MAPPINGS),
+    Case('map_nt_items', lambda d, o: collect(d).map_nt_items(lambda item: item.key + item.value).list(),
+         lambda d, o: [item.key + item.value for item in map(DictItem._make, d.items())], MAPPINGS),
+    Case('max', lambda d, o: collect(d).max(), lambda d, o: max(d)),
+    Case('min', lambda d, o: collect(d).min(), lambda d, o: min(d)),
+    Case('next', lambda d, o: collect(d).next(), lambda d, o: next(iter(d))),
+    Case('nlargest_items', lambda d, o: collect(d).nlargest_items(10).list(),
+         lambda d, o: heapq.nlargest(10, d.items()), MAPPINGS),
+    Case('nlargest_nt_items', lambda d, o: collect(d).nlargest_nt_items(10).list(),
+         lambda d, o: heapq.nlargest(10, map(DictItem._make, d.items())), MAPPINGS),
+    Case('nsmallest_items', lambda d, o: collect(d).nsmallest_items(10).list(),
+         lambda d, o: heapq.nsmallest(10, d.items()), MAPPINGS),
+    Case('nsmallest_nt_items', lambda d, o: collect(d).nsmallest_nt_items(10).list(),
+         lambda d, o: heapq.nsmallest(10, map(DictItem._make, d.items())), MAPPINGS),
+    Case('nt_items', lambda d, o: collect(d).nt_items().list(), lambda d, o: list(map(DictItem._make, d.items())),
+         MAPPINGS),
+    Case('ordered_dict', lambda d, o: collect(d).ordered_dict(), lambda d, o: OrderedDict(d), MAPPINGS),
+    Case('ordered_dict_', lambda d, o: collect(d).ordered_dict_().iterable, lambda d, o: OrderedDict(d), MAPPINGS),
+    Case('pfilter', lambda d, o: collect(d).pfilter(is_even).list(), lambda d, o: pfilter(d), SEQUENCES),
+    Case('pmap', lambda d, o: collect(d).pmap(double).list(), lambda d, o: pmap(d), SEQUENCES),
+    Case('pop', lambda d, o: collect(d).pop(), lambda d, o: list(d).pop()),
+    Case('preduce', lambda d, o: collect(d).preduce(operator.add, 0), lambda d, o: functools.reduce(operator.add, d, 0),
+         SEQUENCES),
+    Case('reduce', lambda d, o: collect(d).reduce(operator.add), lambda d, o: functools.reduce(operator.add, d)),
+    Case('reduce_items', lambda d, o: collect(d).reduce_items(lambda total, k, v: total + v, 0),
+         lambda d, o: functools.reduce(lambda total, item: total + item[1], d.items(), 0), MAPPINGS),
+    Case('reduce_nt_items', lambda d, o: collect(d).reduce_nt_items(lambda total, item: total + item.value, 0),
+         lambda d, o: functools.reduce(lambda total, item: total + item.value, map(DictItem._make, d.items()), 0),
+         MAPPINGS),
+    Case('reversed', lambda d, o: collect(d).reversed().list(), lambda d, o: list(reversed(as_sequence(d)))),
+    Case('set', lambda d, o: collect(d).set(), lambda d, o: set(d)),
+    Case('set_', lambda d, o: collect(d).set_().iterable, lambda d, o: set(d)),
+    Case('setitem', lambda d, o: collect(d).setitem(0, 0), lambda d, o: operator.setitem(d, 0, 0), ('list', 'dict')),
+    Case('slice', lambda d, o: collect(d).slice(1, -1).list(), lambda d, o: list(as_sequence(d)[1:-1])),
+    Case('sorted', lambda d, o: collect(d).sorted().list(), lambda d, o: sorted(d)),
+    Case('sorted_and_groupby', lambda d, o: collect(d).sorted_and_groupby(is_even).list(),
+         lambda d, o: list(itertools.groupby(sorted(d, key=is_even), is_even))),
+    Case('tfilter', lambda d, o: collect(d).tfilter(is_even).list(), lambda d, o: tfilter(d), SEQUENCES),
+    Case('tmap', lambda d, o: collect(d).tmap(double).list(), lambda d, o: tmap(d), SEQUENCES),
+    Case('to_csv', lambda d, o: collect(d).to_csv(output_path('csv')), lambda d, o: write_csv(d, output_path('csv')),
+         ('list', 'generator'), rows),
+    Case('to_jsonl', lambda d, o: collect(d).to_jsonl(output_path('jsonl')),
+         lambda d, o: write_jsonl(d, output_path('jsonl')), ('list', 'generator'), rows),
+    Case('top_k', lambda d, o: collect(d).top_k(10).list(), lambda d, o: heapq.nlargest(10, d)),
+    Case('tuple', lambda d, o: collect(d).tuple(), lambda d, o: tuple(d)),
+    Case('tuple_', lambda d, o: collect(d).tuple_().iterable, lambda d, o: tuple(d)),
+    Case('unique', lambda d, o: collect(d).unique().list(), lambda d, o: unique(d)),
+    Case('view', lambda d, o: collect(d).view().slice(1, -1).len(), lambda d, o: len(d[1:-1]), SEQUENCES),
+    Case('zip', lambda d, o: collect(d).zip(o).list(), lambda d, o: list(zip(d, o))),
+)
+
+
+def inputs(kind, size, prepare=None):
+    values = list(range(size))
+    if prepare is not None:
+        values = prepare(values)
+    other = list(range(size // 2, size + size // 2))
+    if kind == 'generator':
+        return lambda: (x for x in values), other
+    if kind == 'dict':
+        return lambda data=dict(zip(values, values)): data, dict(zip(other, other))
+    return lambda data={'list': list, 'tuple': tuple, 'set': set}[kind](values): data, other
+
+
+def measure(func, make, other, repeat, min_time):
+    timer = timeit.Timer(lambda: func(make(), other))
+    elapsed = timer.timeit(1)
+    number = max(1, int(min_time / elapsed)) if elapsed else 1000
+    return min(elapsed, *(t / number for t in timer.repeat(repeat, number)))
+
+
+def missing_cases():
+    return sorted(set(default_registry()) - {case.method for case in CASES})
+
+
+def run(sizes=DEFAULT_SIZES, kinds=ITERABLES, methods=None, repeat=3, min_time=0.01):
+    results = []
+    for case in CASES:
+        if methods and case.method not in methods:
+            continue
+        for kind in case.kinds:
+            if kind not in kinds:
+                continue
+            for size in sizes:
+                make, other = inputs(kind, size, case.prepare)
+                collection = measure(case.run, make, other, repeat, min_time)
+                baseline = measure(case.baseline, make, other, repeat, min_time)
+                results.append({
+                    'method': case.method,
+                    'kind': kind,
+                    'size': size,
+                    'collection': collection,
+                    'baseline': baseline,
+                    'ratio': collection / baseline,
+                })
+    return results
+
+
+def compare(results, previous, threshold):
+    ratios = {(r['method'], r['kind'], r['size']): r['ratio'] for r in previous}
+    regressions = []
+    for result in results:
+        ratio = ratios.get((result['method'], result['kind'], result['size']))
+        result['previous'] = ratio
+        result['regression'] = ratio is not None and result['ratio'] > ratio * threshold
+        if result['regression']:
+            regressions.append(result)
+    return regressions
+
+
+def report(results):
+    print('{:<20} {:<10} {:>9} {:>12} {:>12} {:>7} {:>9}'.format(
+        'method', 'kind', 'size', 'collection', 'baseline', 'ratio', 'previous'
+    ))
+    for r in results:
+        previous = '' if r.get('previous') is None else '{:.2f}'.format(r['previous'])
+        print('{:<20} {:<10} {:>9} {:>12.3e} {:>12.3e} {:>7.2f} {:>9}{}'.format(
+            r['method'], r['kind'], r['size'], r['collection'], r['baseline'], r['ratio'], previous,
+            ' REGRESSION' if r.get('regression') else ''
+        ))
+
+
+def main(sizes=DEFAULT_SIZES, kinds=ITERABLES, methods=None, repeat=3, min_time=0.01, output=None, baseline=None,
+         threshold=1.25):
+    missing = missing_cases()
+    if missing:
+        print('No benchmark for: {}'.format(', '.join(missing)), file=sys.stderr)
+    results = run(sizes, kinds, methods, repeat, min_time)
+    regressions = []
+    if baseline is not None:
+        with open(baseline) as f:
+            regressions = compare(results, json.load(f)['results'], threshold)
+    report(results)
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump({'python': platform.python_version(), 'results': results}, f, indent=2)
+    if regressions:
+        print('{} regressions against {}'.format(len(regressions), baseline), file=sys.stderr)
+        return 1
+    return 0
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_methods', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+    parser.add_argument('--kinds', nargs='+', choices=ITERABLES, default=ITERABLES)
+    parser.add_argument('--methods', nargs='+')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--min-time', type=float, default=0.01,
+                        help='The number of seconds each of the repeated timings runs for at least.')
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    parser.add_argument('--baseline', help='Compare the results with this JSON file written by --output.')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Flag cases whose ratio to hand written Python grew by more than this factor.')
+    return vars(parser.parse_args(argv))
+
+
+if __name__ == '__main__':
+    sys.exit(main(**parse_args(sys.argv[1:])))
@@ -0,0 +1,58 @@
+"""
+Throughput of the python and numpy backends for the vectorised methods.
+
+Run with::
+
+    python -m benchmarks.bench_numpy [size ...]
+
+e.g. ``python -m benchmarks.bench_numpy 1000000 10000000 100000000``. The sizes default to 1M and 10M elements.
+
+"""
+import operator
+import sys
+import time
+
+from iterable_collections import collect
+from iterable_collections.numpy_backend import Elementwise, np
+
+
+def materialise(collection):
+    return collection.iterable if isinstance(collection.iterable, np.ndarray) else collection.list()
+
+
+CASES = (
+    ('map', lambda c: materialise(c.map(Elementwise(lambda x: x * 2)))),
+    ('filter', lambda c: materialise(c.filter(Elementwise(lambda x: x % 3 == 0)))),
+    ('reduce', lambda c: c.reduce(operator.add)),
+    ('max', lambda c: c.max()),
+    ('min', lambda c: c.min()),
+    ('sorted', lambda c: materialise(c.sorted())),
+    ('unique', lambda c: materialise(c.unique())),
+    ('len', lambda c: c.len()),
+)
+
+
+def measure(data, backend, case):
+    collection = collect(data, backend=backend)
+    start = time.perf_counter()
+    case(collection)
+    return time.perf_counter() - start
+
+
+def main(*sizes):
+    if np is None:
+        print('NumPy is not installed.')
+        return
+    print('{:>12} {:<8} {:>16} {:>16} {:>9}'.format('size', 'method', 'python', 'numpy', 'speedup'))
+    for size in sizes or (1000000, 10000000):
+        array = np.random.randint(0, size, size)
+        data = array.tolist()
+        for label, case in CASES:
+            python, numpy = measure(data, 'python', case), measure(array, 'numpy', case)
+            print('{:>12,} {:<8} {:>12,.0f} el/s {:>12,.0f} el/s {:>8.1f}x'.format(
+                size, label, size / python, size / numpy, python / numpy
+            ))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
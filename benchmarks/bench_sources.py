@@ -0,0 +1,54 @@
+"""
+Time and peak memory of counting the matching lines of a log file, reading it into a list of lines as before and
+through a memory mapped file with collect_lines.
+
+Run with::
+
+    python -m benchmarks.bench_sources [lines]
+
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from iterable_collections import collect, collect_lines
+
+
+def read_lines(path):
+    with open(path, 'rb') as f:
+        return collect(f.readlines()).filter(lambda line: line.startswith(b'ERROR')).list_().len()
+
+
+def mapped_lines(path):
+    return collect_lines(path, 'ascii').filter(lambda line: line.startswith('ERROR')).list_().len()
+
+
+def measure(func, path):
+    start = time.perf_counter()
+    count = func(path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main(lines=1000000):
+    fd, path = tempfile.mkstemp()
+    with os.fdopen(fd, 'w') as f:
+        for i in range(lines):
+            f.write('{} request {} served in {}ms\n'.format('ERROR' if i % 100 == 0 else 'INFO', i, i % 250))
+    try:
+        print('{:<14} {:>10} {:>10} {:>16}'.format('source', 'matches', 'seconds', 'peak memory'))
+        for label, func in (('readlines', read_lines), ('collect_lines', mapped_lines)):
+            count, elapsed, peak = measure(func, path)
+            print('{:<14} {:>10} {:>10.3f} {:>13.1f} MB'.format(label, count, elapsed, peak / 1024 / 1024))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
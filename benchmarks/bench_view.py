@@ -0,0 +1,44 @@
+"""
+Time and peak memory of ``slice().chunks()`` over a large buffer, copying the buffer to a list as before and through
+a view.
+
+Run with::
+
+    python -m benchmarks.bench_view [megabytes]
+
+"""
+import sys
+import time
+import tracemalloc
+
+from iterable_collections import collect
+
+
+def copied(data):
+    return collect(list(data)).slice(1024).chunks(4096).len()
+
+
+def viewed(data):
+    return collect(data).view().slice(1024).chunks(4096, None).len()
+
+
+def measure(func, data):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(data)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(megabytes=16):
+    data = memoryview(bytearray(megabytes * 1024 * 1024))
+    print('{:<8} {:>12} {:>16}'.format('mode', 'seconds', 'peak memory'))
+    for label, func in (('copied', copied), ('viewed', viewed)):
+        elapsed, peak = measure(func, data)
+        print('{:<8} {:>12.4f} {:>13.1f} MB'.format(label, elapsed, peak / 1024 / 1024))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -1 +1,2 @@
-from iterable_collections.collection import Collection, collect
+from iterable_collections.collection import AsyncCollection, Collection, acollect, collect
+from iterable_collections.sources import collect_csv, collect_jsonl, collect_lines, collect_mmap, collect_records
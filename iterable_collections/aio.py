@@ -0,0 +1,92 @@
+import asyncio
+import inspect
+from collections import deque
+
+_missing = object()
+
+
+async def _apply(func, *args):
+    result = func(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def _from_iterable(iterable):
+    for item in iterable:
+        yield item
+
+
+def aiterate(iterable):
+    if hasattr(iterable, '__aiter__'):
+        return iterable
+    return _from_iterable(iterable)
+
+
+async def _window(iterable, func, concurrency):
+    pending = deque()
+    try:
+        async for item in aiterate(iterable):
+            pending.append((item, asyncio.ensure_future(_apply(func, item))))
+            if len(pending) >= concurrency:
+                item, task = pending.popleft()
+                yield item, await task
+        while pending:
+            item, task = pending.popleft()
+            yield item, await task
+    finally:
+        for item, task in pending:
+            task.cancel()
+
+
+async def _results(iterable, func, concurrency):
+    if concurrency:
+        async for item, result in _window(iterable, func, concurrency):
+            yield item, result
+        return
+    async for item in aiterate(iterable):
+        yield item, await _apply(func, item)
+
+
+async def achunks(iterable, length):
+    chunk = []
+    async for item in aiterate(iterable):
+        chunk.append(item)
+        if len(chunk) == length:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def afilter(iterable, func, concurrency=None):
+    async for item, result in _results(iterable, func, concurrency):
+        if result:
+            yield item
+
+
+async def afirst(iterable):
+    async for item in aiterate(iterable):
+        return item
+    raise IndexError('iterable is empty.')
+
+
+async def alist(iterable):
+    return [item async for item in aiterate(iterable)]
+
+
+async def amap(iterable, func, concurrency=None):
+    async for item, result in _results(iterable, func, concurrency):
+        yield result
+
+
+async def areduce(iterable, func, initializer=_missing):
+    iterator = aiterate(iterable).__aiter__()
+    if initializer is _missing:
+        try:
+            initializer = await iterator.__anext__()
+        except StopAsyncIteration:
+            raise TypeError('reduce() of empty iterable with no initial value') from None
+    async for item in iterator:
+        initializer = await _apply(func, initializer, item)
+    return initializer
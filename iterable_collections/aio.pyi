@@ -0,0 +1,93 @@
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, List, Optional, Union
+
+AnyIterable = Union[Iterable, AsyncIterable]
+
+
+def aiterate(iterable: AnyIterable) -> AsyncIterable:
+    """
+    Returns ``iterable`` if it is asynchronous. Otherwise returns an asynchronous generator yielding the elements of
+    ``iterable``.
+
+    Args:
+        iterable: An asynchronous or synchronous iterable.
+
+    """
+
+
+def achunks(iterable: AnyIterable, length: int) -> AsyncIterator[List]:
+    """
+    Yields lists of ``length`` consecutive elements of ``iterable``. The last list holds the remaining elements.
+
+    Args:
+        iterable: An asynchronous or synchronous iterable.
+        length: The number of elements in each chunk.
+
+    """
+
+
+def afilter(iterable: AnyIterable, func: Callable, concurrency: Optional[int] = None) -> AsyncIterator:
+    """
+    Yields the elements of ``iterable`` for which ``func`` returns a truthy value, in order. ``func`` may return an
+    awaitable, which is awaited. See :func:`amap` for ``concurrency``.
+
+    Args:
+        iterable: An asynchronous or synchronous iterable.
+        func: A function or coroutine function receiving each element.
+        concurrency: The maximum number of calls to ``func`` awaited at once.
+
+    """
+
+
+async def afirst(iterable: AnyIterable) -> Any:
+    """
+    Returns the first element of ``iterable``.
+
+    Args:
+        iterable: An asynchronous or synchronous iterable.
+
+    Raises:
+        IndexError: Raised if ``iterable`` is empty.
+
+    """
+
+
+async def alist(iterable: AnyIterable) -> List:
+    """
+    Returns a :obj:`list<python:list>` of every element of ``iterable``.
+
+    Args:
+        iterable: An asynchronous or synchronous iterable.
+
+    """
+
+
+def amap(iterable: AnyIterable, func: Callable, concurrency: Optional[int] = None) -> AsyncIterator:
+    """
+    Yields the result of ``func`` for each element of ``iterable``, in order. ``func`` may return an awaitable, which
+    is awaited. If ``concurrency`` is given, up to ``concurrency`` calls are scheduled as tasks ahead of the element
+    being yielded, so at most ``concurrency`` calls run at once and no more than ``concurrency`` elements are read
+    ahead. Tasks still pending when the generator is closed are cancelled.
+
+    Args:
+        iterable: An asynchronous or synchronous iterable.
+        func: A function or coroutine function receiving each element.
+        concurrency: The maximum number of calls to ``func`` awaited at once. Elements are awaited one at a time if
+            it isn't given.
+
+    """
+
+
+async def areduce(iterable: AnyIterable, func: Callable, initializer: Any = ...) -> Any:
+    """
+    Reduces ``iterable`` with ``func``, as :func:`functools.reduce` would. ``func`` may return an awaitable, which is
+    awaited.
+
+    Args:
+        iterable: An asynchronous or synchronous iterable.
+        func: A function or coroutine function receiving the accumulated value and the next element.
+        initializer: The initial accumulated value. The first element is used if it isn't given.
+
+    Raises:
+        TypeError: Raised if ``iterable`` is empty and ``initializer`` isn't given.
+
+    """
@@ -1,6 +1,12 @@
-from collections import Iterable
+import threading
+import weakref
+from collections.abc import Iterable
 
-from iterable_collections.factory import DefaultMethodStrategyFactory
+from iterable_collections.aio import aiterate
+from iterable_collections.factory import StrategyRegistry, default_registry, default_async_registry
+from iterable_collections.numpy_backend import as_array, default_numpy_registry, is_array
+from iterable_collections.plan import Plan, PlanOptimizer, returns_instance
+from iterable_collections.profiling import profiled_registry
 
 
 class Collection:
@@ -24,6 +30,9 @@ class Collection:
     def __repr__(self):
         return 'Collection({})'.format(self.iterable)
 
+    def lazy(self):
+        return LazyCollection(self)
+
     @property
     def iterable(self):
         return self._iterable
@@ -35,5 +44,139 @@ class Collection:
         self._iterable = iterable
 
 
-def collect(iterable):
-    return Collection(iterable, DefaultMethodStrategyFactory().create())
+class LazyCollection:
+
+    def __init__(self, collection, plan=None, optimizer=None):
+        self._collection = collection
+        self._plan = plan if plan is not None else Plan()
+        self._optimizer = optimizer if optimizer is not None else PlanOptimizer()
+
+    def __getattr__(self, item):
+        if item.startswith('_') or item not in self._collection._strategies:
+            raise AttributeError('Unknown attribute {}'.format(item))
+        strategy = self._collection._strategies[item]
+
+        def method(*args, **kwargs):
+            if returns_instance(strategy, kwargs.get('ret')):
+                self._plan.append(item, args, kwargs)
+                return self
+            result = getattr(self.execute(), item)(*args, **kwargs)
+            return self if result is self._collection else result
+
+        return method
+
+    def __iter__(self):
+        return iter(self.execute())
+
+    def __repr__(self):
+        return 'LazyCollection({}, {})'.format(self._collection, self._plan)
+
+    @property
+    def iterable(self):
+        return self.execute().iterable
+
+    @property
+    def plan(self):
+        return self._plan
+
+    @property
+    def statistics(self):
+        return self._optimizer.statistics
+
+    def execute(self):
+        plan = self._optimizer.optimize(self._plan, self._collection._strategies, self._collection.iterable)
+        plan.execute(self._collection)
+        self._plan.clear()
+        return self._collection
+
+
+class AsyncCollection(Collection):
+
+    def __aiter__(self):
+        return aiterate(self.iterable).__aiter__()
+
+    def __repr__(self):
+        return 'AsyncCollection({})'.format(self.iterable)
+
+    def lazy(self):
+        return LazyCollection(self, optimizer=PlanOptimizer(rules=()))
+
+
+def collection_type(strategies, base=Collection):
+    if not isinstance(strategies, StrategyRegistry):
+        strategies = StrategyRegistry(strategies)
+    return type(base.__name__, (base,), dict(strategies.methods))
+
+
+_default_collection_type = None
+_default_collection_type_lock = threading.Lock()
+
+
+def default_collection_type():
+    global _default_collection_type
+    if _default_collection_type is None:
+        with _default_collection_type_lock:
+            if _default_collection_type is None:
+                _default_collection_type = collection_type(default_registry())
+    return _default_collection_type
+
+
+_default_async_collection_type = None
+_default_async_collection_type_lock = threading.Lock()
+
+
+def default_async_collection_type():
+    global _default_async_collection_type
+    if _default_async_collection_type is None:
+        with _default_async_collection_type_lock:
+            if _default_async_collection_type is None:
+                _default_async_collection_type = collection_type(default_async_registry(), AsyncCollection)
+    return _default_async_collection_type
+
+
+def acollect(iterable):
+    return default_async_collection_type()(iterable, default_async_registry())
+
+
+_default_numpy_collection_type = None
+_default_numpy_collection_type_lock = threading.Lock()
+
+
+def default_numpy_collection_type():
+    global _default_numpy_collection_type
+    if _default_numpy_collection_type is None:
+        with _default_numpy_collection_type_lock:
+            if _default_numpy_collection_type is None:
+                _default_numpy_collection_type = collection_type(default_numpy_registry())
+    return _default_numpy_collection_type
+
+
+_profiled_collection_types = weakref.WeakValueDictionary()
+_profiled_collection_types_lock = threading.Lock()
+
+
+def profiled_collection_type(hook, strategies):
+    key = (id(hook), id(strategies))
+    with _profiled_collection_types_lock:
+        type_ = _profiled_collection_types.get(key)
+        if type_ is None:
+            registry = profiled_registry(strategies, hook)
+            type_ = collection_type(registry)
+            type_._profiled = (hook, strategies, registry)
+            _profiled_collection_types[key] = type_
+        return type_, type_._profiled[2]
+
+
+def collect(iterable, lazy=False, backend=None, profiler=None):
+    if backend is None:
+        backend = 'numpy' if is_array(iterable) else 'python'
+    if backend == 'numpy':
+        iterable, strategies, type_ = as_array(iterable), default_numpy_registry(), default_numpy_collection_type()
+    elif backend == 'python':
+        strategies, type_ = default_registry(), default_collection_type()
+    else:
+        raise ValueError('Unknown backend {}.'.format(backend))
+    if profiler is not None:
+        type_, strategies = profiled_collection_type(profiler, strategies)
+    collection = type_(iterable, strategies)
+    return collection.lazy() if lazy else collection
@@ -1,8 +1,12 @@
-from collections import OrderedDict
-from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, MappingView, Optional, Set, \
-    Sequence, Tuple, Union
-
-from iterable_collections.strategy import MethodStrategyInterface
+import os
+from collections import Counter, OrderedDict
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, Iterator, List, \
+    Mapping, MappingView, Optional, Set, Sequence, Tuple, Type, Union
+
+from iterable_collections.plan import Plan, PlanOptimizer
+from iterable_collections.reducers import ReducerInterface
+from iterable_collections.strategy import MethodStrategyInterface, ProfilingHookInterface, \
+    MaterialisationHookInterface
 from iterable_collections.utils import DictItem
 
 StrategyDict = Dict[str, MethodStrategyInterface]
@@ -22,9 +26,33 @@ class Collection:
         """
         self._iterable = None
 
+    def lazy(self) -> 'LazyCollection':
+        """
+        Returns a :obj:`LazyCollection` wrapping this object. Methods called on the :obj:`LazyCollection` which return
+        the collection are recorded and only executed once a method returning a result is called.
+
+        """
     @property
     def iterable(self):
         """:obj:`Iterable<typing.Iterable>`: The Iterable type object :obj:`Collection` wraps around."""
+    def aggregate(self, store: bool = None, ret: bool = None, **reducers: ReducerInterface) -> Dict[str, Any]:
+        """
+        Computes each of ``reducers`` over :attr:`iterable<Collection.iterable>` in a single pass and returns a
+        :obj:`python:dict` of their results, so an iterator is only consumed once. Usage::
+
+            collect(rows).aggregate(n=Count(), low=Min(key=score), high=Max(key=score), mean=Mean(key=score))
+
+        See :mod:`iterable_collections.reducers`. Equivalent to::
+
+            aggregate(iterable, **reducers)
+
+        Args:
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+            **reducers: :obj:`Reducers<iterable_collections.reducers.ReducerInterface>`, by the name of their result.
+                They can't be named ``store`` or ``ret``.
+
+        """
     def all(self, store: bool = None, ret: bool = None) -> bool:
         """
         A proxy to the :func:`python:all` builtin function with :attr:`iterable<Collection.iterable>` as the first
@@ -45,48 +73,132 @@ class Collection:
             ret: Return the result of the operation instead of `self`.
 
         """
-    def chunks(self, length: int, store: bool = None, ret: bool = None) -> 'Collection':
+    def array_(self, typecode: Optional[str] = None, store: bool = None, ret: bool = None) -> 'Collection':
+        """
+        Converts :attr:`iterable<Collection.iterable>` to an :obj:`array<array.array>`, which stores numbers
+        unboxed, in roughly a quarter to an eighth of the memory of a :obj:`python:list`. If ``typecode`` isn't
+        given, ints are stored with typecode ``'q'`` and the array becomes ``'d'`` once a float is reached.
+
+        While :attr:`iterable<Collection.iterable>` is an :obj:`array<array.array>`, :meth:`Collection.map`,
+        :meth:`Collection.filter`, :meth:`Collection.sorted`, :meth:`Collection.slice` and
+        :meth:`Collection.reversed` return arrays of the same typecode and :meth:`Collection.chunks` returns a list
+        of arrays. The typecode of the results of :meth:`Collection.map` is worked out from their values as with
+        :func:`compact<iterable_collections.utils.compact>`, and a :obj:`python:list` is returned if they aren't
+        ints or floats. Usage::
+
+            collect(readings).array_().filter(lambda x: x > 0).map(lambda x: x * 2).sorted()
+
+        Args:
+            typecode: The :mod:`array` typecode, e.g. ``'i'`` or ``'f'``.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        Raises:
+            TypeError: Raised if an element is not a number.
+
+        """
+    def bottom_k(self, n: int, key: Optional[Callable[[Any], Any]] = None, store: bool = None,
+                 ret: bool = None) -> 'Collection':
+        """
+        A proxy to :func:`heapq.nsmallest`, returning a :obj:`python:list` of the ``n`` smallest elements of
+        :attr:`iterable<Collection.iterable>` in ascending order. Only ``n`` elements are held at a time, so it runs in
+        O(N log n) time rather than sorting :attr:`iterable<Collection.iterable>` as
+        ``sorted(key=key).slice(0, n)`` would. Equivalent to::
+
+            nsmallest(n, iterable, key=key)
+
+        Args:
+            n: The number of elements to keep.
+            key: A function of one argument that is used to extract a comparison key from each element.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        """
+    def chunks(self, length: int, container: Optional[Callable[[Iterable], Iterable]] = list, store: bool = None,
+               ret: bool = None) -> 'Collection':
         """
-        Break the elements  of :attr:`iterable<Collection.iterable>` into a series of ``length`` long lists.
+        Break the elements  of :attr:`iterable<Collection.iterable>` into a series of ``length`` long lists. Passes
+        :attr:`iterable<Collection.iterable>` to :meth:`Collection.chunks_dict` if it is a
+        :obj:`Mapping<typing.Mapping>`, to :meth:`Collection.chunks_seq` if it is a :obj:`Sequence<typing.Sequence>`,
+        :obj:`Set<typing.Set>` or :obj:`MappingView<typing.MappingView>` and to :meth:`Collection.chunks_iter`
+        otherwise.
 
         Args:
             length: The number of elements each resulting list should contain.
+            container: Called with an iterable of the elements of each chunk, e.g. :class:`python:tuple`. If ``None``,
+                each chunk is a :obj:`SequenceView<iterable_collections.utils.SequenceView>` for sequences and a lazy
+                iterator over its elements otherwise.
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
+        Raises:
+            ValueError: Raised if ``length`` is less than 1.
+
         """
-    def chunks_dict(self, length: int, store: bool = None, ret: bool = None) -> 'Collection':
+    def chunks_dict(self, length: int, container: Optional[Callable[[Iterable], Iterable]] = list, store: bool = None,
+                    ret: bool = None) -> 'Collection':
         """
-        Break the elements  of :attr:`iterable<Collection.iterable>` into a series of ``length`` long lists. For use
-        when :attr:`iterable<Collection.iterable>` is a :class:`python:dict`.
+        Break the items of :attr:`iterable<Collection.iterable>` into a series of ``length`` long lists. For use
+        when :attr:`iterable<Collection.iterable>` is a :class:`python:dict`. The items are streamed as with
+        :meth:`Collection.chunks_iter` rather than copied to a list first.
 
         Args:
             length: The number of elements each resulting list should contain.
+            container: See :meth:`Collection.chunks_iter`.
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
+        Raises:
+            ValueError: Raised if ``length`` is less than 1.
+
         """
-    def chunks_iter(self, length: int, store: bool = None, ret: bool = None) -> 'Collection':
+    def chunks_iter(self, length: int, container: Optional[Callable[[Iterable], Iterable]] = list, store: bool = None,
+                    ret: bool = None) -> 'Collection':
         """
         Break the elements  of :attr:`iterable<Collection.iterable>` into a series of ``length`` long lists. For use
-        when :attr:`iterable<Collection.iterable>` is a :class:`python:typing.Sequence`.
+        when :attr:`iterable<Collection.iterable>` is an :class:`python:typing.Iterator`. The result is a generator
+        which reads ``length`` elements at a time, so only one chunk is held in memory. Equivalent to::
+
+            iterator = iter(iterable)
+            while True:
+                chunk = container(islice(iterator, length))
+                if not chunk:
+                    break
+                yield chunk
+
+        If ``container`` is ``None``, each chunk is a lazy iterator reading directly from
+        :attr:`iterable<Collection.iterable>`. The chunks must then be consumed in order; elements of a chunk which
+        were not read are skipped when the next chunk is requested.
 
         Args:
             length: The number of elements each resulting list should contain.
+            container: Called with an iterator of the elements of each chunk, e.g. :class:`python:tuple`.
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
+        Raises:
+            ValueError: Raised if ``length`` is less than 1.
+
         """
-    def chunks_seq(self, length: int, store: bool = None, ret: bool = None) -> 'Collection':
+    def chunks_seq(self, length: int, container: Optional[Callable[[Iterable], Iterable]] = list, store: bool = None,
+                   ret: bool = None) -> 'Collection':
         """
         Break the elements  of :attr:`iterable<Collection.iterable>` into a series of ``length`` long lists.For use
-        when :attr:`iterable<Collection.iterable>` is a :class:`python:typing.Sequence`.
+        when :attr:`iterable<Collection.iterable>` is a :class:`python:typing.Sequence`. An
+        :obj:`array<array.array>` or :obj:`SequenceView<iterable_collections.utils.SequenceView>` is sliced as it is,
+        so the chunks of a view are views as well and no element is copied.
 
         Args:
             length: The number of elements each resulting list should contain.
+            container: Called with a slice of each chunk, e.g. :class:`python:tuple`. If ``None``, each chunk is a
+                :obj:`SequenceView<iterable_collections.utils.SequenceView>` of
+                :attr:`iterable<Collection.iterable>`.
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
+        Raises:
+            ValueError: Raised if ``length`` is less than 1.
+
         """
     def concat(self, *other: Iterable, store: bool = None, ret: bool = None) -> 'Collection':
         """
@@ -423,12 +535,19 @@ class Collection:
                 `hashable type <https://docs.python.org/3/glossary.html>`_)
 
         """
-    def flatten(self, store: bool = None, ret: bool = None)-> 'Collection':
+    def flatten(self, depth: Optional[int] = None, atomic: Tuple[type, ...] = (), store: bool = None,
+                ret: bool = None)-> 'Collection':
         """
-        Converts :attr:`iterable<Collection.iterable>` from an arbitrarily nested sequence a one dimensional
-        :obj:`python:list`.
+        Converts :attr:`iterable<Collection.iterable>` from an arbitrarily nested sequence to a one dimensional
+        iterator. Nested sequences are expanded with an explicit stack rather than recursion, so the depth of nesting
+        is not bounded by the recursion limit, and elements are produced as they are reached. Usage::
+
+            collect([1, [2, [3, [4]]]]).flatten().list()  # [1, 2, 3, 4]
+            collect([1, [2, [3, [4]]]]).flatten(depth=1).list()  # [1, 2, [3, [4]]]
 
         Args:
+            depth: The number of levels of nesting to expand. Every level is expanded if it isn't given.
+            atomic: Sequence types which are kept whole rather than expanded, in addition to ``str`` and ``bytes``.
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
@@ -461,6 +580,44 @@ class Collection:
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
+        """
+    def group_by(self, key: Optional[Callable[[Any], Hashable]] = None,
+                 reducer: Union[str, Callable[[Any, Any], Any], ReducerInterface, None] = None, initializer: Any = ...,
+                 store: bool = None, ret: bool = None) -> 'Collection':
+        """
+        Groups the elements of :attr:`iterable<Collection.iterable>` by ``key`` in a single pass, without sorting,
+        into a :obj:`python:dict` ordered by the first occurrence of each key. By default each group is a
+        :obj:`python:list` of its elements. Unlike :meth:`Collection.groupby`, equal keys do not have to be adjacent
+        and the groups may be read any number of times. Equivalent to::
+
+            groups = {}
+            for x in iterable:
+                groups.setdefault(key(x), []).append(x)
+
+        If ``reducer`` is given, each group is instead folded as its elements arrive, as :func:`functools.reduce`
+        would, so the elements are not retained::
+
+            collect(rows).group_by(lambda r: r.team, lambda total, r: total + r.score, 0)
+
+        ``reducer`` may also be the name of a built-in reducer: ``'count'``, ``'sum'``, ``'min'`` or ``'max'``, or a
+        :obj:`ReducerInterface<iterable_collections.reducers.ReducerInterface>`, in which case each group is the
+        result of the reducer::
+
+            collect(rows).group_by(lambda r: r.team, Aggregate(n=Count(), mean=Mean(key=lambda r: r.score)))
+
+        Args:
+            key: A function of one argument returning the hashable key of each element. The elements themselves are
+                the keys if it isn't given.
+            reducer: A function of the accumulated value of a group and its next element, the name of a built-in
+                reducer or a :obj:`ReducerInterface<iterable_collections.reducers.ReducerInterface>`.
+            initializer: The initial accumulated value of each group. The first element of a group is used if it
+                isn't given.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        Raises:
+            ValueError: Raised if ``reducer`` is the name of an unknown reducer.
+
         """
     def groupby(self, key: Optional[Callable], store: bool = None, ret: bool = None)-> 'Collection':
         """
@@ -793,6 +950,80 @@ class Collection:
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
+        """
+    def nlargest_items(self, n: int, key: Optional[Callable[[Hashable, Any], Any]] = None, store: bool = None,
+                       ret: bool = None) -> 'Collection':
+        """
+        Calls :meth:`dict.items` before :func:`heapq.nlargest`, returning a :obj:`python:list` of the ``n`` largest
+        items of :attr:`iterable<Collection.iterable>`. Each item is spread into two parameters being passed to
+        ``key``::
+
+            lambda k, v: v
+
+        Equivalent to::
+
+            nlargest(n, dict(iterable).items(), key=lambda item: key(*item))
+
+        Args:
+            n: The number of items to keep.
+            key: A function of a key and a value that is used to extract a comparison key. Items are compared as
+                tuples if it isn't given.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        """
+    def nlargest_nt_items(self, n: int, key: Optional[Callable[[DictItem], Any]] = None, store: bool = None,
+                          ret: bool = None) -> 'Collection':
+        """
+        Calls :meth:`dict.items` on :attr:`iterable<Collection.iterable>` and converts the resultant
+        :obj:`ItemsView<typing.ItemsView>` to a list of :obj:`DictItems<utils.DictItem>` with
+        :func:`utils.make_nt_items` then calls :func:`heapq.nlargest`. Equivalent to::
+
+            nlargest(n, make_nt_items(dict(iterable).items()), key=key)
+
+        Args:
+            n: The number of items to keep.
+            key: A function of one :obj:`DictItem<utils.DictItem>` that is used to extract a comparison key.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        """
+    def nsmallest_items(self, n: int, key: Optional[Callable[[Hashable, Any], Any]] = None, store: bool = None,
+                        ret: bool = None) -> 'Collection':
+        """
+        Calls :meth:`dict.items` before :func:`heapq.nsmallest`, returning a :obj:`python:list` of the ``n`` smallest
+        items of :attr:`iterable<Collection.iterable>`. Each item is spread into two parameters being passed to
+        ``key``::
+
+            lambda k, v: v
+
+        Equivalent to::
+
+            nsmallest(n, dict(iterable).items(), key=lambda item: key(*item))
+
+        Args:
+            n: The number of items to keep.
+            key: A function of a key and a value that is used to extract a comparison key. Items are compared as
+                tuples if it isn't given.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        """
+    def nsmallest_nt_items(self, n: int, key: Optional[Callable[[DictItem], Any]] = None, store: bool = None,
+                           ret: bool = None) -> 'Collection':
+        """
+        Calls :meth:`dict.items` on :attr:`iterable<Collection.iterable>` and converts the resultant
+        :obj:`ItemsView<typing.ItemsView>` to a list of :obj:`DictItems<utils.DictItem>` with
+        :func:`utils.make_nt_items` then calls :func:`heapq.nsmallest`. Equivalent to::
+
+            nsmallest(n, make_nt_items(dict(iterable).items()), key=key)
+
+        Args:
+            n: The number of items to keep.
+            key: A function of one :obj:`DictItem<utils.DictItem>` that is used to extract a comparison key.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
         """
     def nt_items(self, store: bool = None, ret: bool = None)-> 'Collection':
         """
@@ -818,6 +1049,42 @@ class Collection:
             ret: Return the result of the operation instead of `self`.
             **kwargs: Additional keyword arguments that will be added to the resultant :obj:`python:dict`.
 
+        """
+    def pfilter(self, func: Callable[[Any], Any], workers: Optional[int] = None, chunksize: int = 1,
+                ordered: bool = True, store: bool = None, ret: bool = None) -> 'Collection':
+        """
+        A parallel :meth:`Collection.filter` which calls ``func`` in a :obj:`ProcessPoolExecutor
+        <concurrent.futures.ProcessPoolExecutor>`. ``func`` and the elements of
+        :attr:`iterable<Collection.iterable>` must be picklable. The result is a :obj:`python:list`.
+
+        Args:
+            func: A function of one argument whose result determines whether an element is kept.
+            workers: The maximum number of processes. Defaults to the number of processors.
+            chunksize: The number of elements sent to a process at a time.
+            ordered: Keep the elements in the order of :attr:`iterable<Collection.iterable>`. Otherwise, chunks are
+                added to the result as they complete.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        """
+    def pmap(self, func: Callable[[Any], Any], workers: Optional[int] = None, chunksize: int = 1,
+             ordered: bool = True, store: bool = None, ret: bool = None) -> 'Collection':
+        """
+        A parallel :meth:`Collection.map` which calls ``func`` in a :obj:`ProcessPoolExecutor
+        <concurrent.futures.ProcessPoolExecutor>`. ``func`` and the elements of
+        :attr:`iterable<Collection.iterable>` must be picklable. The result is a :obj:`python:list`. Equivalent to::
+
+            list(ProcessPoolExecutor(workers).map(func, iterable, chunksize=chunksize))
+
+        Args:
+            func: A function of one argument.
+            workers: The maximum number of processes. Defaults to the number of processors.
+            chunksize: The number of elements sent to a process at a time.
+            ordered: Keep the results in the order of :attr:`iterable<Collection.iterable>`. Otherwise, chunks are
+                added to the result as they complete.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
         """
     def pop(self, i: Optional[int], store: bool = None, ret: bool = None) -> Any:
         """
@@ -831,6 +1098,28 @@ class Collection:
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
+        """
+    def preduce(self, func: Callable[[Any, Any], Any], initializer: Optional[Any], workers: Optional[int] = None,
+                chunksize: Optional[int] = None, store: bool = None, ret: bool = None) -> Any:
+        """
+        A parallel :meth:`Collection.reduce` for associative functions. :attr:`iterable<Collection.iterable>` is
+        split into chunks which are reduced in a :obj:`ProcessPoolExecutor<concurrent.futures.ProcessPoolExecutor>`.
+        The partial results are then reduced in the same way, as a tree, until one value remains. The order of the
+        elements is kept, so ``func`` does not have to be commutative. ``func`` and the elements must be picklable.
+
+        Args:
+            func: An associative function of two arguments.
+            initializer: If present, it is placed before the elements of :attr:`iterable<Collection.iterable>` and
+                serves as a default when it is empty.
+            workers: The maximum number of processes. Defaults to the number of processors.
+            chunksize: The number of elements reduced by a process at a time, at least 2. Defaults to an even split
+                of the elements between ``workers``.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        Raises:
+            TypeError: Raised if :attr:`iterable<Collection.iterable>` is empty and ``initializer`` is not given.
+
         """
     def reduce(self, func: Callable[[Any, Any], Any], initializer: Optional[Any], store: bool = None,
                ret: bool = None) -> Any:
@@ -897,6 +1186,10 @@ class Collection:
 
             reversed(iterable)
 
+        :attr:`iterable<Collection.iterable>` is converted to a list first unless it is a :obj:`python:list`,
+        :obj:`array<array.array>` or :obj:`SequenceView<iterable_collections.utils.SequenceView>`, none of which are
+        copied.
+
         Args:
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
@@ -952,10 +1245,14 @@ class Collection:
 
             getitem(iterable, slice(start, stop, step=step))
 
+        :attr:`iterable<Collection.iterable>` is converted to a list first unless it is a :obj:`python:list`,
+        :obj:`array<array.array>` or :obj:`SequenceView<iterable_collections.utils.SequenceView>`. Slicing a view
+        returns a view in constant time, without copying any element.
+
         Args:
             start: The start position of the slice.
             stop: The stop position of the slice.
-            step: The stop for the slice.
+            step: The step of the slice.
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
@@ -974,6 +1271,116 @@ class Collection:
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
+        """
+    def tfilter(self, func: Callable[[Any], Any], workers: Optional[int] = None, max_pending: Optional[int] = None,
+                ordered: bool = True, timeout: Optional[float] = None, errors: Optional[List[BaseException]] = None,
+                store: bool = None, ret: bool = None) -> 'Collection':
+        """
+        A :meth:`Collection.filter` which calls ``func`` in a :obj:`ThreadPoolExecutor
+        <concurrent.futures.ThreadPoolExecutor>`, for I/O bound functions. The result is an iterator, and
+        elements are only submitted while it is consumed. Errors raised by ``func`` are passed to the method's
+        :obj:`ErrorHandlingStrategyInterface<iterable_collections.strategy.ErrorHandlingStrategyInterface>` in the
+        same way as :func:`safe_call<iterable_collections.utils.safe_call>`.
+
+        Args:
+            func: A function of one argument whose result determines whether an element is kept.
+            workers: The maximum number of threads. Defaults to the default of
+                :obj:`ThreadPoolExecutor<concurrent.futures.ThreadPoolExecutor>`.
+            max_pending: The maximum number of elements submitted but not yet yielded. Elements are only taken from
+                :attr:`iterable<Collection.iterable>` as earlier ones are yielded. Defaults to twice ``workers``.
+            ordered: Keep the order of :attr:`iterable<Collection.iterable>`. Otherwise, elements are yielded as
+                they complete.
+            timeout: The number of seconds an element may take from starting to run. An element which times out is
+                treated as having raised :obj:`TimeoutError<concurrent.futures.TimeoutError>`. While it is given,
+                elements are only submitted when a thread is free to run them, so time spent queued isn't counted.
+                A thread running an element which timed out isn't free until the element completes.
+            errors: A :obj:`python:list` to which errors are appended instead of being raised. The element that
+                failed is left out of the result.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        """
+    def tmap(self, func: Callable[[Any], Any], workers: Optional[int] = None, max_pending: Optional[int] = None,
+             ordered: bool = True, timeout: Optional[float] = None, errors: Optional[List[BaseException]] = None,
+             store: bool = None, ret: bool = None) -> 'Collection':
+        """
+        A :meth:`Collection.map` which calls ``func`` in a :obj:`ThreadPoolExecutor
+        <concurrent.futures.ThreadPoolExecutor>`, for I/O bound functions. The result is an iterator, and
+        elements are only submitted while it is consumed. Errors raised by ``func`` are passed to the method's
+        :obj:`ErrorHandlingStrategyInterface<iterable_collections.strategy.ErrorHandlingStrategyInterface>` in the
+        same way as :func:`safe_call<iterable_collections.utils.safe_call>`. Usage::
+
+            errors = []
+            collect(paths).tmap(read_file, workers=8, timeout=5, errors=errors).list()
+
+        Args:
+            func: A function of one argument.
+            workers: The maximum number of threads. Defaults to the default of
+                :obj:`ThreadPoolExecutor<concurrent.futures.ThreadPoolExecutor>`.
+            max_pending: The maximum number of elements submitted but not yet yielded. Elements are only taken from
+                :attr:`iterable<Collection.iterable>` as earlier ones are yielded. Defaults to twice ``workers``.
+            ordered: Keep the order of :attr:`iterable<Collection.iterable>`. Otherwise, elements are yielded as
+                they complete.
+            timeout: The number of seconds an element may take from starting to run. An element which times out is
+                treated as having raised :obj:`TimeoutError<concurrent.futures.TimeoutError>`. While it is given,
+                elements are only submitted when a thread is free to run them, so time spent queued isn't counted.
+                A thread running an element which timed out isn't free until the element completes.
+            errors: A :obj:`python:list` to which errors are appended instead of being raised. The element that
+                failed is left out of the result.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        """
+    def to_csv(self, path: Union[str, bytes, os.PathLike], header: Union[bool, Sequence[str]] = True,
+               encoding: str = 'utf-8', batch_size: int = 1024, store: bool = None, ret: bool = None,
+               **fmtparams: Any) -> int:
+        """
+        Writes the rows of :attr:`iterable<Collection.iterable>` to a CSV file and returns the number of rows written.
+        The rows are streamed in batches, so :attr:`iterable<Collection.iterable>` is never copied to a list. See
+        :func:`write_csv<iterable_collections.sinks.write_csv>`.
+
+        Args:
+            path: The path of the file, which is overwritten.
+            header: ``True`` to write a header row of the field names of the rows, if they have any, ``False`` to
+                write none, or the names of the fields.
+            encoding: The encoding of the file.
+            batch_size: The number of rows written at once.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+            **fmtparams: Passed to :func:`csv.writer`, e.g. ``delimiter``.
+
+        """
+    def to_jsonl(self, path: Union[str, bytes, os.PathLike], encoding: str = 'utf-8', batch_size: int = 1024,
+                 store: bool = None, ret: bool = None, **kwargs: Any) -> int:
+        """
+        Writes each element of :attr:`iterable<Collection.iterable>` to a line of a JSON Lines file and returns the
+        number of lines written. See :func:`write_jsonl<iterable_collections.sinks.write_jsonl>`.
+
+        Args:
+            path: The path of the file, which is overwritten.
+            encoding: The encoding of the file.
+            batch_size: The number of elements written at once.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+            **kwargs: Passed to :obj:`json.JSONEncoder`, e.g. ``sort_keys``.
+
+        """
+    def top_k(self, n: int, key: Optional[Callable[[Any], Any]] = None, store: bool = None,
+              ret: bool = None) -> 'Collection':
+        """
+        A proxy to :func:`heapq.nlargest`, returning a :obj:`python:list` of the ``n`` largest elements of
+        :attr:`iterable<Collection.iterable>` in descending order. Only ``n`` elements are held at a time, so it runs in
+        O(N log n) time rather than sorting :attr:`iterable<Collection.iterable>` as
+        ``sorted(key=key, reverse=True).slice(0, n)`` would. Equivalent to::
+
+            nlargest(n, iterable, key=key)
+
+        Args:
+            n: The number of elements to keep.
+            key: A function of one argument that is used to extract a comparison key from each element.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
         """
     def tuple(self, store: bool = None, ret: bool = None) -> Tuple:
         """
@@ -1000,11 +1407,57 @@ class Collection:
             ret: Return the result of the operation instead of `self`.
 
         """
-    def unique(self, store: bool = None, ret: bool = None)-> 'Collection':
+    def unique(self, key: Optional[Callable[[Any], Hashable]] = None, window: Optional[int] = None,
+               capacity: Optional[int] = None, error_rate: float = 0.01, store: bool = None,
+               ret: bool = None)-> 'Collection':
+        """
+        Lazily yields the first occurrence of each element of :attr:`iterable<Collection.iterable>`, in order.
+        Equivalent to::
+
+            seen = set()
+            for x in iterable:
+                if key(x) not in seen:
+                    seen.add(key(x))
+                    yield x
+
+        By default every key seen is remembered. For unbounded streams, ``window`` or ``capacity`` bound the memory
+        used: ``window`` remembers only the ``window`` most recently seen keys, so a repeat is dropped only if its key
+        was seen recently. ``capacity`` remembers keys in a
+        :obj:`BloomFilter<iterable_collections.utils.BloomFilter>` of a fixed size, so every repeat is dropped but a
+        small fraction of distinct elements, about ``error_rate`` once ``capacity`` keys were seen, are dropped as
+        well.
+
+        Args:
+            key: A function returning a hashable key for each element, e.g. :class:`python:tuple` for lists. The
+                elements themselves are the keys if it isn't given.
+            window: The number of most recently seen keys to remember.
+            capacity: The expected number of distinct keys.
+            error_rate: The false positive rate of the Bloom filter once ``capacity`` keys were added to it.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        Raises:
+            ValueError: Raised if both ``window`` and ``capacity`` are given, if ``window`` is less than 1 or if
+                ``capacity`` or ``error_rate`` are invalid.
+
+        """
+    def view(self, start: Optional[int] = None, stop: Optional[int] = None, step: Optional[int] = None,
+             store: bool = None, ret: bool = None)-> 'Collection':
         """
-        An alias for :meth:`Collection.set`
+        Replaces :attr:`iterable<Collection.iterable>` with a
+        :obj:`SequenceView<iterable_collections.utils.SequenceView>` of its elements from ``start`` to ``stop``. The
+        view is created in constant time and reads from the original sequence, so a :obj:`python:list`,
+        :obj:`python:bytes`, :obj:`array<array.array>` or :obj:`python:memoryview` isn't copied by it, nor by
+        :meth:`Collection.slice` or :meth:`Collection.chunks` afterwards::
+
+            collect(buffer).view().slice(1024).chunks(4096, None)
+
+        An iterable which isn't a :obj:`Sequence<typing.Sequence>` is converted to a list first.
 
         Args:
+            start: The start position of the view.
+            stop: The stop position of the view.
+            step: The step of the view.
             store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
             ret: Return the result of the operation instead of `self`.
 
@@ -1022,11 +1475,249 @@ class Collection:
 
         """
 
-def collect(iterable: Iterable) -> Collection:
+class LazyCollection:
+    """
+    Records method calls on a :obj:`Collection` as a :obj:`Plan<iterable_collections.plan.Plan>` instead of executing
+    them. A method is recorded when it would return the collection itself (e.g. :meth:`Collection.map` or
+    :meth:`Collection.list_`), as decided by
+    :func:`returns_instance<iterable_collections.plan.returns_instance>`. Any other method (e.g.
+    :meth:`Collection.list`, :meth:`Collection.len` or :meth:`Collection.reduce`) executes the plan against the wrapped
+    :obj:`Collection` first and then returns its result. Iterating over a :obj:`LazyCollection` or reading
+    :attr:`iterable<LazyCollection.iterable>` also executes the plan. Usage::
+
+        c = collect(range(10), lazy=True).map(lambda x: x * 2).filter(lambda x: x > 4)
+        c.plan  # Plan(['map', 'filter'])
+        c.list()  # [6, 8, 10, 12, 14, 16, 18]
+
+    """
+    def __init__(self, collection: Collection, plan: Optional[Plan] = None,
+                 optimizer: Optional[PlanOptimizer] = None) -> None:
+        """
+        Args:
+            collection: The :obj:`Collection` the plan is executed against.
+            plan: An initial :obj:`Plan<iterable_collections.plan.Plan>`.
+            optimizer: Rewrites the plan before it is executed. Defaults to a
+                :obj:`PlanOptimizer<iterable_collections.plan.PlanOptimizer>` with its default rules.
+        """
+
+    @property
+    def iterable(self) -> Iterable:
+        """
+        :obj:`Iterable<typing.Iterable>`: Executes the plan and returns the iterable of the wrapped :obj:`Collection`.
+        """
+
+    @property
+    def plan(self) -> Plan:
+        """:obj:`Plan<iterable_collections.plan.Plan>`: The steps recorded since the plan was last executed."""
+
+    @property
+    def statistics(self) -> Counter:
+        """
+        :obj:`Counter<collections.Counter>`: The number of rewrites made by the optimizer, such as
+        ``conversions_elided`` and ``stages_merged``, over every execution of the plan.
+        """
+
+    def execute(self) -> Collection:
+        """
+        Optimize the recorded steps, perform them on the wrapped :obj:`Collection`, clear the plan and return the
+        :obj:`Collection`.
+
+        """
+
+
+class AsyncCollection(Collection):
+    """
+    A :obj:`Collection` around an asynchronous iterable, consumed with ``async for``. Synchronous iterables are
+    accepted too and are adapted with :func:`aiterate<iterable_collections.aio.aiterate>`. Its methods are defined by
+    :obj:`AsyncMethodStrategyFactory<iterable_collections.factory.AsyncMethodStrategyFactory>` and mirror their
+    :obj:`Collection` counterparts, except that functions passed to them may be coroutine functions. Methods which
+    return a result return an awaitable. Usage::
+
+        async def fetch(url):
+            ...
+
+        pages = await acollect(urls).map(fetch, concurrency=10).filter(None).list()
+
+    """
+    def __aiter__(self) -> AsyncIterator:
+        ...
+
+    def lazy(self) -> LazyCollection:
+        """
+        Returns a :obj:`LazyCollection` wrapping this object, as :meth:`Collection.lazy` does. Its plan is executed
+        as it is recorded, without optimization, since merging ``map`` steps would compose coroutine functions.
+        Methods returning a result return an awaitable, as they do on :obj:`AsyncCollection`::
+
+            await acollect(urls).lazy().map(fetch).filter(None).list()
+
+        """
+
+    def chunks(self, length: int, store: bool = None, ret: bool = None) -> 'AsyncCollection':
+        """
+        Split :attr:`iterable<Collection.iterable>` into lists of ``length`` elements as it is consumed. The last list
+        holds the remaining elements.
+
+        Args:
+            length: The number of elements in each chunk.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        """
+
+    def filter(self, func: Optional[Callable], concurrency: Optional[int] = None, store: bool = None,
+               ret: bool = None) -> 'AsyncCollection':
+        """
+        Keep the elements of :attr:`iterable<Collection.iterable>` for which ``func`` returns a truthy value. See
+        :func:`afilter<iterable_collections.aio.afilter>`.
+
+        Args:
+            func: A function or coroutine function receiving each element.
+            concurrency: The maximum number of calls to ``func`` awaited at once. Elements are awaited one at a
+                time if it isn't given.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        """
+
+    def first(self, store: bool = None, ret: bool = None) -> Awaitable:
+        """
+        Returns an awaitable of the first element of :attr:`iterable<Collection.iterable>`.
+
+        Raises:
+            IndexError: Raised when the awaitable is awaited if :attr:`iterable<Collection.iterable>` is empty.
+
+        """
+
+    def list(self, store: bool = None, ret: bool = None) -> Awaitable[List]:
+        """
+        Returns an awaitable of a :obj:`list<python:list>` of every element of :attr:`iterable<Collection.iterable>`.
+
+        """
+
+    def map(self, func: Callable, concurrency: Optional[int] = None, store: bool = None,
+            ret: bool = None) -> 'AsyncCollection':
+        """
+        Call ``func`` on each element of :attr:`iterable<Collection.iterable>`. See
+        :func:`amap<iterable_collections.aio.amap>`.
+
+        Args:
+            func: A function or coroutine function receiving each element.
+            concurrency: The maximum number of calls to ``func`` awaited at once. Elements are awaited one at a
+                time if it isn't given.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+
+        """
+
+    def reduce(self, func: Callable, initializer: Any = None, store: bool = None, ret: bool = None) -> Awaitable:
+        """
+        Returns an awaitable of :attr:`iterable<Collection.iterable>` reduced with ``func``, as
+        :func:`functools.reduce` would. ``func`` may be a coroutine function.
+
+        Args:
+            func: A function or coroutine function receiving the accumulated value and the next element.
+            initializer: The initial accumulated value. The first element is used if it isn't given.
+
+        """
+
+
+def collection_type(strategies: StrategyDict, base: Type[Collection] = Collection) -> Type[Collection]:
+    """
+    Returns a subclass of ``base`` with the compiled method of each strategy in ``strategies`` set as a class
+    attribute. Methods are then found through normal attribute lookup on the type rather than through
+    :meth:`Collection.__getattr__`. ``strategies`` is copied to a
+    :obj:`StrategyRegistry<iterable_collections.factory.StrategyRegistry>` if it is not one already.
+
+    Args:
+        strategies: A :obj:`StrategyDict`, typically a
+            :obj:`StrategyRegistry<iterable_collections.factory.StrategyRegistry>`.
+        base: The class to subclass, e.g. :obj:`AsyncCollection`.
+
+    """
+
+def default_collection_type() -> Type[Collection]:
     """
-    Returns a :obj:`Collection` object containing ``iterable``. Uses
-    :obj:`DefaultMethodStrategyFactory<iterable_collections.factory.DefaultMethodStrategyFactory>`.
+    Returns the :func:`collection_type` built from
+    :func:`default_registry<iterable_collections.factory.default_registry>`. It is created once, on the first call.
+
+    """
+
+def default_async_collection_type() -> Type[AsyncCollection]:
+    """
+    Returns the :func:`collection_type` built from
+    :func:`default_async_registry<iterable_collections.factory.default_async_registry>` with :obj:`AsyncCollection`
+    as its base. It is created once, on the first call.
+
+    """
+
+def acollect(iterable: Union[Iterable, AsyncIterable]) -> AsyncCollection:
+    """
+    Returns an :obj:`AsyncCollection` object of :func:`default_async_collection_type` containing ``iterable``.
+
+    Args:
+        iterable: The asynchronous or synchronous iterable :obj:`AsyncCollection` wraps around.
+    """
+
+def default_numpy_collection_type() -> Type[Collection]:
+    """
+    Returns the :func:`collection_type` built from
+    :func:`default_numpy_registry<iterable_collections.numpy_backend.default_numpy_registry>`. It is created once, on
+    the first call.
+
+    """
+
+def profiled_collection_type(hook: Union[ProfilingHookInterface, MaterialisationHookInterface],
+                             strategies: StrategyDict) -> Tuple[Type[Collection], StrategyDict]:
+    """
+    Returns the :func:`collection_type` built from
+    :func:`profiled_registry<iterable_collections.profiling.profiled_registry>` of ``strategies`` and ``hook``, along
+    with that registry. Both are created once for each ``hook`` and ``strategies`` and reused while the type is
+    alive. The cache only holds the type weakly, and the type holds ``hook`` and ``strategies``, so a cached type is
+    never returned for another hook or registry which has reused their ids, and hooks are released with the type.
+
+    Args:
+        hook: The hook receiving the timings of each method or the materialisations made by them.
+        strategies: The registry to profile, e.g.
+            :func:`default_registry<iterable_collections.factory.default_registry>`.
+
+    """
+
+def collect(iterable: Iterable, lazy: bool = False, backend: Optional[str] = None,
+            profiler: Optional[Union[ProfilingHookInterface, MaterialisationHookInterface]] = None
+            ) -> Union[Collection, LazyCollection]:
+    """
+    Returns a :obj:`Collection` object of :func:`default_collection_type` containing ``iterable``. Uses the shared
+    registry returned by
+    :func:`default_registry<iterable_collections.factory.default_registry>`, which is built from
+    :obj:`DefaultMethodStrategyFactory<iterable_collections.factory.DefaultMethodStrategyFactory>` only once.
+
+    With the ``'numpy'`` backend, ``iterable`` is converted to an :obj:`ndarray<numpy.ndarray>` and the
+    :obj:`Collection` is of :func:`default_numpy_collection_type` instead. Its ``filter``, ``map``, ``max``, ``min``,
+    ``reduce``, ``sorted`` and ``unique`` methods operate on the whole array at once where they can, and otherwise
+    fall back to the Python strategies. ``map`` and ``filter`` only pass the whole array to
+    :obj:`ufuncs<numpy.ufunc>` and to functions wrapped in
+    :obj:`Elementwise<iterable_collections.numpy_backend.Elementwise>`, and call any other function once per
+    element. See :obj:`VectorisedMethodStrategy<iterable_collections.numpy_backend.VectorisedMethodStrategy>`::
+
+        collect(array).map(Elementwise(lambda x: x * 2)).filter(np.isfinite)
 
     Args:
         iterable: The Iterable type object :obj:`Collection` wraps around.
-    """
\ No newline at end of file
+        lazy: Return a :obj:`LazyCollection` by calling :meth:`Collection.lazy`.
+        backend: ``'python'`` or ``'numpy'``. Defaults to ``'numpy'`` if ``iterable`` is an
+            :obj:`ndarray<numpy.ndarray>` and ``'python'`` otherwise.
+        profiler: A hook, usually a :obj:`Profiler<iterable_collections.profiling.Profiler>`, receiving the timings
+            of every method called on the collection, including conversions made by its methods. The collection is
+            then of :func:`profiled_collection_type`. Without it, methods aren't timed at all::
+
+                profiler = Profiler()
+                collect(data, profiler=profiler).filter(f).sorted().slice(0, 10)
+                print(profiler.report())
+
+            A :obj:`MaterialisationTracker<iterable_collections.profiling.MaterialisationTracker>` instead records
+            every conversion of the iterable made before a method runs.
+
+    Raises:
+        ValueError: Raised if ``backend`` is unknown.
+        ImportError: Raised if ``backend`` is ``'numpy'`` and NumPy is not installed.
+    """
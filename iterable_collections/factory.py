@@ -1,16 +1,23 @@
 import collections
 import operator
+import threading
 from abc import ABC, abstractmethod
 
 import builtins
 
-from collections import Iterator
+from array import array
+
+from collections.abc import Iterator, Mapping, Sequence
 
 import itertools
 
 import functools
 
-from iterable_collections import utils
+import heapq
+
+from types import MappingProxyType
+
+from iterable_collections import aio, reducers, sinks, utils
 from iterable_collections.strategy import MethodStrategy, StoreResultStrategy, ReturnInstanceStrategy, \
     PartialAtPositionIterableBindingStrategy, UnformattedArgumentFormattingStrategy, PreProcessingStrategy, \
     BaseExceptionErrorHandlingStrategy, StoreIterableStrategy, ReturnResultStrategy, PartialIterableBindingStrategy, \
@@ -19,7 +26,9 @@ from iterable_collections.strategy import MethodStrategy, StoreResultStrategy, R
     ConvertToDictArgumentFormattingStrategy, ConvertToIterArgumentFormattingStrategy, \
     ConvertToListArgumentFormattingStrategy, SpreadTupleParameterArgumentFormattingStrategy, \
     RightPartialIterableBindingStrategy, GetItemErrorHandlingStrategy, FlattenMethodStrategy, IntersectMethodStrategy, \
-    SetItemErrorHandlingStrategy, SortedAndGroupbyMethodStrategy, PartialInstanceBindingStrategy, ChunksMethodStrategy
+    SetItemErrorHandlingStrategy, SortedAndGroupbyMethodStrategy, PartialInstanceBindingStrategy, \
+    ChunksMethodStrategy, ParallelMethodStrategy, ThreadedMethodStrategy, AsyncMethodStrategy, UniqueMethodStrategy, \
+    SpreadTupleKeywordArgumentFormattingStrategy, GroupByMethodStrategy
 
 
 class MethodStrategyFactoryInterface(ABC):
@@ -32,12 +41,51 @@ class MethodStrategyFactoryInterface(ABC):
         raise NotImplementedError
 
 
+class StrategyRegistry(Mapping):
+    def __init__(self, strategies):
+        self._strategies = MappingProxyType(dict(strategies))
+        self._methods = MappingProxyType({name: s.compile() for name, s in self._strategies.items()})
+
+    def __contains__(self, item):
+        return item in self._strategies
+
+    def __getitem__(self, item):
+        return self._strategies[item]
+
+    def __iter__(self):
+        return iter(self._strategies)
+
+    def __len__(self):
+        return len(self._strategies)
+
+    def __repr__(self):
+        return 'StrategyRegistry({})'.format(sorted(self._strategies))
+
+    @property
+    def methods(self):
+        return self._methods
+
+    @classmethod
+    def from_factory(cls, factory):
+        return cls(factory.create())
+
+
 class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
     def create(self):
         return {s.name: s for s in self.get_strategies()}
 
     def get_strategies(self):
         return (
+            MethodStrategy(
+                'aggregate',
+                reducers.aggregate,
+                StoreIterableStrategy(),
+                ReturnResultStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
             MethodStrategy(
                 'all',
                 builtins.all,
@@ -58,6 +106,26 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 PreProcessingStrategy(),
                 BaseExceptionErrorHandlingStrategy()
             ),
+            MethodStrategy(
+                'array_',
+                utils.make_array,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            MethodStrategy(
+                'bottom_k',
+                heapq.nsmallest,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialAtPositionIterableBindingStrategy(position=1),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
             ChunksMethodStrategy(
                 'chunks',
                 StoreResultStrategy(),
@@ -75,7 +143,6 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 UnformattedArgumentFormattingStrategy(),
                 PreProcessingStrategy((
                     {'name': 'items', 'args': (), 'kwargs': {}},
-                    {'name': 'list_', 'args': (), 'kwargs': {}}
                 )),
                 BaseExceptionErrorHandlingStrategy()
             ),
@@ -85,9 +152,7 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 ReturnInstanceStrategy(),
                 PartialIterableBindingStrategy(),
                 UnformattedArgumentFormattingStrategy(),
-                PreProcessingStrategy((
-                    {'name': 'list_', 'args': (), 'kwargs': {}},
-                )),
+                PreProcessingStrategy(),
                 BaseExceptionErrorHandlingStrategy()
             ),
             ChunksMethodStrategy(
@@ -97,7 +162,7 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 PartialIterableBindingStrategy(),
                 UnformattedArgumentFormattingStrategy(),
                 PreProcessingStrategy((
-                    {'name': 'list_', 'args': (), 'kwargs': {}},
+                    {'name': 'list_', 'args': (), 'kwargs': {}, 'unless': (array, utils.SequenceView)},
                 )),
                 BaseExceptionErrorHandlingStrategy()
             ),
@@ -259,7 +324,7 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
             ),
             MethodStrategy(
                 'filter',
-                builtins.filter,
+                utils.preserve_array(builtins.filter, position=-1),
                 StoreResultStrategy(),
                 ReturnInstanceStrategy(),
                 RightPartialIterableBindingStrategy(),
@@ -332,9 +397,7 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 ReturnInstanceStrategy(),
                 PartialIterableBindingStrategy(),
                 UnformattedArgumentFormattingStrategy(),
-                PreProcessingStrategy((
-                    {'name': 'list', 'args': (), 'kwargs': {'store': True}},
-                )),
+                PreProcessingStrategy(),
                 BaseExceptionErrorHandlingStrategy()
             ),
             MethodStrategy(
@@ -347,6 +410,15 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 PreProcessingStrategy(),
                 GetItemErrorHandlingStrategy()
             ),
+            GroupByMethodStrategy(
+                'group_by',
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
             MethodStrategy(
                 'groupby',
                 itertools.groupby,
@@ -526,7 +598,7 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
             ),
             MethodStrategy(
                 'map',
-                builtins.map,
+                utils.preserve_array(builtins.map, position=1, infer=True),
                 StoreResultStrategy(),
                 ReturnInstanceStrategy(),
                 PartialAtPositionIterableBindingStrategy(position=1),
@@ -590,6 +662,54 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 )),
                 BaseExceptionErrorHandlingStrategy()
             ),
+            MethodStrategy(
+                'nlargest_items',
+                heapq.nlargest,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialAtPositionIterableBindingStrategy(position=1),
+                SpreadTupleKeywordArgumentFormattingStrategy('key', position=1),
+                PreProcessingStrategy((
+                    {'name': 'items', 'args': (), 'kwargs': {}},
+                )),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            MethodStrategy(
+                'nlargest_nt_items',
+                heapq.nlargest,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialAtPositionIterableBindingStrategy(position=1),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy((
+                    {'name': 'nt_items', 'args': (), 'kwargs': {}},
+                )),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            MethodStrategy(
+                'nsmallest_items',
+                heapq.nsmallest,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialAtPositionIterableBindingStrategy(position=1),
+                SpreadTupleKeywordArgumentFormattingStrategy('key', position=1),
+                PreProcessingStrategy((
+                    {'name': 'items', 'args': (), 'kwargs': {}},
+                )),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            MethodStrategy(
+                'nsmallest_nt_items',
+                heapq.nsmallest,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialAtPositionIterableBindingStrategy(position=1),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy((
+                    {'name': 'nt_items', 'args': (), 'kwargs': {}},
+                )),
+                BaseExceptionErrorHandlingStrategy()
+            ),
             MethodStrategy(
                 'nt_items',
                 utils.make_nt_items,
@@ -622,6 +742,24 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 PreProcessingStrategy(),
                 ConvertToDictErrorHandlingStrategy()
             ),
+            ParallelMethodStrategy(
+                'pfilter',
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            ParallelMethodStrategy(
+                'pmap',
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
             MethodStrategy(
                 'pop',
                 list.pop,
@@ -634,6 +772,15 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 )),
                 BaseExceptionErrorHandlingStrategy()
             ),
+            ParallelMethodStrategy(
+                'preduce',
+                StoreIterableStrategy(),
+                ReturnResultStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
             MethodStrategy(
                 'reduce',
                 functools.reduce,
@@ -670,13 +817,18 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
             ),
             MethodStrategy(
                 'reversed',
-                builtins.reversed,
+                utils.preserve_array(builtins.reversed),
                 StoreResultStrategy(),
                 ReturnInstanceStrategy(),
                 PartialIterableBindingStrategy(),
                 UnformattedArgumentFormattingStrategy(),
                 PreProcessingStrategy((
-                    {'name': 'list', 'args': (), 'kwargs': {'store': True}},
+                    {
+                        'name': 'list',
+                        'args': (),
+                        'kwargs': {'store': True},
+                        'unless': (array, list, utils.SequenceView)
+                    },
                 )),
                 BaseExceptionErrorHandlingStrategy()
             ),
@@ -712,19 +864,24 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
             ),
             MethodStrategy(
                 'slice',
-                lambda d, x, y=None: operator.getitem(d, slice(x, y)),
+                lambda d, x, y=None, z=None: operator.getitem(d, slice(x, y, z)),
                 StoreResultStrategy(),
                 ReturnInstanceStrategy(),
                 PartialIterableBindingStrategy(),
                 UnformattedArgumentFormattingStrategy(),
                 PreProcessingStrategy((
-                    {'name': 'list', 'args': (), 'kwargs': {'store': True}},
+                    {
+                        'name': 'list',
+                        'args': (),
+                        'kwargs': {'store': True},
+                        'unless': (array, list, utils.SequenceView)
+                    },
                 )),
                 BaseExceptionErrorHandlingStrategy()
             ),
             MethodStrategy(
                 'sorted',
-                builtins.sorted,
+                utils.preserve_array(builtins.sorted),
                 StoreResultStrategy(),
                 ReturnInstanceStrategy(),
                 PartialIterableBindingStrategy(),
@@ -741,6 +898,54 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 PreProcessingStrategy(),
                 BaseExceptionErrorHandlingStrategy()
             ),
+            ThreadedMethodStrategy(
+                'tfilter',
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            ThreadedMethodStrategy(
+                'tmap',
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            MethodStrategy(
+                'to_csv',
+                sinks.write_csv,
+                StoreIterableStrategy(),
+                ReturnResultStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            MethodStrategy(
+                'to_jsonl',
+                sinks.write_jsonl,
+                StoreIterableStrategy(),
+                ReturnResultStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            MethodStrategy(
+                'top_k',
+                heapq.nlargest,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialAtPositionIterableBindingStrategy(position=1),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
             MethodStrategy(
                 'tuple',
                 builtins.tuple,
@@ -761,9 +966,8 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 PreProcessingStrategy(),
                 BaseExceptionErrorHandlingStrategy()
             ),
-            MethodStrategy(
+            UniqueMethodStrategy(
                 'unique',
-                builtins.set,
                 StoreResultStrategy(),
                 ReturnInstanceStrategy(),
                 PartialIterableBindingStrategy(),
@@ -771,6 +975,18 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 PreProcessingStrategy(),
                 BaseExceptionErrorHandlingStrategy()
             ),
+            MethodStrategy(
+                'view',
+                utils.SequenceView,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy((
+                    {'name': 'list', 'args': (), 'kwargs': {'store': True}, 'unless': (Sequence,)},
+                )),
+                BaseExceptionErrorHandlingStrategy()
+            ),
             MethodStrategy(
                 'zip',
                 builtins.zip,
@@ -781,4 +997,99 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
                 PreProcessingStrategy(),
                 BaseExceptionErrorHandlingStrategy()
             )
-        )
\ No newline at end of file
+        )
+
+
+class AsyncMethodStrategyFactory(MethodStrategyFactoryInterface):
+    def create(self):
+        return {s.name: s for s in self.get_strategies()}
+
+    def get_strategies(self):
+        return (
+            AsyncMethodStrategy(
+                'chunks',
+                aio.achunks,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            AsyncMethodStrategy(
+                'filter',
+                aio.afilter,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            AsyncMethodStrategy(
+                'first',
+                aio.afirst,
+                StoreIterableStrategy(),
+                ReturnResultStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                GetItemErrorHandlingStrategy()
+            ),
+            AsyncMethodStrategy(
+                'list',
+                aio.alist,
+                StoreIterableStrategy(),
+                ReturnResultStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            AsyncMethodStrategy(
+                'map',
+                aio.amap,
+                StoreResultStrategy(),
+                ReturnInstanceStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            ),
+            AsyncMethodStrategy(
+                'reduce',
+                aio.areduce,
+                StoreIterableStrategy(),
+                ReturnResultStrategy(),
+                PartialIterableBindingStrategy(),
+                UnformattedArgumentFormattingStrategy(),
+                PreProcessingStrategy(),
+                BaseExceptionErrorHandlingStrategy()
+            )
+        )
+
+
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+
+def default_registry():
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = StrategyRegistry.from_factory(DefaultMethodStrategyFactory())
+    return _default_registry
+
+
+_default_async_registry = None
+_default_async_registry_lock = threading.Lock()
+
+
+def default_async_registry():
+    global _default_async_registry
+    if _default_async_registry is None:
+        with _default_async_registry_lock:
+            if _default_async_registry is None:
+                _default_async_registry = StrategyRegistry.from_factory(AsyncMethodStrategyFactory())
+    return _default_async_registry
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from typing import Callable, Dict, Iterator, Mapping, Tuple
 
 from iterable_collections.strategy import MethodStrategyInterface
 
@@ -19,6 +19,53 @@ class MethodStrategyFactoryInterface(ABC):
         ...
 
 
+class StrategyRegistry(Mapping[str, MethodStrategyInterface]):
+    """
+    An immutable :obj:`Mapping<typing.Mapping>` of method names to objects implementing
+    :obj:`MethodStrategyInterface<iterable_collections.strategy.MethodStrategyInterface>`. A registry is built once
+    and can then be shared by any number of :obj:`Collection<iterable_collections.collection.Collection>` objects,
+    including across threads.
+    """
+    def __init__(self, strategies: Mapping[str, MethodStrategyInterface]) -> None:
+        """
+
+        Args:
+            strategies: A :obj:`StrategyDict` to be copied into the registry.
+        """
+
+    def __contains__(self, item: object) -> bool:
+        ...
+
+    def __getitem__(self, item: str) -> MethodStrategyInterface:
+        ...
+
+    def __iter__(self) -> Iterator[str]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @property
+    def methods(self) -> Mapping[str, Callable]:
+        """
+        :obj:`Mapping<typing.Mapping>`: The result of
+        :meth:`compile<iterable_collections.strategy.MethodStrategyInterface.compile>` for each strategy, made when
+        the registry is built.
+        """
+
+    @classmethod
+    def from_factory(cls, factory: 'MethodStrategyFactoryInterface') -> 'StrategyRegistry':
+        """
+        Build a registry from the :obj:`StrategyDict` created by ``factory``. Equivalent to::
+
+            StrategyRegistry(factory.create())
+
+        Args:
+            factory: An object implementing :obj:`MethodStrategyFactoryInterface`.
+
+        """
+
+
 class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
     """
     The factory used by the :func:`collect<iterable_collections.collection.collect>` function.
@@ -27,4 +74,32 @@ class DefaultMethodStrategyFactory(MethodStrategyFactoryInterface):
         ...
 
     def get_strategies(self) -> Tuple[MethodStrategyInterface]:
-        ...
\ No newline at end of file
+        ...
+
+
+class AsyncMethodStrategyFactory(MethodStrategyFactoryInterface):
+    """
+    The factory used by the :func:`acollect<iterable_collections.collection.acollect>` function. Its strategies are
+    built on the functions of :mod:`iterable_collections.aio`.
+    """
+    def create(self) -> StrategyDict:
+        ...
+
+    def get_strategies(self) -> Tuple[MethodStrategyInterface]:
+        ...
+
+
+def default_registry() -> StrategyRegistry:
+    """
+    Returns the process-wide :obj:`StrategyRegistry` built from :obj:`DefaultMethodStrategyFactory`. The registry is
+    created on the first call, guarded by a lock so that concurrent callers share a single instance.
+
+    """
+
+
+def default_async_registry() -> StrategyRegistry:
+    """
+    Returns the process-wide :obj:`StrategyRegistry` built from :obj:`AsyncMethodStrategyFactory`, created once in the
+    same way as :func:`default_registry`.
+
+    """
@@ -0,0 +1,44 @@
+from collections import namedtuple
+
+
+class Stage(namedtuple('Stage', 'kind func')):
+    pass
+
+
+_stage_templates = {
+    'emap': ('x = f{0}(i{0}, x)', 'i{0} += 1'),
+    'filter': ('if not f{0}(x):', '    continue'),
+    'filter_items': ('if not f{0}(*x):', '    continue'),
+    'map': ('x = f{0}(x)',),
+    'map_items': ('x = f{0}(*x)',),
+}
+
+
+def compile_kernel(stages):
+    namespace = {}
+    counters = []
+    body = []
+    for position, stage in enumerate(stages):
+        if stage.kind not in _stage_templates:
+            raise ValueError('Stage {} cannot be fused.'.format(stage.kind))
+        if stage.kind == 'filter' and stage.func is None:
+            body += ['if not x:', '    continue']
+            continue
+        namespace['f{}'.format(position)] = stage.func
+        if stage.kind == 'emap':
+            counters.append('    i{} = 0'.format(position))
+        body += [line.format(position) for line in _stage_templates[stage.kind]]
+    lines = [
+        'def kernel(iterable):',
+        *counters,
+        '    for x in iterable:',
+        *('        ' + line for line in body),
+        '        yield x'
+    ]
+    # The source is assembled only from _stage_templates and the int index of each stage. Stage functions are passed
+    # through namespace and unknown kinds are rejected above, so no caller supplied text reaches it. Calling a closure
+    # per stage instead would add the per element calls the kernel exists to avoid.
+    exec('\n'.join(lines), namespace)  # nosec B102
+    kernel = namespace['kernel']
+    kernel.stages = tuple(stages)
+    return kernel
@@ -0,0 +1,37 @@
+from collections import namedtuple
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+
+class Stage(namedtuple('Stage', 'kind func')):
+    """
+    A single element-wise operation of a kernel.
+
+    Attributes:
+        kind(:obj:`str`): The method the stage performs. One of ``'emap'``, ``'filter'``, ``'filter_items'``,
+            ``'map'`` or ``'map_items'``.
+        func(:obj:`Callable<typing.Callable>`): The function passed to the method. ``None`` is accepted for
+            ``'filter'``.
+    """
+
+
+def compile_kernel(stages: Sequence[Stage]) -> Callable[[Iterable], Iterator]:
+    """
+    Generates a generator function which performs each of ``stages`` on every element of an iterable in a single
+    loop. The result is equivalent to nesting the corresponding builtins, e.g.::
+
+        kernel = compile_kernel([Stage('map', f), Stage('filter', g)])
+        assert list(kernel(x)) == list(filter(g, map(f, x)))
+
+    ``'map_items'`` and ``'filter_items'`` call ``func`` with each element spread as arguments, as
+    :meth:`Collection.map_items<iterable_collections.collection.Collection.map_items>` does, without building an
+    intermediate tuple. ``'emap'`` passes a running count of the elements reaching the stage, as
+    :meth:`Collection.emap<iterable_collections.collection.Collection.emap>` does. The stages are available on the
+    ``stages`` attribute of the returned function.
+
+    Args:
+        stages: The stages to perform, in order.
+
+    Raises:
+        ValueError: Raised if a stage is not of a known kind.
+
+    """
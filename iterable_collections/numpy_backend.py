@@ -0,0 +1,219 @@
+import builtins
+import operator
+import threading
+from collections.abc import Iterator, MappingView, Sequence, Set
+from types import MethodType
+
+from iterable_collections.factory import MethodStrategyFactoryInterface, DefaultMethodStrategyFactory, \
+    StrategyRegistry
+from iterable_collections.strategy import MethodStrategyInterface
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_missing = object()
+
+
+class NotVectorisableError(Exception):
+    pass
+
+
+class Elementwise:
+    __slots__ = ('func',)
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.func)
+
+
+def is_array(iterable):
+    return np is not None and isinstance(iterable, np.ndarray)
+
+
+def as_array(iterable):
+    if np is None:
+        raise ImportError('NumPy is required for the numpy backend.')
+    if isinstance(iterable, np.ndarray):
+        return iterable
+    if isinstance(iterable, (Iterator, MappingView, Set)) or not isinstance(iterable, Sequence):
+        return np.array(list(iterable))
+    return np.asarray(iterable)
+
+
+_associative_ufuncs = {} if np is None else {
+    operator.add: np.add,
+    operator.mul: np.multiply,
+    operator.and_: np.bitwise_and,
+    operator.or_: np.bitwise_or,
+    operator.xor: np.bitwise_xor,
+    builtins.max: np.maximum,
+    builtins.min: np.minimum,
+    np.add: np.add,
+    np.multiply: np.multiply,
+    np.bitwise_and: np.bitwise_and,
+    np.bitwise_or: np.bitwise_or,
+    np.bitwise_xor: np.bitwise_xor,
+    np.maximum: np.maximum,
+    np.minimum: np.minimum,
+}
+
+
+def _elementwise(array, func):
+    if isinstance(func, Elementwise):
+        func = func.func
+    elif not isinstance(func, np.ufunc):
+        raise NotVectorisableError
+    try:
+        result = func(array)
+    except Exception:
+        raise NotVectorisableError from None
+    if not isinstance(result, np.ndarray) or result.shape != array.shape:
+        raise NotVectorisableError
+    return result
+
+
+def _one_dimensional(array):
+    if array.ndim != 1:
+        raise NotVectorisableError
+    return array
+
+
+def vectorised_filter(array, func):
+    if func is None:
+        return array[array.astype(bool)]
+    mask = _elementwise(array, func)
+    if mask.dtype != np.bool_:
+        raise NotVectorisableError
+    return array[mask]
+
+
+def vectorised_map(array, func, *iterables):
+    if iterables:
+        raise NotVectorisableError
+    return _elementwise(array, func)
+
+
+def vectorised_max(array, *args, key=None, default=_missing):
+    if args or key is not None:
+        raise NotVectorisableError
+    if not _one_dimensional(array).size:
+        if default is _missing:
+            raise NotVectorisableError
+        return default
+    return array.max()
+
+
+def vectorised_min(array, *args, key=None, default=_missing):
+    if args or key is not None:
+        raise NotVectorisableError
+    if not _one_dimensional(array).size:
+        if default is _missing:
+            raise NotVectorisableError
+        return default
+    return array.min()
+
+
+def vectorised_reduce(array, func, initializer=_missing):
+    ufunc = _associative_ufuncs.get(func)
+    if ufunc is None:
+        raise NotVectorisableError
+    if not _one_dimensional(array).size:
+        if initializer is _missing:
+            raise NotVectorisableError
+        return initializer
+    result = ufunc.reduce(array)
+    return result if initializer is _missing else ufunc(initializer, result)
+
+
+def vectorised_sorted(array, key=None, reverse=False):
+    if key is not None:
+        raise NotVectorisableError
+    result = np.sort(_one_dimensional(array), kind='stable')
+    return result[::-1] if reverse else result
+
+
+def vectorised_unique(array, key=None, window=None, capacity=None, error_rate=0.01):
+    if key is not None or window is not None or capacity is not None:
+        raise NotVectorisableError
+    _, index = np.unique(_one_dimensional(array), return_index=True)
+    return array[np.sort(index)]
+
+
+class VectorisedMethodStrategy(MethodStrategyInterface):
+    def __init__(self, name, vectorised, fallback):
+        self.name = name
+        self.vectorised = vectorised
+        self.fallback = fallback
+        self._fallback_method = fallback.compile()
+
+    def __call__(self, instance, *args, store=None, ret=None, **kwargs):
+        iterable = instance.iterable
+        if is_array(iterable):
+            try:
+                result = self.vectorised(iterable, *args, **kwargs)
+            except NotVectorisableError:
+                pass
+            else:
+                instance._iterable = self.fallback.result_strategy.handle_result(result, iterable, store)
+                return self.fallback.return_strategy.return_value(instance, result, ret)
+        return self._fallback_method(instance, *args, store=store, ret=ret, **kwargs)
+
+    @property
+    def return_strategy(self):
+        return self.fallback.return_strategy
+
+    def compile(self):
+        call = self.__call__
+
+        def method(instance, *args, **kwargs):
+            return call(instance, *args, **kwargs)
+
+        method.__name__ = method.__qualname__ = self.name
+        return method
+
+    def make_method(self, instance):
+        return MethodType(self, instance)
+
+
+class NumpyMethodStrategyFactory(MethodStrategyFactoryInterface):
+    vectorised = {
+        'filter': vectorised_filter,
+        'map': vectorised_map,
+        'max': vectorised_max,
+        'min': vectorised_min,
+        'reduce': vectorised_reduce,
+        'sorted': vectorised_sorted,
+        'unique': vectorised_unique,
+    }
+
+    def __init__(self, fallback_factory=None):
+        self.fallback_factory = fallback_factory or DefaultMethodStrategyFactory()
+
+    def create(self):
+        return {s.name: s for s in self.get_strategies()}
+
+    def get_strategies(self):
+        return tuple(
+            VectorisedMethodStrategy(s.name, self.vectorised[s.name], s) if s.name in self.vectorised else s
+            for s in self.fallback_factory.get_strategies()
+        )
+
+
+_default_numpy_registry = None
+_default_numpy_registry_lock = threading.Lock()
+
+
+def default_numpy_registry():
+    global _default_numpy_registry
+    if _default_numpy_registry is None:
+        with _default_numpy_registry_lock:
+            if _default_numpy_registry is None:
+                _default_numpy_registry = StrategyRegistry.from_factory(NumpyMethodStrategyFactory())
+    return _default_numpy_registry
@@ -0,0 +1,205 @@
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from iterable_collections.factory import MethodStrategyFactoryInterface, StrategyRegistry, StrategyDict
+from iterable_collections.strategy import MethodStrategy, MethodStrategyInterface, ResultStrategyInterface, \
+    ReturnValueStrategyInterface
+
+np: Any = ...
+"""The :mod:`numpy` module, or ``None`` if it is not installed."""
+
+
+class NotVectorisableError(Exception):
+    """
+    Raised by a vectorised implementation when it cannot handle its arguments, so that the Python strategy is used
+    instead.
+    """
+
+
+class Elementwise:
+    """
+    Marks ``func`` as safe to call once with a whole :obj:`ndarray<numpy.ndarray>` rather than once per element, so
+    that ``map`` and ``filter`` of the numpy backend can vectorise it. Calling it calls ``func``, so the Python
+    strategies use it as they would ``func``::
+
+        collect(array, backend='numpy').map(Elementwise(lambda x: x * 2))
+
+    Only wrap functions which give the same result either way. ``lambda x: x - x.min()`` doesn't, and a function
+    with side effects runs once instead of once per element.
+
+    Attributes:
+        func(:obj:`Callable<typing.Callable>`): The wrapped function.
+    """
+    func: Callable = ...
+    def __init__(self, func: Callable) -> None:
+        """
+        Args:
+            func: The function to wrap.
+        """
+
+    def __call__(self, *args, **kwargs) -> Any:
+        ...
+
+
+def is_array(iterable: Any) -> bool:
+    """
+    Returns ``True`` if NumPy is installed and ``iterable`` is an :obj:`ndarray<numpy.ndarray>`.
+
+    Args:
+        iterable: The object to test.
+
+    """
+
+
+def as_array(iterable: Iterable) -> 'np.ndarray':
+    """
+    Returns ``iterable`` as an :obj:`ndarray<numpy.ndarray>`. Arrays are returned as they are and sequences are
+    converted with :func:`numpy.asarray`. Other iterables, such as iterators and sets, are copied to a list first.
+
+    Args:
+        iterable: The iterable to convert.
+
+    Raises:
+        ImportError: Raised if NumPy is not installed.
+
+    """
+
+
+def vectorised_filter(array: 'np.ndarray', func: Optional[Callable]) -> 'np.ndarray':
+    """
+    Filters ``array`` with a boolean mask. ``func`` must be a :obj:`ufunc<numpy.ufunc>` or an :obj:`Elementwise`,
+    which is called once with the whole of ``array`` and must return a boolean array of the same shape, as
+    ``Elementwise(lambda x: x > 0)`` does.
+
+    Raises:
+        NotVectorisableError: Raised if ``func`` is any other callable, or if it raises or doesn't return a boolean
+            array of the same shape.
+
+    """
+
+
+def vectorised_map(array: 'np.ndarray', func: Callable, *iterables: Iterable) -> 'np.ndarray':
+    """
+    Calls ``func`` once with the whole of ``array`` if it is a :obj:`ufunc<numpy.ufunc>` or an :obj:`Elementwise`,
+    such as ``Elementwise(lambda x: x * 2)``.
+
+    Raises:
+        NotVectorisableError: Raised if ``iterables`` are given, if ``func`` is any other callable or if it raises or
+            doesn't return an array of the same shape.
+
+    """
+
+
+def vectorised_max(array: 'np.ndarray', *args, key: Optional[Callable] = None, default: Any = ...) -> Any:
+    """
+    Returns :meth:`ndarray.max<numpy.ndarray.max>` of a one dimensional array.
+
+    Raises:
+        NotVectorisableError: Raised if ``args`` or ``key`` are given, if ``array`` isn't one dimensional or if it is
+            empty and ``default`` isn't given.
+
+    """
+
+
+def vectorised_min(array: 'np.ndarray', *args, key: Optional[Callable] = None, default: Any = ...) -> Any:
+    """
+    Returns :meth:`ndarray.min<numpy.ndarray.min>` of a one dimensional array.
+
+    Raises:
+        NotVectorisableError: Raised if ``args`` or ``key`` are given, if ``array`` isn't one dimensional or if it is
+            empty and ``default`` isn't given.
+
+    """
+
+
+def vectorised_reduce(array: 'np.ndarray', func: Callable, initializer: Any = ...) -> Any:
+    """
+    Reduces a one dimensional array with :meth:`ufunc.reduce<numpy.ufunc.reduce>` when ``func`` is an associative
+    operation with a ufunc equivalent: :func:`operator.add`, :func:`operator.mul`, :func:`operator.and_`,
+    :func:`operator.or_`, :func:`operator.xor`, :func:`python:max`, :func:`python:min` or the corresponding ufuncs.
+
+    Raises:
+        NotVectorisableError: Raised for any other ``func``, if ``array`` isn't one dimensional or if it is empty and
+            ``initializer`` isn't given.
+
+    """
+
+
+def vectorised_sorted(array: 'np.ndarray', key: Optional[Callable] = None, reverse: bool = False) -> 'np.ndarray':
+    """
+    Sorts a one dimensional array with :func:`numpy.sort`.
+
+    Raises:
+        NotVectorisableError: Raised if ``key`` is given or ``array`` isn't one dimensional.
+
+    """
+
+
+def vectorised_unique(array: 'np.ndarray', key: Optional[Callable] = None, window: Optional[int] = None,
+                      capacity: Optional[int] = None, error_rate: float = 0.01) -> 'np.ndarray':
+    """
+    Returns the first occurrence of each element of a one dimensional array, in order, with :func:`numpy.unique`.
+
+    Raises:
+        NotVectorisableError: Raised if ``key``, ``window`` or ``capacity`` are given or ``array`` isn't one
+            dimensional.
+
+    """
+
+
+class VectorisedMethodStrategy(MethodStrategyInterface):
+    """
+    Calls ``vectorised`` instead of ``fallback`` when the
+    :attr:`iterable<iterable_collections.collection.Collection.iterable>` of the instance is an
+    :obj:`ndarray<numpy.ndarray>`. The result is stored and returned with the result and return
+    strategies of ``fallback``. ``fallback`` is called instead if the iterable is not an array or ``vectorised``
+    raises :obj:`NotVectorisableError`, so results match the Python backend whenever a call can't be vectorised.
+    """
+    name: str = ...
+    vectorised: Callable = ...
+    fallback: MethodStrategy = ...
+    def __init__(self, name: str, vectorised: Callable, fallback: MethodStrategy) -> None:
+        """
+        Args:
+            name: The name of the method.
+            vectorised: A function receiving the array followed by the arguments of the method.
+            fallback: The strategy of the Python backend.
+        """
+
+    @property
+    def return_strategy(self) -> ReturnValueStrategyInterface:
+        """The return strategy of ``fallback``."""
+
+    def make_method(self, instance) -> Callable:
+        ...
+
+
+class NumpyMethodStrategyFactory(MethodStrategyFactoryInterface):
+    """
+    The factory of the numpy backend. Its strategies are those of ``fallback_factory``, with the methods in
+    ``vectorised`` wrapped in a :obj:`VectorisedMethodStrategy`.
+
+    Attributes:
+        vectorised(:obj:`dict`): The vectorised implementation of each method by name.
+    """
+    vectorised: Dict[str, Callable] = ...
+    def __init__(self, fallback_factory: Optional[MethodStrategyFactoryInterface] = None) -> None:
+        """
+        Args:
+            fallback_factory: The factory of the Python strategies. Defaults to
+                :obj:`DefaultMethodStrategyFactory<iterable_collections.factory.DefaultMethodStrategyFactory>`.
+        """
+
+    def create(self) -> StrategyDict:
+        ...
+
+    def get_strategies(self) -> Tuple[MethodStrategyInterface]:
+        ...
+
+
+def default_numpy_registry() -> StrategyRegistry:
+    """
+    Returns the process-wide :obj:`StrategyRegistry<iterable_collections.factory.StrategyRegistry>` built from
+    :obj:`NumpyMethodStrategyFactory`, created once in the same way as
+    :func:`default_registry<iterable_collections.factory.default_registry>`.
+
+    """
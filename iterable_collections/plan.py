@@ -0,0 +1,220 @@
+import copy
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter, namedtuple
+
+from iterable_collections.kernel import Stage, compile_kernel
+from iterable_collections.strategy import ReturnValueStrategyInterface, MethodStrategy, PreProcessingStrategy, \
+    StoreResultStrategy, ReturnInstanceStrategy, PartialIterableBindingStrategy, \
+    UnformattedArgumentFormattingStrategy, BaseExceptionErrorHandlingStrategy, TrackingPreProcessingStrategy
+from iterable_collections.utils import SequenceView, compose, conjoin
+
+
+class Step(namedtuple('Step', 'name args kwargs strategy')):
+    def __new__(cls, name, args=(), kwargs=None, strategy=None):
+        return super().__new__(cls, name, args, kwargs or {}, strategy)
+
+
+class Plan:
+    def __init__(self, steps=()):
+        self.steps = list(steps)
+
+    def __iter__(self):
+        return iter(self.steps)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __repr__(self):
+        return 'Plan({})'.format([step.name for step in self.steps])
+
+    def append(self, name, args=(), kwargs=None):
+        self.steps.append(Step(name, args, kwargs))
+
+    def clear(self):
+        self.steps = []
+
+    def execute(self, collection):
+        for step in self.steps:
+            if step.strategy is None:
+                getattr(collection, step.name)(*step.args, **step.kwargs)
+            else:
+                step.strategy.make_method(collection)(*step.args, **step.kwargs)
+        return collection
+
+
+class PlanRuleInterface(ABC):
+    @abstractmethod
+    def apply(self, steps, strategies, statistics):
+        raise NotImplementedError
+
+
+class ElideConversionRule(PlanRuleInterface):
+    conversions = {'dict': dict, 'list': list, 'set': set, 'tuple': tuple}
+    produced_types = {
+        'bottom_k': list,
+        'concat_seq': list,
+        'dict_': dict,
+        'diff_iter': set,
+        'diff_seq': set,
+        'group_by': dict,
+        'intersect_iter': set,
+        'intersect_seq': set,
+        'list_': list,
+        'nlargest_items': list,
+        'nlargest_nt_items': list,
+        'nsmallest_items': list,
+        'nsmallest_nt_items': list,
+        'pfilter': list,
+        'pmap': list,
+        'set_': set,
+        'slice': list,
+        'sorted': list,
+        'top_k': list,
+        'tuple_': tuple,
+        'view': SequenceView,
+    }
+    view_preserving = ('slice',)
+
+    def apply(self, steps, strategies, statistics):
+        optimized = []
+        produced = None
+        for step in steps:
+            strategy = step.strategy or strategies.get(step.name)
+            if self._is_elidable(strategy) and produced is not None:
+                operations = tuple(
+                    o for o in strategy.pre_process_strategy.operations if not self._is_conversion(o, produced)
+                )
+                elided = len(strategy.pre_process_strategy.operations) - len(operations)
+                if elided:
+                    strategy = copy.copy(strategy)
+                    strategy.pre_process_strategy = copy.copy(strategy.pre_process_strategy)
+                    strategy.pre_process_strategy.operations = operations
+                    step = step._replace(strategy=strategy)
+                    statistics['conversions_elided'] += elided
+            optimized.append(step)
+            produced = self._produced(step, strategy, produced)
+        return optimized
+
+    def _produced(self, step, strategy, previous=None):
+        if {'store', 'ret'} & set(step.kwargs) or not isinstance(strategy, MethodStrategy):
+            return None
+        if previous is SequenceView and step.name in self.view_preserving:
+            return SequenceView
+        return self.produced_types.get(step.name)
+
+    def _is_conversion(self, operation, produced):
+        return (
+            self.conversions.get(operation.get('name')) is produced
+            and operation.get('kwargs', {}).get('store') is True
+            and not operation.get('args')
+        )
+
+    def _is_elidable(self, strategy):
+        return (
+            isinstance(strategy, MethodStrategy)
+            and type(strategy.pre_process_strategy) in (PreProcessingStrategy, TrackingPreProcessingStrategy)
+            and strategy.pre_process_strategy.operations
+        )
+
+
+class MergeStagesRule(PlanRuleInterface):
+    def __init__(self, name, combine):
+        self.name = name
+        self.combine = combine
+
+    def apply(self, steps, strategies, statistics):
+        optimized = []
+        for step in steps:
+            if optimized and self._is_mergeable(optimized[-1]) and self._is_mergeable(step):
+                previous = optimized.pop()
+                step = step._replace(args=(self.combine(previous.args[0], step.args[0]),))
+                statistics['stages_merged'] += 1
+            optimized.append(step)
+        return optimized
+
+    def _is_mergeable(self, step):
+        return step.name == self.name and len(step.args) == 1 and not step.kwargs and step.strategy is None
+
+
+class FuseStagesRule(PlanRuleInterface):
+    element_wise = ('emap', 'filter', 'map')
+    leading = ('filter_items', 'map_items')
+
+    def apply(self, steps, strategies, statistics):
+        optimized = []
+        run = []
+        for step in steps:
+            if self._is_fusable(step, strategies, first=not run):
+                run.append(step)
+                continue
+            optimized += self._fuse(run, strategies, statistics)
+            run = [step] if self._is_fusable(step, strategies, first=True) else []
+            if not run:
+                optimized.append(step)
+        return optimized + self._fuse(run, strategies, statistics)
+
+    def _is_fusable(self, step, strategies, first):
+        return (
+            (step.name in self.element_wise or first and step.name in self.leading)
+            and len(step.args) == 1
+            and not step.kwargs
+            and step.strategy is None
+            and type(strategies.get(step.name)) is MethodStrategy
+        )
+
+    def _fuse(self, run, strategies, statistics):
+        if len(run) < 2:
+            return run
+        head = strategies.get(run[0].name)
+        pre_process_strategy = head.pre_process_strategy if run[0].name in self.leading else PreProcessingStrategy()
+        kernel = compile_kernel([Stage(step.name, step.args[0]) for step in run])
+        statistics['stages_fused'] += len(run)
+        return [Step('fused', strategy=MethodStrategy(
+            'fused',
+            kernel,
+            StoreResultStrategy(),
+            ReturnInstanceStrategy(),
+            PartialIterableBindingStrategy(),
+            UnformattedArgumentFormattingStrategy(),
+            pre_process_strategy,
+            BaseExceptionErrorHandlingStrategy()
+        ))]
+
+
+class PlanOptimizer:
+    opaque_sources = (array, SequenceView)
+    opaque_steps = ('array_',)
+
+    def __init__(self, rules=None):
+        self.rules = rules if rules is not None else (
+            ElideConversionRule(),
+            MergeStagesRule('map', compose),
+            MergeStagesRule('filter', conjoin),
+            FuseStagesRule(),
+        )
+        self.statistics = Counter()
+
+    def optimize(self, plan, strategies, source=None):
+        steps = list(plan)
+        boundary = self._boundary(steps, source)
+        optimized = steps[:boundary]
+        for rule in self.rules:
+            optimized = rule.apply(optimized, strategies, self.statistics)
+        return Plan(optimized + steps[boundary:])
+
+    def _boundary(self, steps, source):
+        if isinstance(source, self.opaque_sources):
+            return 0
+        return next((i for i, step in enumerate(steps) if step.name in self.opaque_steps), len(steps))
+
+
+_instance = object()
+_result = object()
+
+
+def returns_instance(strategy, ret=None):
+    return_strategy = getattr(strategy, 'return_strategy', None)
+    if not isinstance(return_strategy, ReturnValueStrategyInterface):
+        return False
+    return return_strategy.return_value(_instance, _result, ret) is _instance
@@ -0,0 +1,197 @@
+from abc import ABC, abstractmethod
+from collections import Counter, namedtuple
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Type
+
+from iterable_collections.collection import Collection
+from iterable_collections.factory import StrategyDict
+from iterable_collections.strategy import MethodStrategyInterface
+
+
+class Step(namedtuple('Step', 'name args kwargs strategy')):
+    """
+    A single method call recorded by a :obj:`Plan`.
+
+    Attributes:
+        name(:obj:`str`): The name of the method.
+        args(:obj:`tuple`): Positional arguments passed to the method.
+        kwargs(:obj:`dict`): Keyword arguments passed to the method.
+        strategy(:obj:`MethodStrategyInterface<iterable_collections.strategy.MethodStrategyInterface>`): A strategy
+            used in place of the collection's own method, typically set by a :obj:`PlanRuleInterface`. ``None`` to
+            call the method named ``name``.
+    """
+    def __new__(
+            cls,
+            name: str,
+            args: Tuple = (),
+            kwargs: Optional[Dict[str, Any]] = None,
+            strategy: Optional[MethodStrategyInterface] = None
+    ) -> 'Step':
+        ...
+
+
+class Plan:
+    """
+    An ordered series of :obj:`Steps<Step>` to be performed on a
+    :obj:`Collection<iterable_collections.collection.Collection>`.
+    """
+    steps: List[Step] = ...
+    def __init__(self, steps: Sequence[Step] = ()) -> None:
+        """
+
+        Args:
+            steps: The initial steps of the plan.
+        """
+
+    def __iter__(self) -> Iterator[Step]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    def append(self, name: str, args: Tuple = (), kwargs: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a call to the method ``name``.
+
+        Args:
+            name: The name of the method.
+            args: Positional arguments passed to the method.
+            kwargs: Keyword arguments passed to the method.
+
+        """
+
+    def clear(self) -> None:
+        """
+        Remove all steps from the plan.
+
+        """
+
+    def execute(self, collection: Collection) -> Collection:
+        """
+        Call each step, in order, on ``collection`` and return it.
+
+        Args:
+            collection: An instance of :obj:`Collection<iterable_collections.collection.Collection>`.
+
+        """
+
+
+class PlanRuleInterface(ABC):
+    """
+    Rewrites the steps of a :obj:`Plan` into an equivalent, cheaper series of steps.
+    """
+    @abstractmethod
+    def apply(self, steps: List[Step], strategies: StrategyDict, statistics: Counter) -> List[Step]:
+        """
+
+        Args:
+            steps: The steps to be rewritten.
+            strategies: The strategies of the :obj:`Collection<iterable_collections.collection.Collection>` the plan
+                will be executed against.
+            statistics: A :obj:`Counter<collections.Counter>` to which the rule adds the number of rewrites it made.
+
+        """
+
+
+class ElideConversionRule(PlanRuleInterface):
+    """
+    Removes pre-processing operations which convert and store
+    :attr:`iterable<iterable_collections.collection.Collection.iterable>` as a ``dict``, ``list``, ``set`` or
+    ``tuple`` when the previous step is known to have stored a new object of that type, for instance the second
+    conversion to ``set`` in::
+
+        collect(x, lazy=True).diff_seq(a).intersect_seq(b)
+
+    The iterable a plan starts with is never assumed to be owned by the plan, so it is always converted. Each elided
+    operation is counted as ``conversions_elided``. Steps listed in ``view_preserving`` store a
+    :obj:`SequenceView<iterable_collections.utils.SequenceView>` when the previous step did, so a conversion following
+    ``view().slice()`` is kept.
+    """
+    conversions: Dict[str, Type] = ...
+    produced_types: Dict[str, Type] = ...
+    view_preserving: Tuple[str, ...] = ...
+
+
+class MergeStagesRule(PlanRuleInterface):
+    """
+    Merges consecutive steps calling the method ``name`` with a single positional argument into one step, using
+    ``combine`` to join their arguments. Each merge is counted as ``stages_merged``.
+    """
+    name: str = ...
+    combine: Callable[[Any, Any], Any] = ...
+    def __init__(self, name: str, combine: Callable[[Any, Any], Any]) -> None:
+        """
+
+        Args:
+            name: The name of the method whose steps are merged, e.g. ``'map'``.
+            combine: Receives the argument of two consecutive steps and returns the argument of the merged step.
+                e.g. :func:`compose<iterable_collections.utils.compose>`.
+        """
+
+
+class FuseStagesRule(PlanRuleInterface):
+    """
+    Replaces each run of two or more consecutive ``map``, ``filter`` and ``emap`` steps with a single step performing
+    a kernel made by :func:`compile_kernel<iterable_collections.kernel.compile_kernel>`. A ``map_items`` or
+    ``filter_items`` step may start a run, since its pre-processing is then performed before the kernel. Steps passing
+    more than one argument or any keyword arguments are not fused. Each fused step is counted as ``stages_fused``.
+    """
+    element_wise: Tuple[str, ...] = ...
+    leading: Tuple[str, ...] = ...
+
+
+class PlanOptimizer:
+    """
+    Applies a series of :obj:`PlanRuleInterface` objects to a :obj:`Plan`. By default, redundant conversions are
+    elided, consecutive ``map`` and ``filter`` steps are merged and remaining runs of element-wise steps are fused.
+
+    The rules assume the types listed by :obj:`ElideConversionRule` and element-wise results of ``map`` and
+    ``filter``, which doesn't hold once the iterable is an :obj:`array<array.array>`, for which those methods
+    return arrays, or a :obj:`SequenceView<iterable_collections.utils.SequenceView>`. Steps from the first of
+    ``opaque_steps`` onwards, or every step if the source is one of ``opaque_sources``, are left as they are.
+
+    Attributes:
+        rules(:obj:`Sequence[PlanRuleInterface]<typing.Sequence>`): The rules to apply, in order.
+        statistics(:obj:`Counter<collections.Counter>`): The number of rewrites made by each rule.
+        opaque_sources(:obj:`Tuple[type, ...]<typing.Tuple>`): Types of source iterable for which no step is
+            rewritten.
+        opaque_steps(:obj:`Tuple[str, ...]<typing.Tuple>`): Names of methods which may make the iterable one of
+            ``opaque_sources``.
+    """
+    rules: Sequence[PlanRuleInterface] = ...
+    statistics: Counter = ...
+    opaque_sources: Tuple[type, ...] = ...
+    opaque_steps: Tuple[str, ...] = ...
+    def __init__(self, rules: Optional[Sequence[PlanRuleInterface]] = None) -> None:
+        """
+
+        Args:
+            rules: The rules to apply, in order.
+        """
+
+    def optimize(self, plan: Plan, strategies: StrategyDict, source: Any = None) -> Plan:
+        """
+        Returns a new :obj:`Plan` with every rule applied to the steps of ``plan``. ``plan`` is not modified.
+
+        Args:
+            plan: The :obj:`Plan` to optimize.
+            strategies: The strategies of the :obj:`Collection<iterable_collections.collection.Collection>` the plan
+                will be executed against.
+            source: The iterable the plan will be executed against.
+
+        """
+
+
+def returns_instance(strategy: MethodStrategyInterface, ret: bool = None) -> bool:
+    """
+    Returns ``True`` if the method made by ``strategy`` returns the
+    :obj:`Collection<iterable_collections.collection.Collection>` instance when called with ``ret``, so that the call
+    can be recorded in a :obj:`Plan` rather than executed. Strategies without a
+    :obj:`ReturnValueStrategyInterface<iterable_collections.strategy.ReturnValueStrategyInterface>` are never
+    deferred.
+
+    Args:
+        strategy: An object implementing
+            :obj:`MethodStrategyInterface<iterable_collections.strategy.MethodStrategyInterface>`.
+        ret: The ``ret`` keyword argument passed to the method.
+
+    """
@@ -0,0 +1,129 @@
+import copy
+import logging
+import threading
+from collections import namedtuple
+
+from iterable_collections.factory import StrategyRegistry
+from iterable_collections.strategy import MethodStrategy, ProfilingHookInterface, MaterialisationHookInterface, \
+    PreProcessingStrategy, TrackingPreProcessingStrategy
+
+logger = logging.getLogger(__name__)
+
+
+class Materialisation(namedtuple('Materialisation', 'method operation size nbytes')):
+    pass
+
+
+class MethodProfile:
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.timings = [0.0] * len(ProfilingHookInterface.phases)
+        self.input_size = 0
+        self.output_size = 0
+
+    def __repr__(self):
+        return 'MethodProfile({!r}, calls={}, total={:.6f})'.format(self.name, self.calls, self.total)
+
+    @property
+    def total(self):
+        return sum(self.timings)
+
+    def add(self, timings, input_size, output_size):
+        self.calls += 1
+        self.timings = [x + y for x, y in zip(self.timings, timings)]
+        self.input_size += input_size or 0
+        self.output_size += output_size or 0
+
+
+class Profiler(ProfilingHookInterface):
+    def __init__(self):
+        self.profiles = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return 'Profiler({})'.format(sorted(self.profiles))
+
+    def record(self, name, timings, input_size, output_size):
+        with self._lock:
+            profile = self.profiles.get(name)
+            if profile is None:
+                profile = self.profiles[name] = MethodProfile(name)
+            profile.add(timings, input_size, output_size)
+
+    def report(self):
+        columns = ('method', 'calls', 'total', *self.phases, 'in', 'out')
+        rows = [
+            (p.name, p.calls, *('{:.6f}'.format(t) for t in (p.total, *p.timings)), p.input_size, p.output_size)
+            for p in self.summary()
+        ]
+        widths = [max(len(str(x)) for x in column) for column in zip(columns, *rows)]
+        return '\n'.join(
+            ' '.join(str(x).ljust(w) if i == 0 else str(x).rjust(w) for i, (x, w) in enumerate(zip(row, widths)))
+            for row in (columns, *rows)
+        )
+
+    def reset(self):
+        with self._lock:
+            self.profiles = {}
+
+    def summary(self):
+        with self._lock:
+            return sorted(self.profiles.values(), key=lambda p: p.total, reverse=True)
+
+
+class MaterialisationTracker(MaterialisationHookInterface):
+    def __init__(self, level=logging.INFO):
+        self.level = level
+        self.materialisations = []
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return 'MaterialisationTracker({} materialisations)'.format(len(self.materialisations))
+
+    def record(self, method, operation, size, nbytes):
+        with self._lock:
+            self.materialisations.append(Materialisation(method, operation, size, nbytes))
+        logger.log(self.level, '%s materialised %s elements (%s bytes) with %s', method, size, nbytes, operation)
+
+    def report(self):
+        columns = ('method', 'operation', 'count', 'elements', 'bytes')
+        rows = [(*key, *totals) for key, totals in self.summary().items()]
+        widths = [max(len(str(x)) for x in column) for column in zip(columns, *rows)]
+        return '\n'.join(
+            ' '.join(str(x).ljust(w) if i < 2 else str(x).rjust(w) for i, (x, w) in enumerate(zip(row, widths)))
+            for row in (columns, *rows)
+        )
+
+    def reset(self):
+        with self._lock:
+            self.materialisations = []
+
+    def summary(self):
+        totals = {}
+        with self._lock:
+            for m in self.materialisations:
+                count, size, nbytes = totals.get((m.method, m.operation), (0, 0, 0))
+                totals[(m.method, m.operation)] = (count + 1, size + (m.size or 0), nbytes + m.nbytes)
+        return dict(sorted(totals.items(), key=lambda item: item[1][2], reverse=True))
+
+
+def profiled_registry(strategies, hook):
+    profiled = {}
+    for name, strategy in strategies.items():
+        if isinstance(strategy, MethodStrategy):
+            strategy = copy.copy(strategy)
+            if isinstance(hook, ProfilingHookInterface):
+                strategy.profiling_hook = hook
+            if isinstance(hook, MaterialisationHookInterface) and _is_trackable(strategy.pre_process_strategy):
+                strategy.pre_process_strategy = TrackingPreProcessingStrategy(
+                    strategy.pre_process_strategy.operations,
+                    name,
+                    hook
+                )
+        profiled[name] = strategy
+    return StrategyRegistry(profiled)
+
+
+def _is_trackable(pre_process_strategy):
+    return type(pre_process_strategy) is PreProcessingStrategy and pre_process_strategy.operations
@@ -0,0 +1,156 @@
+import collections
+import logging
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from iterable_collections.factory import StrategyRegistry
+from iterable_collections.strategy import MethodStrategyInterface, ProfilingHookInterface, MaterialisationHookInterface
+
+StrategyDict = Mapping[str, MethodStrategyInterface]
+
+logger: logging.Logger = ...
+
+
+class Materialisation(collections.namedtuple('Materialisation', 'method operation size nbytes')):
+    """
+    A conversion recorded by a :obj:`MaterialisationTracker`.
+
+    Attributes:
+        method(:obj:`str`): The name of the method which made the conversion, e.g. ``'reversed'``.
+        operation(:obj:`str`): The name of the conversion, e.g. ``'list'``.
+        size(:obj:`Optional[int]<typing.Optional>`): The number of elements converted, if it is known.
+        nbytes(:obj:`int`): The approximate number of bytes allocated.
+    """
+
+
+class MethodProfile:
+    """
+    The totals recorded for one method by a :obj:`Profiler`.
+
+    Attributes:
+        name(:obj:`str`): The name of the method.
+        calls(:obj:`int`): The number of calls.
+        timings(:obj:`List[float]<typing.List>`): The wall time in seconds spent in each of
+            :attr:`phases<iterable_collections.strategy.ProfilingHookInterface.phases>`.
+        input_size(:obj:`int`): The sum of the known lengths of the iterable before each call.
+        output_size(:obj:`int`): The sum of the known lengths of the results.
+    """
+    name: str = ...
+    calls: int = ...
+    timings: List[float] = ...
+    input_size: int = ...
+    output_size: int = ...
+
+    def __init__(self, name: str) -> None:
+        ...
+
+    @property
+    def total(self) -> float:
+        """The wall time in seconds spent in all phases."""
+
+    def add(self, timings: Tuple[float, ...], input_size: Optional[int], output_size: Optional[int]) -> None:
+        """
+        Adds a call to the totals. See :meth:`record<iterable_collections.strategy.ProfilingHookInterface.record>`.
+
+        """
+
+
+class Profiler(ProfilingHookInterface):
+    """
+    Accumulates a :obj:`MethodProfile` for each method name. Profilers may be shared by collections used from several
+    threads. Usage::
+
+        profiler = Profiler()
+        collect(data, profiler=profiler).map(f).sorted().slice(0, 10)
+        print(profiler.report())
+
+    Attributes:
+        profiles(:obj:`Dict[str, MethodProfile]<typing.Dict>`): The profile of each method called.
+    """
+    profiles: Dict[str, MethodProfile] = ...
+
+    def record(self, name: str, timings: Tuple[float, ...], input_size: Optional[int],
+               output_size: Optional[int]) -> None:
+        """
+        See :meth:`ProfilingHookInterface.record<iterable_collections.strategy.ProfilingHookInterface.record>`.
+
+        """
+
+    def report(self) -> str:
+        """
+        Returns a table of the profile of each method, slowest first, with the number of calls, the total time, the
+        time of each phase and the input and output sizes.
+
+        """
+
+    def reset(self) -> None:
+        """Discards all profiles."""
+
+    def summary(self) -> List[MethodProfile]:
+        """Returns the profile of each method, slowest first."""
+
+
+class MaterialisationTracker(MaterialisationHookInterface):
+    """
+    Records every conversion a method makes to the iterable of a collection before running, e.g. ``reversed``,
+    ``slice`` and ``pop`` converting it to a ``list`` or ``diff_seq`` to a ``set``, and logs each one to
+    :data:`logger`. Usage::
+
+        tracker = MaterialisationTracker()
+        collect(data, profiler=tracker).reversed().pop()
+        print(tracker.report())
+
+    To count every allocation rather than the size of the converted container, start :mod:`tracemalloc` first.
+
+    Attributes:
+        level(:obj:`int`): The :mod:`logging` level of the log records.
+        materialisations(:obj:`List[Materialisation]<typing.List>`): The conversions, in order.
+    """
+    level: int = ...
+    materialisations: List[Materialisation] = ...
+
+    def __init__(self, level: int = logging.INFO) -> None:
+        ...
+
+    def record(self, method: str, operation: str, size: Optional[int], nbytes: int) -> None:
+        """
+        See
+        :meth:`MaterialisationHookInterface.record<iterable_collections.strategy.MaterialisationHookInterface.record>`.
+
+        """
+
+    def report(self) -> str:
+        """
+        Returns a table of the conversions grouped by method and operation, with their number, elements and bytes,
+        most bytes first.
+
+        """
+
+    def reset(self) -> None:
+        """Discards all conversions."""
+
+    def summary(self) -> Dict[Tuple[str, str], Tuple[int, int, int]]:
+        """
+        Returns the number of conversions, elements and bytes for each method and operation, most bytes first.
+
+        """
+
+
+def profiled_registry(strategies: StrategyDict,
+                      hook: Union[ProfilingHookInterface, MaterialisationHookInterface]) -> StrategyRegistry:
+    """
+    Returns a :obj:`StrategyRegistry<iterable_collections.factory.StrategyRegistry>` with a copy of each
+    :obj:`MethodStrategy<iterable_collections.strategy.MethodStrategy>` of ``strategies``. If ``hook`` is a
+    :obj:`ProfilingHookInterface<iterable_collections.strategy.ProfilingHookInterface>`, it is set as the
+    :attr:`profiling_hook<iterable_collections.strategy.MethodStrategy.profiling_hook>` of each copy. If it is a
+    :obj:`MaterialisationHookInterface<iterable_collections.strategy.MaterialisationHookInterface>`, each
+    :obj:`PreProcessingStrategy<iterable_collections.strategy.PreProcessingStrategy>` with operations is replaced by
+    a :obj:`TrackingPreProcessingStrategy<iterable_collections.strategy.TrackingPreProcessingStrategy>`. Other
+    strategies,
+    e.g. :obj:`VectorisedMethodStrategy<iterable_collections.numpy_backend.VectorisedMethodStrategy>`, are kept as
+    they are and aren't profiled.
+
+    Args:
+        strategies: The strategies to profile.
+        hook: The hook receiving the timings or conversions.
+
+    """
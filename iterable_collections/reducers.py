@@ -0,0 +1,248 @@
+from abc import ABC, abstractmethod
+
+_missing = object()
+
+
+class ReducerInterface(ABC):
+    @abstractmethod
+    def initial(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def step(self, state, x):
+        raise NotImplementedError
+
+    @abstractmethod
+    def combine(self, state, other):
+        raise NotImplementedError
+
+    def result(self, state):
+        return state
+
+    def fold(self, iterable):
+        step = self.step
+        state = self.initial()
+        for x in iterable:
+            state = step(state, x)
+        return state
+
+    def reduce(self, iterable):
+        return self.result(self.fold(iterable))
+
+
+class Aggregate(ReducerInterface):
+    def __init__(self, **reducers):
+        self.reducers = reducers
+
+    def __repr__(self):
+        return 'Aggregate({})'.format(', '.join('{}={!r}'.format(k, v) for k, v in self.reducers.items()))
+
+    def initial(self):
+        return [r.initial() for r in self.reducers.values()]
+
+    def step(self, state, x):
+        for i, r in enumerate(self.reducers.values()):
+            state[i] = r.step(state[i], x)
+        return state
+
+    def combine(self, state, other):
+        return [r.combine(s, o) for r, s, o in zip(self.reducers.values(), state, other)]
+
+    def result(self, state):
+        return {name: r.result(s) for (name, r), s in zip(self.reducers.items(), state)}
+
+    def fold(self, iterable):
+        state = self.initial()
+        steps = list(enumerate(r.step for r in self.reducers.values()))
+        for x in iterable:
+            for i, step in steps:
+                state[i] = step(state[i], x)
+        return state
+
+
+class Count(ReducerInterface):
+    def __repr__(self):
+        return 'Count()'
+
+    def initial(self):
+        return 0
+
+    def step(self, state, x):
+        return state + 1
+
+    def combine(self, state, other):
+        return state + other
+
+
+class _KeyedReducer(ReducerInterface):
+    def __init__(self, key=None):
+        self.key = key
+
+    def __repr__(self):
+        return '{}(key={!r})'.format(type(self).__name__, self.key)
+
+
+class Sum(_KeyedReducer):
+    def __init__(self, key=None, start=0):
+        super().__init__(key)
+        self.start = start
+
+    def initial(self):
+        return self.start
+
+    def step(self, state, x):
+        return state + (x if self.key is None else self.key(x))
+
+    def combine(self, state, other):
+        return state + other - self.start
+
+
+class Min(_KeyedReducer):
+    def __init__(self, key=None, default=None):
+        super().__init__(key)
+        self.default = default
+
+    def initial(self):
+        return _missing
+
+    def step(self, state, x):
+        if self.key is not None:
+            x = self.key(x)
+        return x if state is _missing or x < state else state
+
+    def combine(self, state, other):
+        if state is _missing or (other is not _missing and other < state):
+            return other
+        return state
+
+    def result(self, state):
+        return self.default if state is _missing else state
+
+
+class Max(Min):
+    def step(self, state, x):
+        if self.key is not None:
+            x = self.key(x)
+        return x if state is _missing or x > state else state
+
+    def combine(self, state, other):
+        if state is _missing or (other is not _missing and other > state):
+            return other
+        return state
+
+
+class Mean(_KeyedReducer):
+    def __init__(self, key=None, default=None):
+        super().__init__(key)
+        self.default = default
+
+    def initial(self):
+        return 0, 0
+
+    def step(self, state, x):
+        return state[0] + 1, state[1] + (x if self.key is None else self.key(x))
+
+    def combine(self, state, other):
+        return state[0] + other[0], state[1] + other[1]
+
+    def result(self, state):
+        return state[1] / state[0] if state[0] else self.default
+
+
+class Variance(_KeyedReducer):
+    def __init__(self, key=None, ddof=0, default=None):
+        super().__init__(key)
+        self.ddof = ddof
+        self.default = default
+
+    def initial(self):
+        return 0, 0.0, 0.0
+
+    def step(self, state, x):
+        if self.key is not None:
+            x = self.key(x)
+        n, mean, m2 = state
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        return n, mean, m2 + delta * (x - mean)
+
+    def combine(self, state, other):
+        n_a, mean_a, m2_a = state
+        n_b, mean_b, m2_b = other
+        n = n_a + n_b
+        if not n:
+            return state
+        delta = mean_b - mean_a
+        return n, mean_a + delta * n_b / n, m2_a + m2_b + delta * delta * n_a * n_b / n
+
+    def result(self, state):
+        n, mean, m2 = state
+        return m2 / (n - self.ddof) if n > self.ddof else self.default
+
+
+class First(_KeyedReducer):
+    def __init__(self, key=None, default=None):
+        super().__init__(key)
+        self.default = default
+
+    def initial(self):
+        return _missing
+
+    def step(self, state, x):
+        if state is not _missing:
+            return state
+        return x if self.key is None else self.key(x)
+
+    def combine(self, state, other):
+        return other if state is _missing else state
+
+    def result(self, state):
+        return self.default if state is _missing else state
+
+
+class Last(First):
+    def step(self, state, x):
+        return x if self.key is None else self.key(x)
+
+    def combine(self, state, other):
+        return state if other is _missing else other
+
+
+class ArgMin(_KeyedReducer):
+    def __init__(self, key=None, default=None):
+        super().__init__(key)
+        self.default = default
+
+    def initial(self):
+        return _missing
+
+    def step(self, state, x):
+        k = x if self.key is None else self.key(x)
+        return (k, x) if state is _missing or k < state[0] else state
+
+    def combine(self, state, other):
+        if state is _missing or (other is not _missing and other[0] < state[0]):
+            return other
+        return state
+
+    def result(self, state):
+        return self.default if state is _missing else state[1]
+
+
+class ArgMax(ArgMin):
+    def step(self, state, x):
+        k = x if self.key is None else self.key(x)
+        return (k, x) if state is _missing or k > state[0] else state
+
+    def combine(self, state, other):
+        if state is _missing or (other is not _missing and other[0] > state[0]):
+            return other
+        return state
+
+
+def aggregate(iterable, /, **reducers):
+    reserved = [name for name in ('store', 'ret') if name in reducers]
+    if reserved:
+        raise TypeError('{} is reserved by Collection methods and cannot name a reducer.'.format(reserved[0]))
+    return Aggregate(**reducers).reduce(iterable)
@@ -0,0 +1,184 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class ReducerInterface(ABC):
+    """
+    Computes a value from the elements of an iterable in a single pass. A reducer keeps a state, which is created
+    by :meth:`initial`, advanced by :meth:`step` for each element and finally converted to the value by
+    :meth:`result`. The states of two partitions of an iterable are merged with :meth:`combine`, so that::
+
+        reducer.result(reducer.combine(reducer.fold(a), reducer.fold(b))) == reducer.reduce(chain(a, b))
+
+    which allows partitions to be folded separately, e.g. in different processes. Reducers may be passed to
+    :meth:`Collection.aggregate<iterable_collections.collection.Collection.aggregate>` and to
+    :meth:`Collection.group_by<iterable_collections.collection.Collection.group_by>`.
+    """
+    @abstractmethod
+    def initial(self) -> Any:
+        """Returns the state of an empty iterable."""
+
+    @abstractmethod
+    def step(self, state: Any, x: Any) -> Any:
+        """
+        Returns ``state`` advanced by the element ``x``. The state may be modified in place.
+
+        Args:
+            state: A state returned by :meth:`initial`, :meth:`step` or :meth:`combine`.
+            x: The next element.
+
+        """
+
+    @abstractmethod
+    def combine(self, state: Any, other: Any) -> Any:
+        """
+        Returns the state of a partition followed by another partition.
+
+        Args:
+            state: The state of the first partition.
+            other: The state of the second partition.
+
+        """
+
+    def result(self, state: Any) -> Any:
+        """
+        Returns the value of ``state``. Returns ``state`` itself by default.
+
+        Args:
+            state: The final state.
+
+        """
+
+    def fold(self, iterable: Iterable) -> Any:
+        """
+        Returns the state after each element of ``iterable`` is passed to :meth:`step`.
+
+        Args:
+            iterable: The elements to fold.
+
+        """
+
+    def reduce(self, iterable: Iterable) -> Any:
+        """
+        Returns the :meth:`result` of :meth:`fold`.
+
+        Args:
+            iterable: The elements to reduce.
+
+        """
+
+
+class Aggregate(ReducerInterface):
+    """
+    Runs several reducers over the same elements at once. Its result is a :obj:`python:dict` of the result of each
+    reducer by its keyword.
+
+    Attributes:
+        reducers(:obj:`dict`): The reducers by name.
+    """
+    reducers: Dict[str, ReducerInterface] = ...
+    def __init__(self, **reducers: ReducerInterface) -> None:
+        """
+        Args:
+            **reducers: The reducers, by the name of their result.
+        """
+
+
+class Count(ReducerInterface):
+    """The number of elements."""
+
+
+class Sum(ReducerInterface):
+    """The sum of the elements, or of ``key`` of each element."""
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None, start: Any = 0) -> None:
+        """
+        Args:
+            key: A function of one argument returning the value to add.
+            start: The initial value, as with :func:`python:sum`.
+        """
+
+
+class Min(ReducerInterface):
+    """The smallest element, or the smallest ``key`` of the elements."""
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None, default: Any = None) -> None:
+        """
+        Args:
+            key: A function of one argument returning the value to compare.
+            default: The result for an empty iterable.
+        """
+
+
+class Max(Min):
+    """The largest element, or the largest ``key`` of the elements."""
+
+
+class Mean(ReducerInterface):
+    """The arithmetic mean of the elements, or of ``key`` of each element."""
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None, default: Any = None) -> None:
+        """
+        Args:
+            key: A function of one argument returning the value to average.
+            default: The result for an empty iterable.
+        """
+
+
+class Variance(ReducerInterface):
+    """
+    The variance of the elements, or of ``key`` of each element, computed with Welford's online algorithm. The
+    population variance by default; ``ddof=1`` gives the sample variance.
+    """
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None, ddof: int = 0, default: Any = None) -> None:
+        """
+        Args:
+            key: A function of one argument returning the value.
+            ddof: Delta degrees of freedom. The sum of squared deviations is divided by ``n - ddof``.
+            default: The result if there are no more than ``ddof`` elements.
+        """
+
+
+class First(ReducerInterface):
+    """The first element, or ``key`` of the first element."""
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None, default: Any = None) -> None:
+        """
+        Args:
+            key: A function of one argument applied to the element.
+            default: The result for an empty iterable.
+        """
+
+
+class Last(First):
+    """The last element, or ``key`` of the last element."""
+
+
+class ArgMin(ReducerInterface):
+    """The first element with the smallest ``key``."""
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None, default: Any = None) -> None:
+        """
+        Args:
+            key: A function of one argument returning the value to compare. The elements are compared if it isn't
+                given.
+            default: The result for an empty iterable.
+        """
+
+
+class ArgMax(ArgMin):
+    """The first element with the largest ``key``."""
+
+
+def aggregate(iterable: Iterable, /, **reducers: ReducerInterface) -> Dict[str, Any]:
+    """
+    Computes each of ``reducers`` over ``iterable`` in a single pass. Equivalent to::
+
+        Aggregate(**reducers).reduce(iterable)
+
+    ``iterable`` is positional only, so a reducer may be named ``iterable``. ``store`` and ``ret`` are taken by
+    :meth:`Collection.aggregate<iterable_collections.collection.Collection.aggregate>` and can't name a reducer.
+
+    Args:
+        iterable: The elements to reduce.
+        **reducers: The reducers, by the name of their result.
+
+    Raises:
+        TypeError: Raised if a reducer is named ``store`` or ``ret``.
+
+    """
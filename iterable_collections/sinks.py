@@ -0,0 +1,47 @@
+import csv
+import json
+from collections.abc import Mapping
+
+from iterable_collections.utils import batches
+
+_buffer_size = 1 << 20
+
+
+def _csv_writer(f, row, header, fmtparams):
+    if isinstance(row, Mapping):
+        fields = list(row) if header is True or not header else list(header)
+        writer = csv.DictWriter(f, fields, **fmtparams)
+        if header:
+            writer.writeheader()
+        return writer
+    writer = csv.writer(f, **fmtparams)
+    if header is True and hasattr(row, '_fields'):
+        writer.writerow(row._fields)
+    elif header and header is not True:
+        writer.writerow(header)
+    return writer
+
+
+def write_csv(iterable, path, header=True, encoding='utf-8', batch_size=1024, **fmtparams):
+    count = 0
+    with open(path, 'w', newline='', encoding=encoding, buffering=_buffer_size) as f:
+        writer = None
+        for batch in batches(iterable, batch_size):
+            if writer is None:
+                writer = _csv_writer(f, batch[0], header, fmtparams)
+            writer.writerows(batch)
+            count += len(batch)
+    return count
+
+
+def write_jsonl(iterable, path, encoding='utf-8', batch_size=1024, **kwargs):
+    encode = json.JSONEncoder(**kwargs).encode
+    count = 0
+    with open(path, 'w', encoding=encoding, buffering=_buffer_size) as f:
+        for batch in batches(iterable, batch_size):
+            if hasattr(batch[0], '_asdict'):
+                batch = [row._asdict() for row in batch]
+            f.write('\n'.join(map(encode, batch)))
+            f.write('\n')
+            count += len(batch)
+    return count
@@ -0,0 +1,52 @@
+import os
+from typing import Any, Iterable, Sequence, Union
+
+PathType = Union[str, bytes, os.PathLike]
+
+
+def write_csv(iterable: Iterable, path: PathType, header: Union[bool, Sequence[str]] = True, encoding: str = 'utf-8',
+              batch_size: int = 1024, **fmtparams: Any) -> int:
+    """
+    Writes the rows of ``iterable`` to a CSV file at ``path`` and returns the number of rows written. Rows are taken
+    from ``iterable`` ``batch_size`` at a time and passed to :meth:`csv.csvwriter.writerows`, through a 1 MiB write
+    buffer, so only one batch is held in memory.
+
+    The first row decides how rows are written. :obj:`Mappings<typing.Mapping>`, e.g. the rows of
+    :func:`collect_csv<iterable_collections.sources.collect_csv>`, are written with a :obj:`csv.DictWriter` whose
+    fields are ``header``, if it is a sequence, or the keys of the first row. Any other row is written as a sequence
+    of values; for :func:`namedtuples<collections.namedtuple>`, e.g.
+    :obj:`DictItem<iterable_collections.utils.DictItem>`, the header is the ``_fields`` of the first row.
+
+    Args:
+        iterable: The rows to write.
+        path: The path of the file, which is overwritten.
+        header: ``True`` to write a header row of the field names of the rows, if they have any, ``False`` to write
+            none, or the names of the fields.
+        encoding: The encoding of the file.
+        batch_size: The number of rows written at once.
+        **fmtparams: Passed to :func:`csv.writer`, e.g. ``delimiter``.
+
+    Raises:
+        ValueError: Raised if ``batch_size`` is less than 1.
+
+    """
+
+
+def write_jsonl(iterable: Iterable, path: PathType, encoding: str = 'utf-8', batch_size: int = 1024,
+                **kwargs: Any) -> int:
+    """
+    Writes each element of ``iterable`` to a line of the `JSON Lines <https://jsonlines.org/>`_ file at ``path`` and
+    returns the number of lines written. Elements are encoded ``batch_size`` at a time and each batch is written with
+    a single call, through a 1 MiB write buffer. :func:`namedtuples<collections.namedtuple>` are written as objects.
+
+    Args:
+        iterable: The elements to write.
+        path: The path of the file, which is overwritten.
+        encoding: The encoding of the file.
+        batch_size: The number of elements written at once.
+        **kwargs: Passed to :obj:`json.JSONEncoder`, e.g. ``sort_keys`` or ``default``.
+
+    Raises:
+        ValueError: Raised if ``batch_size`` is less than 1.
+
+    """
@@ -0,0 +1,190 @@
+import csv
+import itertools
+import json
+import mmap
+import operator
+import struct
+from collections import namedtuple
+from collections.abc import Iterable, Sequence
+
+from iterable_collections.collection import collect
+from iterable_collections.utils import SequenceView, batches
+
+_block_size = 1 << 20
+_decoder = json.JSONDecoder()
+
+
+def map_file(path):
+    with open(path, 'rb') as f:
+        try:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except ValueError:
+            if f.seek(0, 2):
+                raise
+            return memoryview(b'')
+
+
+class MappedLines(Iterable):
+    def __init__(self, buffer, encoding=None, keepends=False):
+        self.buffer = buffer
+        self.encoding = encoding
+        self.keepends = keepends
+
+    def __iter__(self):
+        buffer = self.buffer
+        end = len(buffer)
+        start = 0
+        while start < end:
+            block = buffer[start:start + _block_size].tobytes()
+            size = block.rfind(b'\n') + 1
+            if not size:
+                pieces = [block]
+                position = start + len(block)
+                while position < end and b'\n' not in pieces[-1]:
+                    pieces.append(buffer[position:position + _block_size].tobytes())
+                    position += len(pieces[-1])
+                block = b''.join(pieces)
+                size = block.rfind(b'\n') + 1
+            yield from self._lines(block[:size] if size else block, start)
+            start += size or len(block)
+
+    def __len__(self):
+        buffer = self.buffer
+        count = sum(
+            buffer[x:x + _block_size].tobytes().count(b'\n') for x in range(0, len(buffer), _block_size)
+        )
+        return count + 1 if buffer and buffer[-1] != ord('\n') else count
+
+    def __repr__(self):
+        return 'MappedLines({} bytes)'.format(len(self.buffer))
+
+    def _lines(self, block, offset):
+        ended = block.endswith(b'\n')
+        if self.encoding is not None:
+            lines = block.decode(self.encoding).split('\n')
+            if ended:
+                lines.pop()
+            if self.keepends:
+                lines = [line + '\n' for line in lines]
+                if not ended:
+                    lines[-1] = lines[-1][:-1]
+            return lines
+        parts = block.split(b'\n')
+        if ended:
+            parts.pop()
+        bounds = list(itertools.accumulate(map((1).__add__, map(len, parts)), initial=offset))
+        stops = map(operator.sub, bounds[1:], itertools.repeat(0 if self.keepends else 1))
+        return map(self.buffer.__getitem__, map(slice, bounds, stops))
+
+
+class MappedRecords(Sequence):
+    def __init__(self, buffer, struct_fmt, unpack=True):
+        self.buffer = buffer
+        self.struct = struct.Struct(struct_fmt)
+        self.unpack = unpack
+        if len(buffer) % self.struct.size:
+            raise ValueError('The buffer size is not a multiple of the record size {}.'.format(self.struct.size))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SequenceView(self, index.start, index.stop, index.step)
+        offset = range(0, len(self.buffer), self.struct.size)[index]
+        if self.unpack:
+            return self.struct.unpack_from(self.buffer, offset)
+        return self.buffer[offset:offset + self.struct.size]
+
+    def __iter__(self):
+        if self.unpack:
+            return self.struct.iter_unpack(self.buffer)
+        return super().__iter__()
+
+    def __len__(self):
+        return len(self.buffer) // self.struct.size
+
+    def __repr__(self):
+        return 'MappedRecords({!r}, {} records)'.format(self.struct.format, len(self))
+
+
+class CsvRows(Iterable):
+    def __init__(self, path, header=True, namedtuples=False, encoding='utf-8', batch_size=1024, **fmtparams):
+        if namedtuples and not header:
+            raise ValueError('namedtuples requires a header.')
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1.')
+        self.path = path
+        self.header = header
+        self.namedtuples = namedtuples
+        self.encoding = encoding
+        self.batch_size = batch_size
+        self.fmtparams = fmtparams
+
+    def __iter__(self):
+        with open(self.path, newline='', encoding=self.encoding, buffering=_block_size) as f:
+            reader = csv.reader(f, **self.fmtparams)
+            fields = self.header
+            if fields is True:
+                fields = next(reader, None)
+                if fields is None:
+                    return
+            make = self._row_factory(fields)
+            for batch in batches(reader, self.batch_size):
+                yield from batch if make is None else map(make, batch)
+
+    def __repr__(self):
+        return 'CsvRows({!r})'.format(self.path)
+
+    def _row_factory(self, fields):
+        if not fields:
+            return None
+        if self.namedtuples:
+            return namedtuple('Row', fields, rename=True)._make
+        fields = tuple(fields)
+        return lambda row: dict(zip(fields, row))
+
+
+class JsonLines(Iterable):
+    def __init__(self, path, namedtuples=False, encoding='utf-8', batch_size=1024):
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1.')
+        self.path = path
+        self.namedtuples = namedtuples
+        self.encoding = encoding
+        self.batch_size = batch_size
+
+    def __iter__(self):
+        with open(self.path, encoding=self.encoding, buffering=_block_size) as f:
+            row_type = None
+            for batch in batches(f, self.batch_size):
+                records = self._decode(batch)
+                if self.namedtuples and records:
+                    if row_type is None:
+                        row_type = namedtuple('Row', records[0])
+                    records = [row_type(**record) for record in records]
+                yield from records
+
+    def __repr__(self):
+        return 'JsonLines({!r})'.format(self.path)
+
+    def _decode(self, lines):
+        decode = _decoder.decode
+        return [decode(line) for line in lines if not line.isspace()]
+
+
+def collect_csv(path, header=True, namedtuples=False, encoding='utf-8', batch_size=1024, lazy=False, **fmtparams):
+    return collect(CsvRows(path, header, namedtuples, encoding, batch_size, **fmtparams), lazy)
+
+
+def collect_jsonl(path, namedtuples=False, encoding='utf-8', batch_size=1024, lazy=False):
+    return collect(JsonLines(path, namedtuples, encoding, batch_size), lazy)
+
+
+def collect_lines(path, encoding=None, keepends=False, lazy=False):
+    return collect(MappedLines(map_file(path), encoding, keepends), lazy)
+
+
+def collect_mmap(path, lazy=False):
+    return collect(SequenceView(map_file(path)), lazy)
+
+
+def collect_records(path, struct_fmt, unpack=True, lazy=False):
+    return collect(SequenceView(MappedRecords(map_file(path), struct_fmt, unpack)), lazy)
@@ -0,0 +1,227 @@
+import os
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from iterable_collections.collection import Collection, LazyCollection
+
+PathType = Union[str, bytes, os.PathLike]
+
+
+def map_file(path: PathType) -> memoryview:
+    """
+    Maps the file at ``path`` into memory read only and returns a :obj:`python:memoryview` of it. Pages are read from
+    the file as they are accessed rather than up front. An empty file, which can't be mapped, returns an empty
+    :obj:`python:memoryview`. The mapping is released once no view of it is referenced anymore.
+
+    Args:
+        path: The path of the file.
+
+    """
+
+
+class MappedLines(Iterable):
+    """
+    Iterates over the lines of a buffer, separated by ``b'\\n'``, as :obj:`memoryview<python:memoryview>` slices of
+    it, so no line is copied. A final line without a line break is included. The lines are found again each time the
+    object is iterated over, and :func:`python:len` counts them in a pass over the buffer.
+
+    Attributes:
+        buffer(:obj:`python:memoryview`): The buffer, e.g. returned by :func:`map_file`.
+        encoding(:obj:`Optional[str]<typing.Optional>`): If given, each line is decoded to a :obj:`python:str`.
+        keepends(:obj:`bool`): Include the line break at the end of each line.
+    """
+    def __init__(self, buffer: memoryview, encoding: Optional[str] = None, keepends: bool = False) -> None:
+        ...
+
+    def __iter__(self) -> Iterator[Union[memoryview, str]]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+
+class MappedRecords(Sequence):
+    """
+    A sequence of the fixed size records of a buffer. Each record is unpacked to a :obj:`python:tuple` with
+    ``struct_fmt``, as with :func:`struct.unpack_from`, or, if ``unpack`` is ``False``, is a
+    :obj:`memoryview<python:memoryview>` slice of the buffer. Records are read when they are accessed; iterating over
+    all of them uses :func:`struct.iter_unpack`. Slicing returns a
+    :obj:`SequenceView<iterable_collections.utils.SequenceView>`.
+
+    Attributes:
+        buffer(:obj:`python:memoryview`): The buffer, e.g. returned by :func:`map_file`.
+        struct(:obj:`struct.Struct`): The compiled ``struct_fmt``.
+        unpack(:obj:`bool`): Unpack each record.
+    """
+    def __init__(self, buffer: memoryview, struct_fmt: str, unpack: bool = True) -> None:
+        """
+        Args:
+            buffer: The buffer, e.g. returned by :func:`map_file`.
+            struct_fmt: A :mod:`struct` format describing one record, e.g. ``'<qd'``.
+            unpack: Unpack each record.
+
+        Raises:
+            ValueError: Raised if the size of ``buffer`` is not a multiple of the size of a record.
+
+        """
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple, memoryview, Sequence]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+
+class CsvRows(Iterable):
+    """
+    Iterates over the rows of the CSV file at ``path``. The file is opened again each time the object is iterated
+    over and read through a 1 MiB buffer; rows are decoded ``batch_size`` at a time, so the file is never held in
+    memory. Rows are :obj:`dicts<python:dict>` keyed by the field names of the header, or
+    :func:`namedtuples<collections.namedtuple>` with those fields if ``namedtuples`` is ``True``, as
+    :obj:`DictItem<iterable_collections.utils.DictItem>` is for items. Without a header, rows are lists of strings.
+
+    Attributes:
+        path(:obj:`str`): The path of the file.
+        header(:obj:`Union[bool, Sequence[str]]<typing.Union>`): ``True`` if the first row holds the field names,
+            ``False`` if the file has no header, or the field names of a file without a header.
+        namedtuples(:obj:`bool`): Return rows as :func:`namedtuples<collections.namedtuple>`. Invalid field names
+            are renamed as with ``rename=True``.
+        encoding(:obj:`str`): The encoding of the file.
+        batch_size(:obj:`int`): The number of rows decoded at once.
+        fmtparams(:obj:`dict`): Passed to :func:`csv.reader`, e.g. ``delimiter``.
+    """
+    def __init__(self, path: PathType, header: Union[bool, Sequence[str]] = True, namedtuples: bool = False,
+                 encoding: str = 'utf-8', batch_size: int = 1024, **fmtparams: Any) -> None:
+        """
+        Raises:
+            ValueError: Raised if ``namedtuples`` is ``True`` without a ``header`` or if ``batch_size`` is less than
+                1.
+
+        """
+
+    def __iter__(self) -> Iterator[Union[Dict[str, str], NamedTuple, List[str]]]:
+        ...
+
+
+class JsonLines(Iterable):
+    """
+    Iterates over the values of the `JSON Lines <https://jsonlines.org/>`_ file at ``path``, skipping blank lines. The
+    file is opened again each time the object is iterated over and read through a 1 MiB buffer. Lines are read
+    ``batch_size`` at a time and each is decoded on its own with a shared :obj:`JSONDecoder<json.JSONDecoder>`, so a
+    line which doesn't hold exactly one value raises :obj:`JSONDecodeError<json.JSONDecodeError>`.
+
+    Attributes:
+        path(:obj:`str`): The path of the file.
+        namedtuples(:obj:`bool`): Return each object as a :func:`namedtuple<collections.namedtuple>` with the keys
+            of the first object as its fields.
+        encoding(:obj:`str`): The encoding of the file.
+        batch_size(:obj:`int`): The number of lines read at once.
+    """
+    def __init__(self, path: PathType, namedtuples: bool = False, encoding: str = 'utf-8',
+                 batch_size: int = 1024) -> None:
+        """
+        Raises:
+            ValueError: Raised if ``batch_size`` is less than 1.
+
+        """
+
+    def __iter__(self) -> Iterator[Any]:
+        ...
+
+
+def collect_csv(path: PathType, header: Union[bool, Sequence[str]] = True, namedtuples: bool = False,
+                encoding: str = 'utf-8', batch_size: int = 1024, lazy: bool = False,
+                **fmtparams: Any) -> Union[Collection, LazyCollection]:
+    """
+    Returns a :obj:`Collection<iterable_collections.collection.Collection>` of the rows of the CSV file at ``path``,
+    read lazily by :obj:`CsvRows`::
+
+        collect_csv('orders.csv', namedtuples=True).filter(lambda row: row.status == 'open').to_csv('open.csv')
+
+    Args:
+        path: The path of the file.
+        header: ``True`` if the first row holds the field names, ``False`` if the file has no header, or the field
+            names of a file without a header.
+        namedtuples: Return rows as :func:`namedtuples<collections.namedtuple>` rather than
+            :obj:`dicts<python:dict>`.
+        encoding: The encoding of the file.
+        batch_size: The number of rows decoded at once.
+        lazy: Return a :obj:`LazyCollection<iterable_collections.collection.LazyCollection>`.
+        **fmtparams: Passed to :func:`csv.reader`, e.g. ``delimiter``.
+
+    Raises:
+        ValueError: Raised if ``namedtuples`` is ``True`` without a ``header`` or if ``batch_size`` is less than 1.
+
+    """
+
+
+def collect_jsonl(path: PathType, namedtuples: bool = False, encoding: str = 'utf-8', batch_size: int = 1024,
+                  lazy: bool = False) -> Union[Collection, LazyCollection]:
+    """
+    Returns a :obj:`Collection<iterable_collections.collection.Collection>` of the values of the
+    `JSON Lines <https://jsonlines.org/>`_ file at ``path``, read lazily by :obj:`JsonLines`.
+
+    Args:
+        path: The path of the file.
+        namedtuples: Return each object as a :func:`namedtuple<collections.namedtuple>`.
+        encoding: The encoding of the file.
+        batch_size: The number of lines read at once.
+        lazy: Return a :obj:`LazyCollection<iterable_collections.collection.LazyCollection>`.
+
+    Raises:
+        ValueError: Raised if ``batch_size`` is less than 1.
+
+    """
+
+
+def collect_lines(path: PathType, encoding: Optional[str] = None, keepends: bool = False,
+                  lazy: bool = False) -> Union[Collection, LazyCollection]:
+    """
+    Returns a :obj:`Collection<iterable_collections.collection.Collection>` of the lines of the file at ``path``.
+    The file is mapped with :func:`map_file` and its lines are yielded lazily by :obj:`MappedLines`, so methods such
+    as ``filter``, ``map`` and ``chunks`` stream over it and ``len`` counts its lines without reading it into a list::
+
+        collect_lines('app.log', 'utf-8').filter(lambda line: 'ERROR' in line).chunks(1000)
+
+    Args:
+        path: The path of the file.
+        encoding: If given, each line is decoded to a :obj:`python:str`. Lines are
+            :obj:`memoryviews<python:memoryview>` otherwise.
+        keepends: Include the line break at the end of each line.
+        lazy: Return a :obj:`LazyCollection<iterable_collections.collection.LazyCollection>`.
+
+    """
+
+
+def collect_mmap(path: PathType, lazy: bool = False) -> Union[Collection, LazyCollection]:
+    """
+    Returns a :obj:`Collection<iterable_collections.collection.Collection>` of the bytes of the file at ``path``, as a
+    :obj:`SequenceView<iterable_collections.utils.SequenceView>` of the :obj:`python:memoryview` returned by
+    :func:`map_file`. ``slice`` and ``chunks`` then return views of the mapping without copying it::
+
+        collect_mmap('data.bin').slice(512).chunks(4096, None)
+
+    Args:
+        path: The path of the file.
+        lazy: Return a :obj:`LazyCollection<iterable_collections.collection.LazyCollection>`.
+
+    """
+
+
+def collect_records(path: PathType, struct_fmt: str, unpack: bool = True,
+                    lazy: bool = False) -> Union[Collection, LazyCollection]:
+    """
+    Returns a :obj:`Collection<iterable_collections.collection.Collection>` of the fixed size records of the file at
+    ``path``, as a :obj:`SequenceView<iterable_collections.utils.SequenceView>` of :obj:`MappedRecords`. Records are
+    unpacked as they are read, and ``slice`` and ``chunks`` return views without reading any record.
+
+    Args:
+        path: The path of the file.
+        struct_fmt: A :mod:`struct` format describing one record, e.g. ``'<qd'``.
+        unpack: Unpack each record to a :obj:`python:tuple`. Records are
+            :obj:`memoryviews<python:memoryview>` of the mapping otherwise.
+        lazy: Return a :obj:`LazyCollection<iterable_collections.collection.LazyCollection>`.
+
+    Raises:
+        ValueError: Raised if the size of the file is not a multiple of the size of a record.
+
+    """
@@ -1,18 +1,43 @@
+import functools
+import inspect
 import operator
+import os
+import sys
+import time
+import tracemalloc
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError, as_completed, \
+    wait
 from functools import partial
+from types import MethodType
 from collections.abc import Iterable,  Mapping, Set, Sequence, MappingView, Iterator
 
 import itertools
 
-from iterable_collections.utils import rpartial, partial_at_position, safe_call
+from iterable_collections.reducers import Count, Max, Min, ReducerInterface, Sum
+from iterable_collections.utils import rpartial, partial_at_position, safe_call, async_safe_call, BloomFilter, \
+    SequenceView
 
 
 class MethodStrategyInterface(ABC):
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return self.make_method(instance)
+
     @abstractmethod
     def make_method(self, instance):
         raise NotImplementedError
 
+    def compile(self):
+        make_method = self.make_method
+
+        def method(instance, *args, **kwargs):
+            return make_method(instance)(*args, **kwargs)
+
+        return method
+
 
 class ResultStrategyInterface(ABC):
     @abstractmethod
@@ -54,6 +79,20 @@ class ErrorHandlingStrategyInterface(ABC):
         raise NotImplementedError
 
 
+class ProfilingHookInterface(ABC):
+    phases = ('pre_process', 'format', 'call', 'store')
+
+    @abstractmethod
+    def record(self, name, timings, input_size, output_size):
+        raise NotImplementedError
+
+
+class MaterialisationHookInterface(ABC):
+    @abstractmethod
+    def record(self, method, operation, size, nbytes):
+        raise NotImplementedError
+
+
 class BaseExceptionErrorHandlingStrategy(ErrorHandlingStrategyInterface):
     def get_error(self):
         return BaseException
@@ -149,7 +188,38 @@ class PreProcessingStrategy(PreProcessingStrategyInterface):
 
     def pre_process(self, instance):
         for operation in self.operations:
-            getattr(instance, operation.get('name'))(*operation.get('args', ()), **operation.get('kwargs', {}))
+            unless = operation.get('unless')
+            if unless and isinstance(instance.iterable, unless):
+                continue
+            self._apply(instance, operation)
+
+    def _apply(self, instance, operation):
+        getattr(instance, operation.get('name'))(*operation.get('args', ()), **operation.get('kwargs', {}))
+
+
+class TrackingPreProcessingStrategy(PreProcessingStrategy):
+    copying = ('dict', 'list', 'list_', 'nt_items', 'set', 'tuple')
+
+    def __init__(self, operations=(), method=None, tracker=None):
+        super().__init__(operations)
+        self.method = method
+        self.tracker = tracker
+
+    def _apply(self, instance, operation):
+        if operation.get('name') not in self.copying:
+            return super()._apply(instance, operation)
+        previous = instance.iterable
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            start = tracemalloc.get_traced_memory()[0]
+        super()._apply(instance, operation)
+        iterable = instance.iterable
+        if tracing:
+            nbytes = max(0, tracemalloc.get_traced_memory()[0] - start)
+        else:
+            nbytes = sys.getsizeof(iterable)
+        del previous
+        self.tracker.record(self.method, operation.get('name'), _size(iterable), nbytes)
 
 
 class UnformattedArgumentFormattingStrategy(ArgumentFormattingStrategyInterface):
@@ -234,7 +304,31 @@ class SpreadTupleParameterArgumentFormattingStrategy(ArgumentFormattingStrategyI
         ), kwargs
 
 
+class SpreadTupleKeywordArgumentFormattingStrategy(ArgumentFormattingStrategyInterface):
+    def __init__(self, keyword='key', position=None):
+        self.keyword = keyword
+        self.position = position
+
+    def _spread(self, func):
+        return None if func is None else lambda x: func(*x)
+
+    def format(self, *args, **kwargs):
+        if self.keyword in kwargs:
+            kwargs = dict(kwargs, **{self.keyword: self._spread(kwargs[self.keyword])})
+        elif self.position is not None and len(args) > self.position:
+            args = (*args[:self.position], self._spread(args[self.position]), *args[self.position + 1:])
+        return args, kwargs
+
+
+def _size(iterable):
+    if isinstance(iterable, (Sequence, Set, Mapping, MappingView)):
+        return len(iterable)
+    return None
+
+
 class MethodStrategy(MethodStrategyInterface):
+    profiling_hook = None
+
     def __init__(
             self,
             name,
@@ -256,22 +350,159 @@ class MethodStrategy(MethodStrategyInterface):
         self.pre_process_strategy = pre_process_strategy
         self.error_strategy = error_strategy
 
-    def make_method(self, instance):
-
-        def call(*args, store=None, ret=None, **kwargs):
-            self.pre_process_strategy.pre_process(instance)
-            formatted_args, formatted_kwargs = self.argument_formatting_strategy.format(*args, **kwargs)
-            result = safe_call(
-                partial(
-                    self.iterable_binding_strategy.bind(self.callable, instance),
-                    *formatted_args,
-                    **formatted_kwargs
-                ), self.error_strategy
-            )
-            instance._iterable = self.result_strategy.handle_result(result, instance.iterable, store)
-            return self.return_strategy.return_value(instance, result, ret)
+    def __call__(self, instance, *args, store=None, ret=None, **kwargs):
+        if self.profiling_hook is not None:
+            return self._profiled_call(instance, args, kwargs, store, ret)
+        self.pre_process_strategy.pre_process(instance)
+        formatted_args, formatted_kwargs = self.argument_formatting_strategy.format(*args, **kwargs)
+        result = safe_call(
+            self.iterable_binding_strategy.bind(self.callable, instance),
+            self.error_strategy,
+            *formatted_args,
+            **formatted_kwargs
+        )
+        instance._iterable = self.result_strategy.handle_result(result, instance.iterable, store)
+        return self.return_strategy.return_value(instance, result, ret)
+
+    def _profiled_call(self, instance, args, kwargs, store, ret):
+        clock = time.perf_counter
+        input_size = _size(instance.iterable)
+        t0 = clock()
+        self.pre_process_strategy.pre_process(instance)
+        t1 = clock()
+        formatted_args, formatted_kwargs = self.argument_formatting_strategy.format(*args, **kwargs)
+        t2 = clock()
+        result = safe_call(
+            self.iterable_binding_strategy.bind(self.callable, instance),
+            self.error_strategy,
+            *formatted_args,
+            **formatted_kwargs
+        )
+        t3 = clock()
+        instance._iterable = self.result_strategy.handle_result(result, instance.iterable, store)
+        self.profiling_hook.record(self.name, (t1 - t0, t2 - t1, t3 - t2, clock() - t3), input_size, _size(result))
+        return self.return_strategy.return_value(instance, result, ret)
 
-        return call
+    def make_method(self, instance):
+        return MethodType(self, instance)
+
+    def compile(self):
+        namespace = {
+            'func': self.callable,
+            'pre_process': self.pre_process_strategy.pre_process,
+            'format': self.argument_formatting_strategy.format,
+            'bind': self.iterable_binding_strategy.bind,
+            'handle_error': self.error_strategy.handle,
+            'error': self.error_strategy.get_error(),
+            'handle_result': self.result_strategy.handle_result,
+            'return_value': self.return_strategy.return_value,
+        }
+        phases = [self._compile_pre_process(), self._compile_format(), self._compile_call(), self._compile_result()]
+        if self.profiling_hook is not None:
+            namespace.update(clock=time.perf_counter, size=_size, record=self.profiling_hook.record, name=self.name)
+            phases = self._compile_profiling(*phases)
+        lines = [
+            'def method(instance, *args, store=None, ret=None, **kwargs):',
+            *itertools.chain.from_iterable(phases),
+            *self._compile_return()
+        ]
+        # The source is assembled only from the literal templates of the _compile_* methods and the int position of
+        # PartialAtPositionIterableBindingStrategy. Strategy and method names, arguments and callables never reach
+        # it; callables are passed through namespace. A closure per combination of phases would add a call per phase.
+        exec('\n'.join(lines), namespace)  # nosec B102
+        method = namespace['method']
+        method.__name__ = method.__qualname__ = self.name
+        return method
+
+    def _compile_profiling(self, pre_process, format_, call, result):
+        return [
+            ['    input_size = size(instance.iterable)', '    t0 = clock()'],
+            pre_process,
+            ['    t1 = clock()'],
+            format_,
+            ['    t2 = clock()'],
+            call,
+            ['    t3 = clock()'],
+            result,
+            ['    record(name, (t1 - t0, t2 - t1, t3 - t2, clock() - t3), input_size, size(result))']
+        ]
+
+    def _compile_pre_process(self):
+        if type(self.pre_process_strategy) is PreProcessingStrategy and not self.pre_process_strategy.operations:
+            return []
+        return ['    pre_process(instance)']
+
+    def _compile_format(self):
+        if type(self.argument_formatting_strategy) is UnformattedArgumentFormattingStrategy:
+            return []
+        return ['    args, kwargs = format(*args, **kwargs)']
+
+    def _compile_bound_call(self):
+        binding = self.iterable_binding_strategy
+        if type(binding) is PartialIterableBindingStrategy:
+            return 'func(instance.iterable, *args, **kwargs)'
+        if type(binding) is PartialInstanceBindingStrategy:
+            return 'func(instance, *args, **kwargs)'
+        if type(binding) is RightPartialIterableBindingStrategy:
+            return 'func(*args, instance.iterable, **kwargs)'
+        if type(binding) is PartialAtPositionIterableBindingStrategy:
+            return 'func(*args[:{0}], instance.iterable, *args[{0}:], **kwargs)'.format(int(binding.position))
+        return None
+
+    def _compile_call(self):
+        lines = []
+        call = self._compile_bound_call()
+        if call is None:
+            lines.append('    bound = bind(func, instance)')
+            call = 'bound(*args, **kwargs)'
+        if type(self.error_strategy) is BaseExceptionErrorHandlingStrategy:
+            return lines + ['    result = ' + call]
+        return lines + [
+            '    try:',
+            '        result = ' + call,
+            '    except error as e:',
+            '        raise handle_error(e)'
+        ]
+
+    def _compile_result(self):
+        if type(self.result_strategy) is StoreResultStrategy:
+            return ['    if store is not False:', '        instance._iterable = result']
+        if type(self.result_strategy) is StoreIterableStrategy:
+            return ['    if store is True:', '        instance._iterable = result']
+        return ['    instance._iterable = handle_result(result, instance.iterable, store)']
+
+    def _compile_return(self):
+        if type(self.return_strategy) is ReturnInstanceStrategy:
+            return ['    return result if ret is True else instance']
+        if type(self.return_strategy) is ReturnResultStrategy:
+            return ['    return instance if ret is False else result']
+        return ['    return return_value(instance, result, ret)']
+
+
+class AsyncMethodStrategy(MethodStrategy):
+    def __init__(
+            self,
+            name,
+            callable_,
+            result_strategy,
+            return_strategy,
+            iterable_binding_strategy,
+            argument_formatting_strategy,
+            pre_process_strategy,
+            error_strategy
+    ):
+        if inspect.iscoroutinefunction(callable_):
+            callable_ = partial(async_safe_call, callable_, error_strategy)
+        super().__init__(
+            name,
+            callable_,
+            result_strategy,
+            return_strategy,
+            iterable_binding_strategy,
+            argument_formatting_strategy,
+            pre_process_strategy,
+            error_strategy
+        )
 
 
 class ConcatMethodStrategy(MethodStrategy):
@@ -374,11 +605,17 @@ class FlattenMethodStrategy(MethodStrategy):
             error_strategy
         )
 
-    def flatten(self, iterable):
-        flat_list = []
-        for i in iterable:
-            flat_list += self.flatten(list(i)) if isinstance(i, Sequence) and not isinstance(i, (str, bytes)) else [i]
-        return flat_list
+    def flatten(self, iterable, depth=None, atomic=()):
+        atomic = (str, bytes, *atomic)
+        stack = [iter(iterable)]
+        while stack:
+            for i in stack[-1]:
+                if isinstance(i, Sequence) and not isinstance(i, atomic) and (depth is None or len(stack) <= depth):
+                    stack.append(iter(i))
+                    break
+                yield i
+            else:
+                stack.pop()
 
 
 class IntersectMethodStrategy(MethodStrategy):
@@ -465,22 +702,363 @@ class ChunksMethodStrategy(MethodStrategy):
             error_strategy
         )
 
-    def chunks(self, instance, length):
-        if isinstance(instance.iterable, (Set, Sequence, MappingView, Iterator)):
-            instance.chunks_seq(length)
+    def chunks(self, instance, length, container=list):
         if isinstance(instance.iterable, Mapping):
-            instance.chunks_dict(length)
+            instance.chunks_dict(length, container)
+        elif isinstance(instance.iterable, (Set, Sequence, MappingView)):
+            instance.chunks_seq(length, container)
+        else:
+            instance.chunks_iter(length, container)
         return instance.iterable
 
-    def _chunks(self, iterable, length):
+    def _check_length(self, length):
+        if length < 1:
+            raise ValueError('length must be at least 1.')
+
+    def _chunks(self, iterable, length, container):
         for x in range(0, len(iterable), length):
-            yield iterable[x:x + length]
+            if container is None:
+                yield SequenceView(iterable, x, x + length)
+            elif container is list:
+                yield iterable[x:x + length]
+            else:
+                yield container(iterable[x:x + length])
+
+    def _chunks_iter(self, iterable, length, container):
+        iterator = iter(iterable)
+        if container is None:
+            yield from self._chunk_views(iterator, length)
+            return
+        for first in iterator:
+            yield container(itertools.chain((first,), itertools.islice(iterator, length - 1)))
+
+    def _chunk_views(self, iterator, length):
+        chunk = None
+        while True:
+            if chunk is not None:
+                deque(chunk, maxlen=0)
+            try:
+                first = next(iterator)
+            except StopIteration:
+                return
+            chunk = itertools.islice(itertools.chain((first,), iterator), length)
+            yield chunk
+
+    def chunks_dict(self, iterable, length, container=list):
+        self._check_length(length)
+        return self._chunks_iter(iterable, length, container)
+
+    def chunks_iter(self, iterable, length, container=list):
+        self._check_length(length)
+        return self._chunks_iter(iterable, length, container)
+
+    def chunks_seq(self, iterable, length, container=list):
+        self._check_length(length)
+        return list(self._chunks(iterable, length, container))
+
+
+_missing = object()
+
+
+def _partition(items, length):
+    iterator = iter(items)
+    return iter(lambda: list(itertools.islice(iterator, length)), [])
+
+
+def _map_chunk(func, chunk):
+    return list(map(func, chunk))
+
+
+def _filter_chunk(func, chunk):
+    return list(filter(func, chunk))
+
+
+def _reduce_chunk(func, chunk):
+    return functools.reduce(func, chunk)
+
+
+class GroupByMethodStrategy(MethodStrategy):
+    reducers = {
+        'count': Count(),
+        'max': Max(),
+        'min': Min(),
+        'sum': Sum(),
+    }
+
+    def __init__(
+            self,
+            name,
+            result_strategy,
+            return_strategy,
+            iterable_binding_strategy,
+            argument_formatting_strategy,
+            pre_process_strategy,
+            error_strategy
+    ):
+        super().__init__(
+            name,
+            self.group_by,
+            result_strategy,
+            return_strategy,
+            iterable_binding_strategy,
+            argument_formatting_strategy,
+            pre_process_strategy,
+            error_strategy
+        )
 
-    def chunks_dict(self, iterable, length):
-        return list(self._chunks(iterable, length))
+    def group_by(self, iterable, key=None, reducer=None, initializer=_missing):
+        if isinstance(reducer, str):
+            if reducer not in self.reducers:
+                raise ValueError('Unknown reducer {}.'.format(reducer))
+            reducer = self.reducers[reducer]
+            if initializer is not _missing:
+                return self._aggregate(iterable, key, reducer, lambda: initializer)
+        if reducer is None:
+            return self._group(iterable, key)
+        if isinstance(reducer, ReducerInterface):
+            return self._aggregate(iterable, key, reducer, reducer.initial)
+        return self._reduce(iterable, key, reducer, initializer)
+
+    def _aggregate(self, iterable, key, reducer, initial):
+        groups = {}
+        step = reducer.step
+        for x in iterable:
+            k = x if key is None else key(x)
+            groups[k] = step(groups[k] if k in groups else initial(), x)
+        return {k: reducer.result(state) for k, state in groups.items()}
+
+    def _group(self, iterable, key):
+        groups = {}
+        get = groups.get
+        for x in iterable:
+            k = x if key is None else key(x)
+            group = get(k)
+            if group is None:
+                groups[k] = [x]
+            else:
+                group.append(x)
+        return groups
+
+    def _reduce(self, iterable, key, reducer, initializer):
+        groups = {}
+        for x in iterable:
+            k = x if key is None else key(x)
+            if k in groups:
+                groups[k] = reducer(groups[k], x)
+            else:
+                groups[k] = x if initializer is _missing else reducer(initializer, x)
+        return groups
+
+
+class UniqueMethodStrategy(MethodStrategy):
+    def __init__(
+            self,
+            name,
+            result_strategy,
+            return_strategy,
+            iterable_binding_strategy,
+            argument_formatting_strategy,
+            pre_process_strategy,
+            error_strategy
+    ):
+        super().__init__(
+            name,
+            self.unique,
+            result_strategy,
+            return_strategy,
+            iterable_binding_strategy,
+            argument_formatting_strategy,
+            pre_process_strategy,
+            error_strategy
+        )
+
+    def unique(self, iterable, key=None, window=None, capacity=None, error_rate=0.01):
+        if window is not None and capacity is not None:
+            raise ValueError('Only one of window and capacity may be given.')
+        if window is not None:
+            if window < 1:
+                raise ValueError('window must be at least 1.')
+            return self._unique_window(iterable, key, window)
+        if capacity is not None:
+            return self._unique_bloom(iterable, key, BloomFilter(capacity, error_rate))
+        return self._unique(iterable, key)
+
+    def _unique(self, iterable, key):
+        seen = set()
+        add = seen.add
+        for x in iterable:
+            k = x if key is None else key(x)
+            if k not in seen:
+                add(k)
+                yield x
+
+    def _unique_bloom(self, iterable, key, seen):
+        add = seen.add
+        for x in iterable:
+            if add(x if key is None else key(x)):
+                yield x
+
+    def _unique_window(self, iterable, key, window):
+        seen = OrderedDict()
+        for x in iterable:
+            k = x if key is None else key(x)
+            if k in seen:
+                seen.move_to_end(k)
+                continue
+            seen[k] = None
+            if len(seen) > window:
+                seen.popitem(last=False)
+            yield x
+
+
+class ParallelMethodStrategy(MethodStrategy):
+    def __init__(
+            self,
+            name,
+            result_strategy,
+            return_strategy,
+            iterable_binding_strategy,
+            argument_formatting_strategy,
+            pre_process_strategy,
+            error_strategy
+    ):
+        super().__init__(
+            name,
+            getattr(self, name),
+            result_strategy,
+            return_strategy,
+            iterable_binding_strategy,
+            argument_formatting_strategy,
+            pre_process_strategy,
+            error_strategy
+        )
 
-    def chunks_iter(self, iterable, length):
-        return list(self._chunks(iterable, length))
+    def pfilter(self, iterable, func, workers=None, chunksize=1, ordered=True):
+        items = list(iterable)
+        with ProcessPoolExecutor(workers) as executor:
+            if ordered:
+                return list(itertools.compress(items, executor.map(func, items, chunksize=chunksize)))
+            return self._unordered(executor, _filter_chunk, func, items, chunksize)
+
+    def pmap(self, iterable, func, workers=None, chunksize=1, ordered=True):
+        with ProcessPoolExecutor(workers) as executor:
+            if ordered:
+                return list(executor.map(func, iterable, chunksize=chunksize))
+            return self._unordered(executor, _map_chunk, func, iterable, chunksize)
+
+    def preduce(self, iterable, func, initializer=_missing, workers=None, chunksize=None):
+        items = list(iterable) if initializer is _missing else [initializer, *iterable]
+        if len(items) < 2:
+            return functools.reduce(func, items)
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(2, chunksize or -(-len(items) // workers))
+        with ProcessPoolExecutor(workers) as executor:
+            while len(items) > 1:
+                items = list(executor.map(_reduce_chunk, itertools.repeat(func), _partition(items, chunksize)))
+        return items[0]
+
+    def _unordered(self, executor, helper, func, iterable, chunksize):
+        futures = [executor.submit(helper, func, chunk) for chunk in _partition(iterable, chunksize)]
+        return list(itertools.chain.from_iterable(f.result() for f in as_completed(futures)))
+
+
+class ThreadedMethodStrategy(MethodStrategy):
+    def __init__(
+            self,
+            name,
+            result_strategy,
+            return_strategy,
+            iterable_binding_strategy,
+            argument_formatting_strategy,
+            pre_process_strategy,
+            error_strategy
+    ):
+        super().__init__(
+            name,
+            getattr(self, name),
+            result_strategy,
+            return_strategy,
+            iterable_binding_strategy,
+            argument_formatting_strategy,
+            pre_process_strategy,
+            error_strategy
+        )
 
-    def chunks_seq(self, iterable, length):
-        return list(self._chunks(iterable, length))
+    def tfilter(self, iterable, func, workers=None, max_pending=None, ordered=True, timeout=None, errors=None):
+        runs = self._run(iterable, func, workers, max_pending, ordered, timeout, errors)
+        return (item for item, result in runs if result)
+
+    def tmap(self, iterable, func, workers=None, max_pending=None, ordered=True, timeout=None, errors=None):
+        runs = self._run(iterable, func, workers, max_pending, ordered, timeout, errors)
+        return (result for item, result in runs)
+
+    def _run(self, iterable, func, workers, max_pending, ordered, timeout, errors):
+        workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        max_pending = max_pending or 2 * workers
+        iterator = iter(iterable)
+        pending = {}
+        running = set()
+        order = deque()
+        executor = ThreadPoolExecutor(workers)
+
+        def submit(item):
+            future = executor.submit(func, item)
+            if timeout is None:
+                pending[future] = (item, None)
+            else:
+                pending[future] = (item, time.monotonic() + timeout)
+                running.add(future)
+            if ordered:
+                order.append(future)
+
+        try:
+            while True:
+                available = max_pending - len(pending)
+                if timeout is not None:
+                    running = {f for f in running if not f.done()}
+                    available = min(available, workers - len(running))
+                for item in itertools.islice(iterator, max(0, available)):
+                    submit(item)
+                if not pending:
+                    item = next(iterator, _missing)
+                    if item is _missing:
+                        return
+                    wait(running, return_when=FIRST_COMPLETED)
+                    submit(item)
+                for future in self._next_ready(pending, order, ordered):
+                    item, deadline = pending.pop(future)
+                    if not future.done():
+                        future.cancel()
+                        self._handle(TimeoutError('Timed out after {} seconds on {!r}.'.format(timeout, item)), errors)
+                    elif future.exception() is not None:
+                        self._handle(future.exception(), errors)
+                    else:
+                        yield item, future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _next_ready(self, pending, order, ordered):
+        if ordered:
+            future = order.popleft()
+            wait((future,), timeout=self._remaining(pending[future][1]))
+            return [future]
+        deadlines = [d for i, d in pending.values() if d is not None]
+        done, not_done = wait(
+            pending,
+            timeout=self._remaining(min(deadlines)) if deadlines else None,
+            return_when=FIRST_COMPLETED
+        )
+        now = time.monotonic()
+        expired = [f for f in not_done if pending[f][1] is not None and pending[f][1] <= now]
+        return [*done, *expired]
+
+    def _handle(self, error, errors):
+        if not isinstance(error, self.error_strategy.get_error()):
+            raise error
+        error = self.error_strategy.handle(error)
+        if errors is None:
+            raise error
+        errors.append(error)
+
+    def _remaining(self, deadline):
+        return None if deadline is None else max(0, deadline - time.monotonic())
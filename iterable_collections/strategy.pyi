@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, Any, Dict, Tuple, Sequence, Iterator, Union
+from typing import Callable, Iterable, Any, Dict, List, Optional, Tuple, Sequence, Iterator, Union
 
 from iterable_collections.collection import Collection
+from iterable_collections.reducers import ReducerInterface
 
 
 class MethodStrategyInterface(ABC):
@@ -9,6 +10,18 @@ class MethodStrategyInterface(ABC):
     Encapsulates the functionality of a method on a :obj:`Collection<iterable_collections.collection.Collection>` by
     using other strategy objects.
     """
+    def __get__(self, instance: Optional[Collection], owner: type) -> Union['MethodStrategyInterface', Callable]:
+        """
+        Allows a strategy to be set directly as an attribute of a
+        :obj:`Collection<iterable_collections.collection.Collection>` subclass. Accessing the attribute from an
+        instance returns the result of :meth:`make_method`, accessing it from the class returns the strategy itself.
+
+        Args:
+            instance: An instance of :obj:`Collection<iterable_collections.collection.Collection>`, or ``None``.
+            owner: The class the strategy is set on.
+
+        """
+
     @abstractmethod
     def make_method(self, instance: Collection) -> Callable:
         """
@@ -20,6 +33,14 @@ class MethodStrategyInterface(ABC):
 
         """
 
+    def compile(self) -> Callable:
+        """
+        Returns a function taking a :obj:`Collection<iterable_collections.collection.Collection>` instance as its first
+        argument, suitable for use as a method on a :obj:`Collection<iterable_collections.collection.Collection>`
+        subclass. By default the function calls :meth:`make_method` on every call.
+
+        """
+
 
 class ResultStrategyInterface(ABC):
     """
@@ -123,6 +144,57 @@ class ErrorHandlingStrategyInterface(ABC):
         """
 
 
+class ProfilingHookInterface(ABC):
+    """
+    Receives the timings of each call of a :obj:`MethodStrategy` whose
+    :attr:`profiling_hook<MethodStrategy.profiling_hook>` it is. See
+    :obj:`Profiler<iterable_collections.profiling.Profiler>`.
+
+    Attributes:
+        phases(:obj:`Tuple[str, ...]<typing.Tuple>`): The names of the phases of a call, in the order of ``timings``:
+            ``'pre_process'``, ``'format'``, ``'call'`` and ``'store'``, the last of which stores the result.
+    """
+    phases: Tuple[str, ...] = ...
+
+    @abstractmethod
+    def record(self, name: str, timings: Tuple[float, ...], input_size: Optional[int],
+               output_size: Optional[int]) -> None:
+        """
+        Called after each call of a method which didn't raise an error. Nested calls, e.g. a conversion made while
+        pre-processing, are recorded separately and are also included in the timings of the outer call.
+
+        Args:
+            name: The name of the method.
+            timings: The wall time in seconds spent in each of :attr:`phases`.
+            input_size: The length of :attr:`iterable<iterable_collections.collection.Collection.iterable>` before
+                the call, if it is a :obj:`Sequence<typing.Sequence>`, :obj:`Set<typing.Set>`,
+                :obj:`Mapping<typing.Mapping>` or :obj:`MappingView<typing.MappingView>`, and ``None`` otherwise.
+            output_size: The length of the result, as for ``input_size``.
+
+        """
+
+
+class MaterialisationHookInterface(ABC):
+    """
+    Receives the operations a :obj:`TrackingPreProcessingStrategy` performs on
+    :attr:`iterable<iterable_collections.collection.Collection.iterable>`, typically conversions to a ``list``,
+    ``set``, ``dict`` or ``tuple``. See
+    :obj:`MaterialisationTracker<iterable_collections.profiling.MaterialisationTracker>`.
+    """
+    @abstractmethod
+    def record(self, method: str, operation: str, size: Optional[int], nbytes: int) -> None:
+        """
+        Called after each operation.
+
+        Args:
+            method: The name of the method which performed the operation, e.g. ``'reversed'``.
+            operation: The name of the method called by the operation, e.g. ``'list'``.
+            size: The length of the stored iterable, if it is known.
+            nbytes: The approximate number of bytes allocated.
+
+        """
+
+
 class BaseExceptionErrorHandlingStrategy(ErrorHandlingStrategyInterface):
     """
     Handles any error and returns the error raised during execution of the method.
@@ -342,6 +414,7 @@ class PreProcessingStrategy(PreProcessingStrategyInterface):
                             'name': (str) The name of the method.
                             'args': (tuple) Positional arguments.
                             'kwargs': (dict) Keyword arguments
+                            'unless': (tuple) Optional. Types of iterable for which the operation is skipped.
                         },
                         ...
                     )
@@ -356,6 +429,33 @@ class PreProcessingStrategy(PreProcessingStrategyInterface):
         """
 
 
+class TrackingPreProcessingStrategy(PreProcessingStrategy):
+    """
+    A :obj:`PreProcessingStrategy` which passes each operation in ``copying`` it performs to a
+    :obj:`MaterialisationHookInterface`, along with the length of the stored iterable and the bytes allocated for it.
+    Other operations, such as ``items`` or ``enumerate``, only wrap the iterable in a view or iterator and aren't
+    passed on. The bytes are the growth in memory traced by :mod:`tracemalloc` across the operation, with the previous
+    iterable kept alive until it is measured, if it is tracing, and the shallow :func:`sys.getsizeof` of the stored
+    iterable otherwise. The peak traced by :mod:`tracemalloc` is left as it is.
+
+    Attributes:
+        copying(:obj:`Tuple[str, ...]<typing.Tuple>`): The names of the operations which copy the iterable.
+        method(:obj:`str`): The name of the method the operations are performed for.
+        tracker(:obj:`MaterialisationHookInterface`): The hook receiving the operations.
+    """
+    copying: Tuple[str, ...] = ...
+    def __init__(self, operations: Tuple = (), method: Optional[str] = None,
+                 tracker: Optional['MaterialisationHookInterface'] = None):
+        """
+
+        Args:
+            operations: See :obj:`PreProcessingStrategy`.
+            method: The name of the method the operations are performed for.
+            tracker: The hook receiving the operations.
+
+        """
+
+
 class UnformattedArgumentFormattingStrategy(ArgumentFormattingStrategyInterface):
     """
     Do not format the method's arguments in any way.
@@ -507,6 +607,32 @@ class SpreadTupleParameterArgumentFormattingStrategy(ArgumentFormattingStrategyI
         """
 
 
+class SpreadTupleKeywordArgumentFormattingStrategy(ArgumentFormattingStrategyInterface):
+    """
+    Wraps a :obj:`Callable<typing.Callable>` argument, such as ``key``, so that the tuple it receives is spread into
+    separate arguments. The argument is found by keyword, or at ``position`` if it was passed positionally. ``None``
+    is left as it is.
+    """
+    keyword: str = ...
+    position: Optional[int] = ...
+    def __init__(self, keyword: str = 'key', position: Optional[int] = None):
+        """
+
+        Args:
+            keyword: The name of the argument that should be converted.
+            position: The position of the argument if it is passed positionally.
+        """
+
+    def format(self, *args, **kwargs) -> Tuple[Tuple, Dict]:
+        """
+
+        Args:
+            *args: Positional arguments passed to the method.
+            **kwargs: Keyword arguments passed to the method.
+
+        """
+
+
 class MethodStrategy(MethodStrategyInterface):
     """
     Encapsulates the functionality of a method on a :obj:`Collection<iterable_collections.collection.Collection>` by
@@ -521,6 +647,11 @@ class MethodStrategy(MethodStrategyInterface):
     argument_formatting_strategy: ArgumentFormattingStrategyInterface = ...
     pre_process_strategy: PreProcessingStrategyInterface = ...
     error_strategy: ErrorHandlingStrategyInterface = ...
+    profiling_hook: Optional[ProfilingHookInterface] = ...
+    """
+    Receives the timings of each call if set. ``None`` by default, in which case no timing code runs at all. See
+    :func:`profiled_registry<iterable_collections.profiling.profiled_registry>`.
+    """
     def __init__(
             self,
             name: str,
@@ -549,9 +680,22 @@ class MethodStrategy(MethodStrategyInterface):
 
         """
 
+    def __call__(self, instance: Collection, *args, store: bool = None, ret: bool = None, **kwargs) -> Any:
+        """
+        Performs the method on ``instance`` using the strategy objects to incorporate desired functionality.
+
+        Args:
+            instance: An instance of :obj:`Collection<iterable_collections.collection.Collection>`.
+            *args: Positional arguments passed to the method.
+            store: Store the result of the operation to the :attr:`iterable<Collection.iterable>` property.
+            ret: Return the result of the operation instead of `self`.
+            **kwargs: Keyword arguments passed to the method.
+
+        """
+
     def make_method(self, instance: Collection) -> Callable:
         """
-        Creates a function using various strategies to incorporate desired functionality. The function
+        Binds the strategy to ``instance`` as a :obj:`MethodType<types.MethodType>`. The bound method
         is then used a method on a :obj:`iterable<collection.collection.Collection.iterable>` object.
 
         Args:
@@ -559,6 +703,21 @@ class MethodStrategy(MethodStrategyInterface):
 
         """
 
+    def compile(self) -> Callable:
+        """
+        Generates a function equivalent to :meth:`__call__` which omits steps that do nothing for the composed
+        strategies: an empty :obj:`PreProcessingStrategy`, :obj:`UnformattedArgumentFormattingStrategy` and the
+        ``try: ... except:`` block for :obj:`BaseExceptionErrorHandlingStrategy`. The built-in binding, result and
+        return strategies are inlined rather than called. Strategies are matched by exact type, so subclasses of the
+        built-in strategies are always called.
+
+        If :attr:`profiling_hook` is set, the function also times each phase and passes the timings to the hook.
+
+        The strategies are inspected once, when :meth:`compile` is called. Changes to the strategy's attributes
+        after that are not reflected in the returned function.
+
+        """
+
 
 class ConcatMethodStrategy(MethodStrategy):
     """
@@ -640,7 +799,8 @@ class FlattenMethodStrategy(MethodStrategy):
     ):
         ...
 
-    def flatten(self, iterable: Iterable) -> Iterable:
+    def flatten(self, iterable: Iterable, depth: Optional[int] = None,
+                atomic: Tuple[type, ...] = ()) -> Iterator:
         ...
 
 
@@ -687,7 +847,8 @@ class SortedAndGroupbyMethodStrategy(MethodStrategy):
 
 class ChunksMethodStrategy(MethodStrategy):
     """
-    Breaks ``iterable`` into chunks of ``length`` sized lists.
+    Breaks ``iterable`` into chunks of ``length`` sized lists. Iterators and mappings are chunked as they are
+    consumed rather than copied to a list first.
     """
     def __init__(
             self,
@@ -701,15 +862,142 @@ class ChunksMethodStrategy(MethodStrategy):
     ):
         ...
 
-    def chunks(self, instance: Collection, length: int) -> Iterable:
+    def chunks(self, instance: Collection, length: int, container: Optional[Callable] = list) -> Iterable:
+        ...
+
+    def chunks_dict(self, iterable: Iterable[Tuple], length: int, container: Optional[Callable] = list) -> Iterator:
+        ...
+
+    def chunks_iter(self, iterable: Iterable, length: int, container: Optional[Callable] = list) -> Iterator:
+        ...
+
+    def chunks_seq(self, iterable: Sequence, length: int, container: Optional[Callable] = list) -> List:
+        ...
+
+
+class GroupByMethodStrategy(MethodStrategy):
+    """
+    :obj:`MethodStrategy` containing functionality for grouping elements by a key with a :obj:`python:dict`,
+    optionally folding each group as it is built.
+
+    Attributes:
+        reducers(:obj:`dict`): The built-in :obj:`reducers<iterable_collections.reducers.ReducerInterface>` by name.
+            An ``initializer`` passed with one of their names replaces its initial state.
+    """
+    reducers: Dict[str, ReducerInterface] = ...
+    def __init__(
+            self,
+            name: str,
+            result_strategy: ResultStrategyInterface,
+            return_strategy: ReturnValueStrategyInterface,
+            iterable_binding_strategy: ArgumentBindingStrategyInterface,
+            argument_formatting_strategy: ArgumentFormattingStrategyInterface,
+            pre_process_strategy: PreProcessingStrategyInterface,
+            error_strategy: ErrorHandlingStrategyInterface
+    ):
+        ...
+
+    def group_by(self, iterable: Iterable, key: Optional[Callable] = None,
+                 reducer: Union[str, Callable, ReducerInterface, None] = None, initializer: Any = ...) -> Dict:
         ...
 
-    def chunks_dict(self, iterable: Dict, length: int) -> Iterable:
+
+class UniqueMethodStrategy(MethodStrategy):
+    """
+    :obj:`MethodStrategy` containing functionality for lazily removing repeated elements while keeping their order,
+    optionally within a bounded amount of memory.
+    """
+    def __init__(
+            self,
+            name: str,
+            result_strategy: ResultStrategyInterface,
+            return_strategy: ReturnValueStrategyInterface,
+            iterable_binding_strategy: ArgumentBindingStrategyInterface,
+            argument_formatting_strategy: ArgumentFormattingStrategyInterface,
+            pre_process_strategy: PreProcessingStrategyInterface,
+            error_strategy: ErrorHandlingStrategyInterface
+    ):
         ...
 
-    def chunks_iter(self, iterable: Iterator, length: int) -> Iterable:
+    def unique(self, iterable: Iterable, key: Optional[Callable] = None, window: Optional[int] = None,
+               capacity: Optional[int] = None, error_rate: float = 0.01) -> Iterator:
         ...
 
-    def chunks_seq(self, iterable: Sequence, length: int) -> Iterable:
+
+class ParallelMethodStrategy(MethodStrategy):
+    """
+    :obj:`MethodStrategy` containing functionality for mapping, filtering and reducing in a
+    :obj:`ProcessPoolExecutor<concurrent.futures.ProcessPoolExecutor>`.
+    """
+    def __init__(
+            self,
+            name: str,
+            result_strategy: ResultStrategyInterface,
+            return_strategy: ReturnValueStrategyInterface,
+            iterable_binding_strategy: ArgumentBindingStrategyInterface,
+            argument_formatting_strategy: ArgumentFormattingStrategyInterface,
+            pre_process_strategy: PreProcessingStrategyInterface,
+            error_strategy: ErrorHandlingStrategyInterface
+    ):
+        ...
+
+    def pfilter(self, iterable: Iterable, func: Callable, workers: Optional[int] = None, chunksize: int = 1,
+                ordered: bool = True) -> List:
+        ...
+
+    def pmap(self, iterable: Iterable, func: Callable, workers: Optional[int] = None, chunksize: int = 1,
+             ordered: bool = True) -> List:
+        ...
+
+    def preduce(self, iterable: Iterable, func: Callable, initializer: Any = ..., workers: Optional[int] = None,
+                chunksize: Optional[int] = None) -> Any:
+        ...
+
+
+class AsyncMethodStrategy(MethodStrategy):
+    """
+    :obj:`MethodStrategy` for the methods of :obj:`AsyncCollection<iterable_collections.collection.AsyncCollection>`.
+    When ``callable_`` is a coroutine function, ``error_strategy`` handles errors raised while its coroutine is
+    awaited rather than when it is created.
+    """
+    def __init__(
+            self,
+            name: str,
+            callable_: Callable,
+            result_strategy: ResultStrategyInterface,
+            return_strategy: ReturnValueStrategyInterface,
+            iterable_binding_strategy: ArgumentBindingStrategyInterface,
+            argument_formatting_strategy: ArgumentFormattingStrategyInterface,
+            pre_process_strategy: PreProcessingStrategyInterface,
+            error_strategy: ErrorHandlingStrategyInterface
+    ):
+        ...
+
+
+class ThreadedMethodStrategy(MethodStrategy):
+    """
+    :obj:`MethodStrategy` containing functionality for mapping and filtering in a
+    :obj:`ThreadPoolExecutor<concurrent.futures.ThreadPoolExecutor>` with a bounded number of pending elements.
+    Errors raised for an element are handled by ``error_strategy``.
+    """
+    def __init__(
+            self,
+            name: str,
+            result_strategy: ResultStrategyInterface,
+            return_strategy: ReturnValueStrategyInterface,
+            iterable_binding_strategy: ArgumentBindingStrategyInterface,
+            argument_formatting_strategy: ArgumentFormattingStrategyInterface,
+            pre_process_strategy: PreProcessingStrategyInterface,
+            error_strategy: ErrorHandlingStrategyInterface
+    ):
         ...
 
+    def tfilter(self, iterable: Iterable, func: Callable, workers: Optional[int] = None,
+                max_pending: Optional[int] = None, ordered: bool = True, timeout: Optional[float] = None,
+                errors: Optional[List[BaseException]] = None) -> Iterator:
+        ...
+
+    def tmap(self, iterable: Iterable, func: Callable, workers: Optional[int] = None,
+             max_pending: Optional[int] = None, ordered: bool = True, timeout: Optional[float] = None,
+             errors: Optional[List[BaseException]] = None) -> Iterator:
+        ...
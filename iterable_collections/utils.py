@@ -1,4 +1,12 @@
 import collections
+import itertools
+import math
+import operator
+from array import array
+from collections.abc import Sequence
+from functools import reduce
+
+_integer_typecodes = 'bBhHiIlLqQ'
 
 
 class DictItem(collections.namedtuple('DictItem', 'key value')):
@@ -16,19 +24,234 @@ class DictItem(collections.namedtuple('DictItem', 'key value')):
     """
 
 
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.01):
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1.')
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate must be between 0 and 1.')
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def __contains__(self, item):
+        bits = self._bits
+        return all(bits[i >> 3] & (1 << (i & 7)) for i in self._indexes(item))
+
+    def __repr__(self):
+        return 'BloomFilter(capacity={}, error_rate={})'.format(self.capacity, self.error_rate)
+
+    def _indexes(self, item):
+        h1 = hash(item)
+        h2 = hash((item, self.size)) | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        bits = self._bits
+        added = False
+        for i in self._indexes(item):
+            mask = 1 << (i & 7)
+            if not bits[i >> 3] & mask:
+                bits[i >> 3] |= mask
+                added = True
+        return added
+
+
+class SequenceView(Sequence):
+    __slots__ = ('_sequence', '_range')
+
+    def __init__(self, sequence, start=None, stop=None, step=None):
+        if isinstance(sequence, SequenceView):
+            sequence, indexes = sequence._sequence, sequence._range
+        else:
+            indexes = range(len(sequence))
+        self._sequence = sequence
+        self._range = indexes[start:stop:step]
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(map(operator.eq, self, other))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            view = SequenceView.__new__(SequenceView)
+            view._sequence = self._sequence
+            view._range = self._range[index]
+            return view
+        return self._sequence[self._range[index]]
+
+    def __iter__(self):
+        if self._range == range(len(self._sequence)):
+            return iter(self._sequence)
+        return map(self._sequence.__getitem__, self._range)
+
+    def __len__(self):
+        return len(self._range)
+
+    def __repr__(self):
+        return 'SequenceView({}, {!r})'.format(type(self._sequence).__name__, self._range)
+
+    def __reversed__(self):
+        return map(self._sequence.__getitem__, reversed(self._range))
+
+    @property
+    def slice(self):
+        indexes = self._range
+        return slice(indexes.start, None if indexes.stop < 0 else indexes.stop, indexes.step)
+
+    def materialise(self):
+        result = self._sequence[self.slice]
+        if type(result) is memoryview:
+            return result.tobytes()
+        return result
+
+
+def batches(iterable, batch_size):
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1.')
+    iterator = iter(iterable)
+    return iter(lambda: list(itertools.islice(iterator, batch_size)), [])
+
+
+def compact(iterable, typecode='q'):
+    iterator = iter(iterable)
+    buffer = array(typecode)
+    append = buffer.append
+    accepted = _accepted_types(typecode)
+    for x in iterator:
+        if type(x) in accepted:
+            try:
+                append(x)
+                continue
+            except OverflowError:
+                pass
+        upgrade = _upgrade_typecode(buffer, x)
+        if upgrade is None:
+            return [*buffer, x, *iterator]
+        if upgrade != buffer.typecode:
+            buffer = array(upgrade, buffer)
+            append = buffer.append
+            accepted = _accepted_types(upgrade)
+        append(x)
+    return buffer
+
+
+def _accepted_types(typecode):
+    return (int,) if typecode in _integer_typecodes else (float,)
+
+
+def _upgrade_typecode(buffer, x):
+    typecode = buffer.typecode
+    if type(x) is int:
+        if typecode not in _integer_typecodes:
+            return typecode if _is_exact_float(x) else None
+        return 'q' if typecode != 'q' and -2 ** 63 <= x < 2 ** 63 else None
+    if type(x) is float and typecode in _integer_typecodes and all(map(_is_exact_float, buffer)):
+        return 'd'
+    return None
+
+
+def _is_exact_float(i):
+    try:
+        return int(float(i)) == i
+    except OverflowError:
+        return False
+
+
+def compose(*funcs):
+    if len(funcs) == 2:
+        f, g = funcs
+        return lambda x: g(f(x))
+    return lambda x: reduce(lambda y, func: func(y), funcs, x)
+
+
+def conjoin(*predicates):
+    predicates = tuple(bool if p is None else p for p in predicates)
+    if len(predicates) == 2:
+        p, q = predicates
+        return lambda x: p(x) and q(x)
+    return lambda x: all(p(x) for p in predicates)
+
+
+def make_array(iterable, typecode=None):
+    if typecode is not None:
+        return array(typecode, iterable)
+    buffer = compact(iterable)
+    if type(buffer) is not array:
+        raise TypeError('Cannot store non-numeric elements in an array.')
+    return buffer
+
+
 def make_nt_items(iterable):
     return list(map(DictItem._make, iterable))
 
 
-def partial_at_position(func, *args, pos=0, **kwargs):
-    return lambda *a, **k: func(*(a[:pos] + args + a[pos:]), **dict(k, **kwargs))
+class partial_at_position:
+    __slots__ = ('func', 'args', 'pos', 'keywords')
+
+    def __init__(self, func, *args, pos=0, **kwargs):
+        self.func = func
+        self.args = args
+        self.pos = pos
+        self.keywords = kwargs
+
+    def __call__(self, *args, **kwargs):
+        pos = self.pos
+        if kwargs or self.keywords:
+            kwargs.update(self.keywords)
+            return self.func(*args[:pos], *self.args, *args[pos:], **kwargs)
+        if not pos:
+            return self.func(*self.args, *args)
+        if len(args) <= pos:
+            return self.func(*args, *self.args)
+        return self.func(*args[:pos], *self.args, *args[pos:])
+
+    def __repr__(self):
+        return 'partial_at_position({!r}, {}, pos={})'.format(self.func, ', '.join(map(repr, self.args)), self.pos)
 
 
-def rpartial(func, *args, **kwargs):
-    return lambda *a, **k: func(*(a + args), **dict(k, **kwargs))
+def preserve_array(func, position=0, infer=False):
+    def preserved(*args, **kwargs):
+        result = func(*args, **kwargs)
+        iterable = args[position]
+        if type(iterable) is array and type(result) is not array:
+            return compact(result) if infer else array(iterable.typecode, result)
+        return result
+
+    preserved.__wrapped__ = func
+    return preserved
+
+
+class rpartial:
+    __slots__ = ('func', 'args', 'keywords')
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.keywords = kwargs
+
+    def __call__(self, *args, **kwargs):
+        if kwargs or self.keywords:
+            kwargs.update(self.keywords)
+            return self.func(*args, *self.args, **kwargs)
+        return self.func(*args, *self.args)
+
+    def __repr__(self):
+        return 'rpartial({!r}, {})'.format(self.func, ', '.join(map(repr, self.args)))
+
+
+async def async_safe_call(func, error_strategy, *args, **kwargs):
+    try:
+        res = await func(*args, **kwargs)
+    except error_strategy.get_error() as e:
+        raise error_strategy.handle(e)
+    return res
 
 
-def safe_call(func, error_strategy, *args, **kwargs):
+def safe_call(func, error_strategy, /, *args, **kwargs):
     try:
         res = func(*args, **kwargs)
     except error_strategy.get_error() as e:
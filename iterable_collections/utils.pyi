@@ -1,5 +1,7 @@
 import collections
-from typing import Any, Callable, Hashable, ItemsView, List, NamedTuple, Sequence, Tuple, Union, Type
+from array import array
+from typing import Any, Awaitable, Callable, Dict, Hashable, ItemsView, Iterable, Iterator, List, NamedTuple, \
+    Optional, Sequence, Tuple, Union, Type
 
 from iterable_collections.strategy import ErrorHandlingStrategyInterface
 
@@ -19,6 +21,146 @@ class DictItem(collections.namedtuple('DictItem', 'key value')):
     """
 
 
+class BloomFilter:
+    """
+    A fixed size, probabilistic set of hashable items. Membership tests never miss an item which was added, but may
+    report an item which was not, with a probability of about ``error_rate`` once ``capacity`` items were added.
+    Items are hashed with :func:`python:hash`, so a filter is only meaningful within one process.
+
+    Attributes:
+        capacity(:obj:`int`): The expected number of items.
+        error_rate(:obj:`float`): The false positive rate at ``capacity`` items.
+        size(:obj:`int`): The number of bits in the filter.
+        hashes(:obj:`int`): The number of bits set for each item.
+    """
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """
+        Args:
+            capacity: The expected number of items.
+            error_rate: The false positive rate at ``capacity`` items.
+
+        Raises:
+            ValueError: Raised if ``capacity`` is less than 1 or ``error_rate`` is not between 0 and 1.
+        """
+
+    def __contains__(self, item: Hashable) -> bool:
+        ...
+
+    def add(self, item: Hashable) -> bool:
+        """
+        Adds ``item`` to the filter. Returns ``True`` if it was not in the filter already.
+
+        Args:
+            item: The item to add.
+
+        """
+
+
+class SequenceView(Sequence):
+    """
+    A read only window over the elements of ``sequence`` from ``start`` to ``stop``, every ``step`` positions, as
+    with ``sequence[start:stop:step]``. The elements aren't copied: creating, slicing and iterating over a view take
+    constant memory, and changes to a mutable ``sequence`` are visible through it. Slicing a view returns another view
+    of ``sequence``. Views compare equal to any :obj:`Sequence<typing.Sequence>` with equal elements.
+    """
+    def __init__(self, sequence: Sequence, start: Optional[int] = None, stop: Optional[int] = None,
+                 step: Optional[int] = None) -> None:
+        """
+        Args:
+            sequence: A sequence supporting :func:`python:len` and integer indexing, e.g. a :obj:`python:list`,
+                :obj:`python:bytes`, :obj:`array<array.array>`, :obj:`python:memoryview` or another
+                :obj:`SequenceView`.
+            start: The start position of the view.
+            stop: The stop position of the view.
+            step: The step of the view.
+
+        """
+
+    @property
+    def slice(self) -> slice:
+        """
+        The :obj:`python:slice` of ``sequence`` the view covers.
+        """
+
+    def materialise(self) -> Sequence:
+        """
+        Copies the elements of the view by slicing ``sequence``, so a list view returns a list and an
+        :obj:`array<array.array>` view an array. A :obj:`python:memoryview` view returns :obj:`python:bytes`.
+        """
+
+
+def batches(iterable: Iterable, batch_size: int) -> Iterator[List]:
+    """
+    Returns an iterator over lists of the next ``batch_size`` elements of ``iterable``. The last list may be shorter.
+
+    Args:
+        iterable: The elements to batch.
+        batch_size: The number of elements in each list.
+
+    Raises:
+        ValueError: Raised if ``batch_size`` is less than 1.
+
+    """
+
+
+def compact(iterable: Iterable, typecode: str = 'q') -> Union[array, List]:
+    """
+    Returns the elements of ``iterable`` in an :obj:`array<array.array>` of ``typecode``. An integer typecode only
+    accepts ints, and is widened to ``'q'`` when an int doesn't fit and to ``'d'`` when a float is reached. A float
+    typecode accepts floats and ints which a float represents exactly. If an element is of another type, including
+    :obj:`python:bool`, doesn't fit in ``'q'``, or is an int which can't be stored exactly alongside floats, such as
+    ``2 ** 60 + 1``, a :obj:`python:list` of every element is returned instead.
+
+    Args:
+        iterable: The elements to store.
+        typecode: The initial typecode.
+
+    """
+
+
+def compose(*funcs: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Returns a function of one argument which passes its argument through each of ``funcs`` in order, so that::
+
+        f = compose(abs, str)
+        assert f(-1) == str(abs(-1))
+
+    Args:
+        *funcs: Functions of one argument.
+
+    """
+
+
+def conjoin(*predicates: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """
+    Returns a predicate which is truthy only if each of ``predicates`` is truthy for its argument. Predicates are
+    called in order and evaluation stops at the first falsy result. As with :func:`python:filter`, ``None`` tests
+    the truthiness of the argument itself. So that::
+
+        p = conjoin(None, lambda x: x % 2)
+        assert list(filter(p, [0, 1, 2, 3])) == [1, 3]
+
+    Args:
+        *predicates: Functions of one argument or ``None``.
+
+    """
+
+
+def make_array(iterable: Iterable, typecode: Optional[str] = None) -> array:
+    """
+    Returns the elements of ``iterable`` in an :obj:`array<array.array>`. If ``typecode`` isn't given, it is chosen
+    as with :func:`compact`.
+
+    Args:
+        iterable: The elements to store.
+        typecode: The :mod:`array` typecode.
+
+    Raises:
+        TypeError: Raised if an element is not a number.
+
+    """
+
+
 def make_nt_items(iterable: Union[ItemsView, Sequence[Tuple[Hashable, Any]]]) -> List[DictItem]:
     """
     Accepts either an :obj:`ItemsView<typing.ItemsView>` object or a Sequence of Sequences of two elements with the first element
@@ -30,9 +172,9 @@ def make_nt_items(iterable: Union[ItemsView, Sequence[Tuple[Hashable, Any]]]) ->
     """
 
 
-def partial_at_position(func: Callable, *args, pos: int = 0, **kwargs) -> Callable:
+class partial_at_position:
     """
-    Returns a function with ``args`` inserted at ``pos``, so that::
+    A callable with ``args`` inserted at ``pos``, so that::
 
         f = lambda x, y, z: x + y + z
 
@@ -52,18 +194,46 @@ def partial_at_position(func: Callable, *args, pos: int = 0, **kwargs) -> Callab
         p4 = partial_at_position(f, 1, 1, pos=0, z=1)
         assert p4() == 3
 
+    ``kwargs`` take precedence over keyword arguments given to the call. Calls without keyword arguments, and with
+    ``pos`` at the start or past the end of the arguments given, pass them to ``func`` without building intermediate
+    tuples or dicts.
+
+    Attributes:
+        func(:obj:`Callable<typing.Callable>`): A function to which ``args`` and ``kwargs`` will be applied.
+        args(:obj:`tuple`): Arguments to be passed to ``func``.
+        pos(:obj:`int`): The position at which to insert ``args``.
+        keywords(:obj:`dict`): Keyword arguments to be passed to ``func``.
+    """
+    func: Callable = ...
+    args: Tuple = ...
+    pos: int = ...
+    keywords: Dict[str, Any] = ...
+
+    def __init__(self, func: Callable, *args, pos: int = 0, **kwargs) -> None:
+        ...
+
+    def __call__(self, *args, **kwargs) -> Any:
+        ...
+
+
+def preserve_array(func: Callable, position: int = 0, infer: bool = False) -> Callable:
+    """
+    Returns a function which calls ``func`` and, if its argument at ``position`` is an :obj:`array<array.array>`,
+    stores the result in an array of the same typecode. If the result holds new values rather than elements of that
+    array, as with :func:`python:map`, ``infer`` passes it to :func:`compact` instead, so its typecode is worked out
+    from the values.
+
     Args:
-        func: A function to which ``args`` and ``kwargs`` will be applied.
-        *args: Arguments to be passed to ``func``.
-        pos: The position at which to insert ``args``.
-        **kwargs: Keyword arguments to be passed to ``func``.
+        func: The function to wrap, e.g. :func:`python:filter`.
+        position: The position of the iterable among the arguments of ``func``.
+        infer: Work out the typecode from the result.
 
     """
 
 
-def rpartial(func: Callable, *args, **kwargs) -> Callable:
+class rpartial:
     """
-    Returns a function with ``args`` as the right most arguments. So that::
+    A callable with ``args`` as the right most arguments. So that::
 
         f = lambda x, y: (x, y)
 
@@ -80,15 +250,40 @@ def rpartial(func: Callable, *args, **kwargs) -> Callable:
         p3 = rpartial(f, y=2)
         assert p3(1) == (1, 2)
 
+    ``kwargs`` take precedence over keyword arguments given to the call. Calls without keyword arguments pass their
+    arguments to ``func`` without building intermediate tuples or dicts.
+
+    Attributes:
+        func(:obj:`Callable<typing.Callable>`): A function to which ``args`` and ``kwargs`` will be applied.
+        args(:obj:`tuple`): Arguments to be passed to ``func``.
+        keywords(:obj:`dict`): Keyword arguments to be passed to ``func``.
+    """
+    func: Callable = ...
+    args: Tuple = ...
+    keywords: Dict[str, Any] = ...
+
+    def __init__(self, func: Callable, *args, **kwargs) -> None:
+        ...
+
+    def __call__(self, *args, **kwargs) -> Any:
+        ...
+
+
+async def async_safe_call(func: Callable[..., Awaitable], error_strategy: ErrorHandlingStrategyInterface, *args,
+                          **kwargs) -> Any:
+    """
+    Awaits the coroutine returned by ``func`` in the same way :func:`safe_call` calls ``func``.
+
     Args:
-        func: A function to which ``args`` and ``kwargs`` will be applied.
+        func: The coroutine function to be called.
+        error_strategy:
         *args: Arguments to be passed to ``func``.
         **kwargs: Keyword arguments to be passed to ``func``.
 
     """
 
 
-def safe_call(func: Callable, error_strategy: ErrorHandlingStrategyInterface, *args, **kwargs) -> Any:
+def safe_call(func: Callable, error_strategy: ErrorHandlingStrategyInterface, /, *args, **kwargs) -> Any:
     """
     Calls ``func`` inside a ``try: ... except:`` block expecting ``error_type``. ``args`` and ``kwargs`` are passed to
     ``func``. In the event of an error, ``error_instance`` it will be raised, if it is given. Otherwise, the resultant
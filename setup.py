@@ -22,9 +22,18 @@ setup(
             "iterable_collections/collection.pyi",
             "iterable_collections/strategy.pyi",
             "iterable_collections/factory.pyi",
-            "iterable_collections/utils.pyi"
+            "iterable_collections/utils.pyi",
+            "iterable_collections/aio.pyi",
+            "iterable_collections/kernel.pyi",
+            "iterable_collections/numpy_backend.pyi",
+            "iterable_collections/plan.pyi",
+            "iterable_collections/profiling.pyi",
+            "iterable_collections/reducers.pyi",
+            "iterable_collections/sinks.pyi",
+            "iterable_collections/sources.pyi"
         ]
     )],
+    extras_require={'numpy': ['numpy']},
     classifiers=(
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,111 @@
+import asyncio
+import unittest
+
+from iterable_collections import acollect, AsyncCollection
+from iterable_collections.aio import aiterate
+
+
+async def source(n):
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield i
+
+
+async def double(x):
+    await asyncio.sleep(0.01 * (5 - x))
+    return x * 2
+
+
+async def is_even(x):
+    await asyncio.sleep(0)
+    return x % 2 == 0
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestACollect(unittest.TestCase):
+
+    def test_type(self):
+        self.assertIsInstance(acollect([]), AsyncCollection)
+
+    def test_list(self):
+        self.assertEqual(run(acollect(source(3)).list()), [0, 1, 2])
+
+    def test_sync_iterable(self):
+        self.assertEqual(run(acollect(range(3)).list()), [0, 1, 2])
+
+    def test_map(self):
+        c = acollect(source(5)).map(double)
+        self.assertEqual(run(c.list()), [0, 2, 4, 6, 8])
+
+    def test_map_sync_function(self):
+        c = acollect(source(3)).map(str)
+        self.assertEqual(run(c.list()), ['0', '1', '2'])
+
+    def test_map_concurrency(self):
+        active = []
+        peak = []
+
+        async def track(x):
+            active.append(x)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(x)
+            return x
+
+        c = acollect(range(10)).map(track, concurrency=3)
+        self.assertEqual(run(c.list()), list(range(10)))
+        self.assertEqual(max(peak), 3)
+
+    def test_filter(self):
+        c = acollect(source(6)).filter(is_even)
+        self.assertEqual(run(c.list()), [0, 2, 4])
+
+    def test_filter_concurrency(self):
+        c = acollect(source(6)).filter(is_even, concurrency=2)
+        self.assertEqual(run(c.list()), [0, 2, 4])
+
+    def test_chunks(self):
+        c = acollect(source(5)).chunks(2)
+        self.assertEqual(run(c.list()), [[0, 1], [2, 3], [4]])
+
+    def test_reduce(self):
+        async def add(x, y):
+            return x + y
+
+        self.assertEqual(run(acollect(source(5)).reduce(add)), 10)
+        self.assertEqual(run(acollect(source(5)).reduce(add, 10)), 20)
+
+    def test_reduce_empty(self):
+        with self.assertRaises(TypeError):
+            run(acollect([]).reduce(max))
+
+    def test_first(self):
+        self.assertEqual(run(acollect(source(5)).map(double).first()), 0)
+
+    def test_first_empty(self):
+        with self.assertRaisesRegex(IndexError, 'Index 0 is not set on iterable.'):
+            run(acollect([]).first())
+
+    def test_async_for(self):
+        async def consume():
+            return [x async for x in acollect(source(3)).map(double)]
+
+        self.assertEqual(run(consume()), [0, 2, 4])
+
+    def test_aiterate(self):
+        async def consume():
+            return [x async for x in aiterate([1, 2])]
+
+        self.assertEqual(run(consume()), [1, 2])
+
+    def test_lazy(self):
+        async def double(x):
+            return x * 2
+
+        c = acollect([1, 2, 3, 4]).lazy().map(double).map(double).filter(lambda x: x > 4)
+        self.assertEqual(len(c.plan), 3)
+        self.assertEqual(run(c.list()), [8, 12, 16])
+        self.assertEqual(c.statistics, {})
@@ -0,0 +1,47 @@
+import unittest
+from collections import namedtuple
+
+from iterable_collections import collect
+from iterable_collections.reducers import Aggregate, ArgMax, Count, Max, Mean, Min, Sum, aggregate
+
+Row = namedtuple('Row', 'team score')
+
+ROWS = [Row('red', 3), Row('blue', 5), Row('red', 1), Row('green', 4), Row('blue', 2)]
+
+
+class TestAggregate(unittest.TestCase):
+
+    def test_list(self):
+        result = collect([3, 1, 4, 1, 5]).aggregate(n=Count(), total=Sum(), low=Min(), high=Max())
+        self.assertEqual(result, {'n': 5, 'total': 14, 'low': 1, 'high': 5})
+
+    def test_iterator(self):
+        result = collect(iter([3, 1, 4, 1, 5])).aggregate(n=Count(), low=Min(), high=Max(), mean=Mean())
+        self.assertEqual(result, {'n': 5, 'low': 1, 'high': 5, 'mean': 2.8})
+
+    def test_key(self):
+        result = collect(ROWS).aggregate(total=Sum(key=lambda r: r.score), best=ArgMax(key=lambda r: r.score))
+        self.assertEqual(result, {'total': 15, 'best': Row('blue', 5)})
+
+    def test_empty(self):
+        result = collect([]).aggregate(n=Count(), low=Min(), mean=Mean())
+        self.assertEqual(result, {'n': 0, 'low': None, 'mean': None})
+
+    def test_names(self):
+        self.assertEqual(collect([3, 1]).aggregate(iterable=Count()), {'iterable': 2})
+        self.assertEqual(aggregate([3, 1], iterable=Sum()), {'iterable': 4})
+        for name in ('store', 'ret'):
+            with self.assertRaises(TypeError):
+                aggregate([3, 1], **{name: Count()})
+
+    def test_group_by(self):
+        c = collect(ROWS).group_by(lambda r: r.team, Sum(key=lambda r: r.score))
+        self.assertEqual(c.iterable, {'red': 4, 'blue': 7, 'green': 4})
+
+    def test_group_by_aggregate(self):
+        c = collect(ROWS).group_by(lambda r: r.team, Aggregate(n=Count(), high=Max(key=lambda r: r.score)))
+        self.assertEqual(c.iterable, {
+            'red': {'n': 2, 'high': 3},
+            'blue': {'n': 2, 'high': 5},
+            'green': {'n': 1, 'high': 4},
+        })
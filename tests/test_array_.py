@@ -0,0 +1,97 @@
+import unittest
+from array import array
+
+from iterable_collections import collect
+from iterable_collections.utils import compact
+
+
+class TestArray_(unittest.TestCase):
+
+    def test_list(self):
+        c = collect([1, 2, 3]).array_()
+        self.assertEqual(c.iterable, array('q', [1, 2, 3]))
+
+    def test_iterator(self):
+        c = collect(iter([1, 2.5, 3])).array_()
+        self.assertEqual(c.iterable, array('d', [1, 2.5, 3]))
+
+    def test_typecode(self):
+        c = collect(range(3)).array_('b')
+        self.assertEqual(c.iterable, array('b', [0, 1, 2]))
+
+    def test_non_numeric(self):
+        with self.assertRaises(TypeError):
+            collect(['a', 'b']).array_()
+
+    def test_map(self):
+        c = collect(range(5)).array_().map(lambda x: x * 2)
+        self.assertEqual(c.iterable, array('q', [0, 2, 4, 6, 8]))
+
+    def test_map_to_float(self):
+        c = collect(range(4)).array_().map(lambda x: x / 2)
+        self.assertEqual(c.iterable, array('d', [0, 0.5, 1, 1.5]))
+
+    def test_map_overflow(self):
+        c = collect(range(3)).array_('b').map(lambda x: x * 100)
+        self.assertEqual(c.iterable, array('q', [0, 100, 200]))
+
+    def test_map_non_numeric(self):
+        c = collect(range(3)).array_().map(str)
+        self.assertEqual(c.iterable, ['0', '1', '2'])
+
+    def test_map_to_int(self):
+        c = collect([1.5, 2.5]).array_('d').map(int)
+        self.assertEqual(c.iterable, array('q', [1, 2]))
+        self.assertEqual(c.list(), [1, 2])
+        self.assertIs(type(c.list()[0]), int)
+
+    def test_map_to_bool(self):
+        c = collect(range(3)).array_().map(lambda x: x > 0)
+        self.assertEqual(c.iterable, [False, True, True])
+
+    def test_map_ret(self):
+        self.assertEqual(collect(range(3)).array_().map(abs, ret=True), array('q', [0, 1, 2]))
+
+    def test_filter(self):
+        c = collect(range(10)).array_().filter(lambda x: x % 3 == 0)
+        self.assertEqual(c.iterable, array('q', [0, 3, 6, 9]))
+
+    def test_sorted(self):
+        c = collect([3, 1, 2]).array_('i').sorted(reverse=True)
+        self.assertEqual(c.iterable, array('i', [3, 2, 1]))
+
+    def test_slice(self):
+        c = collect(range(10)).array_().slice(2, 5)
+        self.assertEqual(c.iterable, array('q', [2, 3, 4]))
+
+    def test_reversed(self):
+        c = collect(range(3)).array_().reversed()
+        self.assertEqual(c.iterable, array('q', [2, 1, 0]))
+
+    def test_chunks(self):
+        c = collect(range(5)).array_().chunks(2)
+        self.assertEqual(c.iterable, [array('q', [0, 1]), array('q', [2, 3]), array('q', [4])])
+
+    def test_chain(self):
+        c = collect(range(100)).array_().filter(lambda x: x % 2).map(lambda x: x * x).sorted(reverse=True).slice(0, 3)
+        self.assertEqual(c.iterable, array('q', [9801, 9409, 9025]))
+
+    def test_lists_unchanged(self):
+        self.assertEqual(collect([3, 1, 2]).sorted().iterable, [1, 2, 3])
+        self.assertIsInstance(collect([1]).map(abs).iterable, map)
+
+    def test_compact(self):
+        self.assertEqual(compact([1, 2]), array('q', [1, 2]))
+        self.assertEqual(compact([1, 2.5]), array('d', [1, 2.5]))
+        self.assertEqual(compact([1, 'a', 2]), [1, 'a', 2])
+        self.assertEqual(compact([True, 2]), [True, 2])
+        self.assertEqual(compact([1, 2 ** 70]), [1, 2 ** 70])
+        self.assertEqual(compact([0.5, 1]), array('d', [0.5, 1]))
+        self.assertEqual(compact([1, 2 ** 40], 'b'), array('q', [1, 2 ** 40]))
+        self.assertEqual(compact([1, 2 ** 70], 'b'), [1, 2 ** 70])
+
+    def test_compact_inexact_int(self):
+        self.assertEqual(compact([2 ** 60 + 1, 0.5]), [2 ** 60 + 1, 0.5])
+        self.assertEqual(compact([0.5, 2 ** 60 + 1]), [0.5, 2 ** 60 + 1])
+        self.assertEqual(compact([0.5, 2 ** 2000]), [0.5, 2 ** 2000])
+        self.assertEqual(compact([2 ** 60, 0.5]), array('d', [2 ** 60, 0.5]))
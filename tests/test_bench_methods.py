@@ -0,0 +1,34 @@
+import unittest
+
+from benchmarks import bench_methods
+
+
+class TestBenchMethods(unittest.TestCase):
+
+    def test_every_method_has_a_case(self):
+        self.assertEqual(bench_methods.missing_cases(), [])
+
+    def test_run(self):
+        results = bench_methods.run((10,), ('list', 'dict'), ('map', 'items'), repeat=1, min_time=0)
+        self.assertEqual(
+            [(r['method'], r['kind']) for r in results],
+            [('items', 'dict'), ('map', 'list'), ('map', 'dict')]
+        )
+        for result in results:
+            self.assertGreater(result['collection'], 0)
+            self.assertAlmostEqual(result['ratio'], result['collection'] / result['baseline'])
+
+    def test_compare(self):
+        previous = [
+            {'method': 'map', 'kind': 'list', 'size': 10, 'ratio': 1.0},
+            {'method': 'filter', 'kind': 'list', 'size': 10, 'ratio': 1.0},
+        ]
+        results = [
+            {'method': 'map', 'kind': 'list', 'size': 10, 'ratio': 1.5},
+            {'method': 'filter', 'kind': 'list', 'size': 10, 'ratio': 1.1},
+            {'method': 'len', 'kind': 'list', 'size': 10, 'ratio': 9.0},
+        ]
+        regressions = bench_methods.compare(results, previous, 1.25)
+        self.assertEqual([r['method'] for r in regressions], ['map'])
+        self.assertEqual([r['previous'] for r in results], [1.0, 1.0, None])
+        self.assertEqual([r['regression'] for r in results], [True, False, False])
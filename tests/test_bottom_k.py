@@ -0,0 +1,18 @@
+import unittest
+
+from iterable_collections import collect
+
+
+class TestBottomK(unittest.TestCase):
+
+    def test_list(self):
+        c = collect([3, 1, 4, 1, 5, 9, 2, 6]).bottom_k(3)
+        self.assertEqual(c.iterable, [1, 1, 2])
+
+    def test_iterator(self):
+        c = collect(iter(range(100))).bottom_k(2)
+        self.assertEqual(c.iterable, [0, 1])
+
+    def test_key(self):
+        c = collect(['aaa', 'b', 'cc']).bottom_k(2, key=len)
+        self.assertEqual(c.iterable, ['b', 'cc'])
@@ -1,6 +1,7 @@
 import unittest
 
 from iterable_collections import collect
+from iterable_collections.numpy_backend import np
 
 
 class TestChunks(unittest.TestCase):
@@ -23,12 +24,54 @@ class TestChunks(unittest.TestCase):
     def test_iterator(self):
         c = collect(iter(range(10)))
         c.chunks(2)
-        self.assertEqual([[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]], c.iterable)
+        self.assertEqual([[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]], c.list())
+
+    def test_iterator_streams(self):
+        consumed = []
+
+        def source():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        c = collect(source()).chunks(3)
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(iter(c)), [0, 1, 2])
+        self.assertEqual(consumed, [0, 1, 2])
+        self.assertEqual(c.list(), [[3, 4, 5], [6, 7, 8], [9]])
+
+    def test_container(self):
+        self.assertEqual(collect(iter(range(5))).chunks(2, tuple).list(), [(0, 1), (2, 3), (4,)])
+        self.assertEqual(collect(list(range(5))).chunks(2, tuple).list(), [(0, 1), (2, 3), (4,)])
+
+    def test_truthy_container(self):
+        c = collect(iter(range(3))).chunks(2, lambda chunk: ('chunk', *chunk))
+        self.assertEqual(c.list(), [('chunk', 0, 1), ('chunk', 2)])
+        self.assertEqual(collect(iter([])).chunks(2, lambda chunk: ('chunk', *chunk)).list(), [])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed.')
+    def test_array_container(self):
+        c = collect(iter(range(5))).chunks(2, lambda chunk: np.array(list(chunk)))
+        self.assertEqual([chunk.tolist() for chunk in c.list()], [[0, 1], [2, 3], [4]])
+
+    def test_views(self):
+        self.assertEqual([list(v) for v in collect(list(range(5))).chunks(2, None)], [[0, 1], [2, 3], [4]])
+
+    def test_iterator_views(self):
+        views = iter(collect(iter(range(7))).chunks(3, None))
+        self.assertEqual(next(next(views)), 0)
+        self.assertEqual(list(next(views)), [3, 4, 5])
+        self.assertEqual(list(next(views)), [6])
+        self.assertEqual(list(views), [])
+
+    def test_length(self):
+        with self.assertRaises(ValueError):
+            collect(iter(range(5))).chunks(0)
 
     def test_dict(self):
         c = collect({'a': 1, 'b': 2, 'c': 3, 'd': 4})
         c.chunks(2)
-        self.assertEqual(c.iterable, [[('a', 1), ('b', 2)], [('c', 3), ('d', 4)]])
+        self.assertEqual(c.list(), [[('a', 1), ('b', 2)], [('c', 3), ('d', 4)]])
 
     def test_dict_items(self):
         c = collect({'a': 1, 'b': 2, 'c': 3, 'd': 4}.items())
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+from iterable_collections import collect_csv
+
+
+class TestCollectCsv(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(fd, 'w', newline='') as f:
+            f.write('id,name,status\r\n1,a,open\r\n2,"b, c",closed\r\n3,d,open\r\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_dicts(self):
+        c = collect_csv(self.path)
+        self.assertEqual(c.list()[1], {'id': '2', 'name': 'b, c', 'status': 'closed'})
+
+    def test_namedtuples(self):
+        c = collect_csv(self.path, namedtuples=True).filter(lambda row: row.status == 'open').map(lambda row: row.id)
+        self.assertEqual(c.list(), ['1', '3'])
+
+    def test_no_header(self):
+        c = collect_csv(self.path, header=False)
+        self.assertEqual(c.list()[0], ['id', 'name', 'status'])
+
+    def test_field_names(self):
+        c = collect_csv(self.path, header=('a', 'b', 'c'), namedtuples=True)
+        rows = c.list()
+        self.assertEqual(rows[0], ('id', 'name', 'status'))
+        self.assertEqual(rows[0]._fields, ('a', 'b', 'c'))
+
+    def test_batches(self):
+        c = collect_csv(self.path, batch_size=1)
+        self.assertEqual(c.list(), collect_csv(self.path).list())
+
+    def test_reiterable(self):
+        c = collect_csv(self.path)
+        self.assertEqual(list(c.iterable), list(c.iterable))
+
+    def test_delimiter(self):
+        with open(self.path, 'w', newline='') as f:
+            f.write('a;b\n1;2\n')
+        self.assertEqual(collect_csv(self.path, delimiter=';').list(), [{'a': '1', 'b': '2'}])
+
+    def test_empty(self):
+        open(self.path, 'w').close()
+        self.assertEqual(collect_csv(self.path).list(), [])
+
+    def test_namedtuples_without_header(self):
+        with self.assertRaises(ValueError):
+            collect_csv(self.path, header=False, namedtuples=True)
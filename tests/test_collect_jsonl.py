@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import unittest
+
+from iterable_collections import collect_jsonl
+
+
+class TestCollectJsonl(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.jsonl')
+        with os.fdopen(fd, 'w') as f:
+            f.write('{"id": 1, "tags": ["a"]}\n\n{"id": 2, "tags": []}\n{"id": 3, "tags": ["b", "c"]}\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_values(self):
+        c = collect_jsonl(self.path).map(lambda x: len(x['tags']))
+        self.assertEqual(c.list(), [1, 0, 2])
+
+    def test_namedtuples(self):
+        c = collect_jsonl(self.path, namedtuples=True)
+        self.assertEqual([row.id for row in c.list()], [1, 2, 3])
+
+    def test_batches(self):
+        self.assertEqual(collect_jsonl(self.path, batch_size=2).list(), collect_jsonl(self.path).list())
+
+    def test_scalars(self):
+        with open(self.path, 'w') as f:
+            f.write('1\n"a"\nnull\n[1, 2]\n')
+        self.assertEqual(collect_jsonl(self.path).list(), [1, 'a', None, [1, 2]])
+
+    def test_invalid_line(self):
+        with open(self.path, 'a') as f:
+            f.write('{"id": \n')
+        with self.assertRaises(json.JSONDecodeError):
+            collect_jsonl(self.path).list()
+
+    def test_line_with_two_values(self):
+        with open(self.path, 'a') as f:
+            f.write('{"id": 4}, {"id": 5}\n')
+        with self.assertRaises(json.JSONDecodeError):
+            collect_jsonl(self.path).list()
+
+    def test_value_spanning_lines(self):
+        with open(self.path, 'w') as f:
+            f.write('[1\n2]\n3,4\n')
+        for batch_size in (1, 2, 1024):
+            with self.assertRaises(json.JSONDecodeError):
+                collect_jsonl(self.path, batch_size=batch_size).list()
+
+    def test_batch_size(self):
+        with self.assertRaises(ValueError):
+            collect_jsonl(self.path, batch_size=0)
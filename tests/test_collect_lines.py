@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from iterable_collections import collect_lines
+
+
+class TestCollectLines(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b'INFO start\nERROR disk\nINFO done\nERROR net')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_memoryview(self):
+        lines = collect_lines(self.path).list()
+        self.assertTrue(all(isinstance(line, memoryview) for line in lines))
+        self.assertEqual([bytes(line) for line in lines], [b'INFO start', b'ERROR disk', b'INFO done', b'ERROR net'])
+
+    def test_encoding(self):
+        c = collect_lines(self.path, 'utf-8').filter(lambda line: line.startswith('ERROR'))
+        self.assertEqual(c.list(), ['ERROR disk', 'ERROR net'])
+
+    def test_keepends(self):
+        c = collect_lines(self.path, 'utf-8', keepends=True)
+        self.assertEqual(c.list(), ['INFO start\n', 'ERROR disk\n', 'INFO done\n', 'ERROR net'])
+
+    def test_len(self):
+        self.assertEqual(collect_lines(self.path).len(), 4)
+
+    def test_len_trailing_newline(self):
+        with open(self.path, 'ab') as f:
+            f.write(b'\n')
+        c = collect_lines(self.path, 'utf-8')
+        self.assertEqual(c.len(), 4)
+        self.assertEqual(c.list()[-1], 'ERROR net')
+
+    def test_chunks(self):
+        c = collect_lines(self.path, 'ascii').map(len).chunks(3)
+        self.assertEqual(c.list(), [[10, 10, 9], [9]])
+
+    def test_empty(self):
+        open(self.path, 'wb').close()
+        c = collect_lines(self.path)
+        self.assertEqual(c.len(), 0)
+        self.assertEqual(c.list(), [])
+
+    def test_reiterable(self):
+        c = collect_lines(self.path)
+        self.assertEqual(len(list(c.iterable)), len(list(c.iterable)))
+
+    def test_lazy(self):
+        c = collect_lines(self.path, 'utf-8', lazy=True).map(str.split).map(lambda x: x[0])
+        self.assertEqual(c.list(), ['INFO', 'ERROR', 'INFO', 'ERROR'])
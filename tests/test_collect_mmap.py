@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+
+from iterable_collections import collect_mmap
+from iterable_collections.utils import SequenceView
+
+
+class TestCollectMmap(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(bytes(range(256)) * 4)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_bytes(self):
+        c = collect_mmap(self.path)
+        self.assertEqual(c.len(), 1024)
+        self.assertEqual(c.iterable.materialise(), bytes(range(256)) * 4)
+
+    def test_slice_chunks(self):
+        c = collect_mmap(self.path).slice(256, 768).chunks(128)
+        self.assertTrue(all(isinstance(chunk, SequenceView) for chunk in c.iterable))
+        self.assertEqual([chunk.materialise() for chunk in c.iterable], [bytes(range(128)), bytes(range(128, 256))] * 2)
+
+    def test_filter(self):
+        c = collect_mmap(self.path).filter(lambda x: x == 255)
+        self.assertEqual(c.list(), [255] * 4)
+
+    def test_empty(self):
+        open(self.path, 'wb').close()
+        self.assertEqual(collect_mmap(self.path).list(), [])
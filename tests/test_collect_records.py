@@ -0,0 +1,45 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from iterable_collections import collect_records
+
+
+class TestCollectRecords(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            for i in range(10):
+                f.write(struct.pack('<qd', i, i / 2))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_unpack(self):
+        c = collect_records(self.path, '<qd')
+        self.assertEqual(c.len(), 10)
+        self.assertEqual(c.list(), [(i, i / 2) for i in range(10)])
+
+    def test_getitem(self):
+        c = collect_records(self.path, '<qd')
+        self.assertEqual(c.getitem(-1), (9, 4.5))
+
+    def test_raw(self):
+        c = collect_records(self.path, '<qd', unpack=False).slice(2, 4)
+        self.assertEqual([bytes(r) for r in c.iterable], [struct.pack('<qd', i, i / 2) for i in (2, 3)])
+
+    def test_slice_chunks(self):
+        c = collect_records(self.path, '<qd').slice(1, None, 2).chunks(2, None)
+        self.assertEqual([[r[0] for r in chunk] for chunk in c.iterable], [[1, 3], [5, 7], [9]])
+
+    def test_filter_map(self):
+        c = collect_records(self.path, '<qd').filter(lambda r: r[0] % 3 == 0).map(lambda r: r[1])
+        self.assertEqual(c.list(), [0.0, 1.5, 3.0, 4.5])
+
+    def test_partial_record(self):
+        with open(self.path, 'ab') as f:
+            f.write(b'\x00')
+        with self.assertRaises(ValueError):
+            collect_records(self.path, '<qd')
@@ -0,0 +1,35 @@
+import unittest
+
+from iterable_collections import collect
+from iterable_collections.collection import Collection, collection_type, default_collection_type
+from iterable_collections.factory import default_registry
+
+
+class TestCollectionType(unittest.TestCase):
+
+    def test_default_type(self):
+        c = collect([1, 2, 3])
+        self.assertIs(type(c), default_collection_type())
+        self.assertIsInstance(c, Collection)
+        self.assertIs(default_collection_type(), default_collection_type())
+
+    def test_methods_are_class_attributes(self):
+        c = collect([1, 2, 3])
+        self.assertIs(type(c).__dict__['map'], default_registry().methods['map'])
+        self.assertNotIn('map', vars(c))
+        self.assertIs(c.map.__self__, c)
+
+    def test_chain(self):
+        c = collect([1, 2, 3]).map(lambda x: x * 2).filter(lambda x: x > 2)
+        self.assertEqual(c.list(), [4, 6])
+
+    def test_custom_strategies(self):
+        cls = collection_type({'len': default_registry()['len']})
+        c = cls([1, 2, 3], {})
+        self.assertEqual(c.len(), 3)
+        with self.assertRaises(AttributeError):
+            c.map(str)
+
+    def test_getattr_fallback(self):
+        c = Collection([1, 2, 3], default_registry())
+        self.assertEqual(c.map(lambda x: x + 1).list(), [2, 3, 4])
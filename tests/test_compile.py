@@ -0,0 +1,83 @@
+import unittest
+
+from iterable_collections import collect
+from iterable_collections.collection import Collection, collection_type
+from iterable_collections.factory import default_registry
+from iterable_collections.strategy import MethodStrategy, MethodStrategyInterface, StoreResultStrategy, \
+    ReturnInstanceStrategy, PartialIterableBindingStrategy, UnformattedArgumentFormattingStrategy, \
+    PreProcessingStrategy, BaseExceptionErrorHandlingStrategy
+
+
+class CountingStoreResultStrategy(StoreResultStrategy):
+    def __init__(self):
+        self.calls = 0
+
+    def handle_result(self, result, iterable, store=None):
+        self.calls += 1
+        return super().handle_result(result, iterable, store)
+
+
+class LenMethodStrategy(MethodStrategyInterface):
+    def make_method(self, instance):
+        return lambda: len(instance.iterable)
+
+
+class TestCompile(unittest.TestCase):
+
+    def test_matches_generic(self):
+        for name, args, kwargs in (
+                ('len', (), {}),
+                ('map', (lambda x: x + 1,), {}),
+                ('filter', (lambda x: x > 1,), {}),
+                ('reduce', (lambda x, y: x + y,), {}),
+                ('sorted', (), {'reverse': True}),
+                ('diff_seq', ([1, 2],), {}),
+                ('first', (), {}),
+                ('contains', (2,), {'ret': False})
+        ):
+            generic = Collection([3, 1, 2], default_registry())
+            compiled = collect([3, 1, 2])
+            a = getattr(generic, name)(*args, **kwargs)
+            b = getattr(compiled, name)(*args, **kwargs)
+            self.assertEqual(a is generic, b is compiled)
+            if a is not generic:
+                self.assertEqual(a, b)
+            self.assertEqual(list(generic), list(compiled))
+
+    def test_store_and_ret(self):
+        c = collect([1, 2, 3])
+        self.assertEqual(c.len(store=True, ret=False), c)
+        self.assertEqual(c.iterable, 3)
+        c = collect([1, 2, 3])
+        self.assertEqual(list(c.map(str, ret=True, store=False)), ['1', '2', '3'])
+        self.assertEqual(c.iterable, [1, 2, 3])
+
+    def test_error_strategy(self):
+        with self.assertRaisesRegex(IndexError, 'Index 0 is not set on iterable.'):
+            collect([]).first()
+        with self.assertRaisesRegex(ValueError, 'Invalid iterable structure'):
+            collect([1, 2]).dict()
+
+    def test_pre_process(self):
+        self.assertEqual(collect({'a': 1, 'b': 2}).map_items(lambda k, v: (k, v + 1)).dict(), {'a': 2, 'b': 3})
+
+    def test_custom_strategy_is_not_inlined(self):
+        result_strategy = CountingStoreResultStrategy()
+        strategy = MethodStrategy(
+            'list_',
+            list,
+            result_strategy,
+            ReturnInstanceStrategy(),
+            PartialIterableBindingStrategy(),
+            UnformattedArgumentFormattingStrategy(),
+            PreProcessingStrategy(),
+            BaseExceptionErrorHandlingStrategy()
+        )
+        c = collection_type({'list_': strategy})(iter(range(3)), {})
+        c.list_()
+        self.assertEqual(result_strategy.calls, 1)
+        self.assertEqual(c.iterable, [0, 1, 2])
+
+    def test_interface_compile(self):
+        c = collection_type({'size': LenMethodStrategy()})([1, 2, 3], {})
+        self.assertEqual(c.size(), 3)
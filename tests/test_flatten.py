@@ -8,19 +8,19 @@ class TestFlatten(unittest.TestCase):
 
     def test_nested_list(self):
         c = collect([[1, 2], ['foo', 4], [5, b'bar'], [7, 8]]).flatten()
-        self.assertEqual(c.iterable, [1, 2, 'foo', 4, 5, b'bar', 7, 8])
+        self.assertEqual(c.list(), [1, 2, 'foo', 4, 5, b'bar', 7, 8])
 
     def test_nested_tuple(self):
         c = collect(((1, 2), ('foo', 4), (5, b'bar'), (7, 8))).flatten()
-        self.assertEqual(c.iterable, [1, 2, 'foo', 4, 5, b'bar', 7, 8])
+        self.assertEqual(c.list(), [1, 2, 'foo', 4, 5, b'bar', 7, 8])
 
     def test_nested_iter(self):
         c = collect(chain(iter((1, 2)), iter(('foo', 4)), iter((5, b'bar')), iter((7, 8)))).flatten()
-        self.assertEqual(c.iterable, [1, 2, 'foo', 4, 5, b'bar', 7, 8])
+        self.assertEqual(c.list(), [1, 2, 'foo', 4, 5, b'bar', 7, 8])
 
     def test_deeply_nested_list(self):
         c = collect([[1, [2, ['foo', 4]], [[5], [b'bar', [7, [8]]]]]]).flatten()
-        self.assertEqual(c.iterable, [1, 2, 'foo', 4, 5, b'bar', 7, 8])
+        self.assertEqual(c.list(), [1, 2, 'foo', 4, 5, b'bar', 7, 8])
 
     def test_nested_list_of_dicts(self):
         c = collect([
@@ -40,7 +40,7 @@ class TestFlatten(unittest.TestCase):
                 {'bar': 'bar'}
             ]
         ]).flatten()
-        self.assertEqual(c.iterable, [
+        self.assertEqual(c.list(), [
             {'foo': 'bar'},
             {'foo': 'baz'},
             {'bar': 'foo'},
@@ -49,3 +49,34 @@ class TestFlatten(unittest.TestCase):
             {'bar': 'baz'},
             {'bar': 'bar'}
         ])
+
+    def test_depth(self):
+        self.assertEqual(collect([1, [2, [3, [4]]]]).flatten(depth=1).list(), [1, 2, [3, [4]]])
+        self.assertEqual(collect([1, [2, [3, [4]]]]).flatten(depth=2).list(), [1, 2, 3, [4]])
+        self.assertEqual(collect([1, [2]]).flatten(depth=0).list(), [1, [2]])
+
+    def test_atomic(self):
+        c = collect([(1, 2), [3, (4, 5)]]).flatten(atomic=(str, bytes, tuple))
+        self.assertEqual(c.list(), [(1, 2), 3, (4, 5)])
+        c = collect([(1, 'ab'), ['cd', (b'ef',)]]).flatten(atomic=(tuple,))
+        self.assertEqual(c.list(), [(1, 'ab'), 'cd', (b'ef',)])
+        self.assertEqual(collect([[b'ab', ['cd']]]).flatten(atomic=(list,)).list(), [[b'ab', ['cd']]])
+
+    def test_lazy(self):
+        consumed = []
+
+        def source():
+            for i in range(3):
+                consumed.append(i)
+                yield [i, [i]]
+
+        c = collect(source()).flatten()
+        self.assertEqual(next(iter(c)), 0)
+        self.assertEqual(consumed, [0])
+        self.assertEqual(c.list(), [0, 1, 1, 2, 2])
+
+    def test_beyond_recursion_limit(self):
+        nested = [0]
+        for i in range(1, 10000):
+            nested = [i, nested]
+        self.assertEqual(len(collect(nested).flatten().list()), 10000)
@@ -0,0 +1,66 @@
+import unittest
+from collections import namedtuple
+
+from iterable_collections import collect
+
+Row = namedtuple('Row', 'name team score')
+
+ROWS = [
+    Row('a', 'red', 3),
+    Row('b', 'blue', 5),
+    Row('c', 'red', 1),
+    Row('d', 'green', 4),
+    Row('e', 'blue', 2),
+]
+
+
+class TestGroupBy(unittest.TestCase):
+
+    def test_lists(self):
+        c = collect(ROWS).group_by(lambda r: r.team)
+        self.assertEqual(c.iterable, {
+            'red': [ROWS[0], ROWS[2]],
+            'blue': [ROWS[1], ROWS[4]],
+            'green': [ROWS[3]],
+        })
+
+    def test_order(self):
+        c = collect(ROWS).group_by(key=lambda r: r.team)
+        self.assertEqual(list(c.iterable), ['red', 'blue', 'green'])
+
+    def test_no_key(self):
+        c = collect([1, 2, 1, 3, 1]).group_by()
+        self.assertEqual(c.iterable, {1: [1, 1, 1], 2: [2], 3: [3]})
+
+    def test_iterator(self):
+        c = collect(iter(ROWS)).group_by(lambda r: r.team, 'count')
+        self.assertEqual(c.iterable, {'red': 2, 'blue': 2, 'green': 1})
+
+    def test_named_reducers(self):
+        self.assertEqual(
+            collect(r.score for r in ROWS).group_by(lambda s: s % 2, 'sum').iterable,
+            {1: 9, 0: 6}
+        )
+        self.assertEqual(collect([3, 5, 1, 4, 2]).group_by(lambda s: s % 2, 'min').iterable, {1: 1, 0: 2})
+        self.assertEqual(collect([3, 5, 1, 4, 2]).group_by(lambda s: s % 2, 'max').iterable, {1: 5, 0: 4})
+
+    def test_named_reducers_with_initializer(self):
+        self.assertEqual(collect([3, 5, 1, 4, 2]).group_by(lambda s: s % 2, 'sum', 10).iterable, {1: 19, 0: 16})
+        self.assertEqual(collect([3, 5, 1, 4, 2]).group_by(lambda s: s % 2, 'count', 1).iterable, {1: 4, 0: 3})
+        self.assertEqual(collect([3, 5, 1, 4, 2]).group_by(lambda s: s % 2, 'max', 4).iterable, {1: 5, 0: 4})
+
+    def test_custom_reducer(self):
+        c = collect(ROWS).group_by(lambda r: r.team, lambda total, r: total + r.score, 0)
+        self.assertEqual(c.iterable, {'red': 4, 'blue': 7, 'green': 4})
+
+    def test_reducer_without_initializer(self):
+        c = collect(ROWS).group_by(lambda r: r.team, lambda best, r: max(best, r, key=lambda x: x.score))
+        self.assertEqual(c.iterable, {'red': ROWS[0], 'blue': ROWS[1], 'green': ROWS[3]})
+
+    def test_unknown_reducer(self):
+        with self.assertRaises(ValueError):
+            collect(ROWS).group_by(lambda r: r.team, 'median')
+
+    def test_lazy(self):
+        c = collect(ROWS, lazy=True).group_by(lambda r: r.team, 'count').dict()
+        self.assertEqual(c, {'red': 2, 'blue': 2, 'green': 1})
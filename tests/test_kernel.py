@@ -0,0 +1,46 @@
+import unittest
+
+from iterable_collections import collect
+from iterable_collections.kernel import Stage, compile_kernel
+
+
+class TestKernel(unittest.TestCase):
+
+    def test_compile_kernel(self):
+        kernel = compile_kernel([
+            Stage('map', lambda x: x + 1),
+            Stage('filter', None),
+            Stage('emap', lambda i, x: (i, x)),
+            Stage('filter', lambda x: x[1] % 2)
+        ])
+        self.assertEqual(list(kernel(range(-1, 6))), [(0, 1), (2, 3), (4, 5)])
+
+    def test_compile_items_kernel(self):
+        kernel = compile_kernel([Stage('map_items', lambda k, v: (k, v * 2)), Stage('filter_items', lambda k, v: v > 2)])
+        self.assertEqual(dict(kernel({'a': 1, 'b': 2}.items())), {'b': 4})
+
+    def test_unknown_stage(self):
+        with self.assertRaises(ValueError):
+            compile_kernel([Stage('sorted', None)])
+
+    def test_lazy_fused(self):
+        c = collect(range(10), lazy=True).map(lambda x: x * 2).filter(lambda x: x % 3).emap(lambda i, x: i + x)
+        self.assertEqual(c.list(), list(map(lambda p: p[0] + p[1], enumerate(
+            filter(lambda x: x % 3, map(lambda x: x * 2, range(10)))
+        ))))
+        self.assertEqual(c.statistics['stages_fused'], 3)
+
+    def test_lazy_fused_items(self):
+        c = collect({'a': 1, 'b': 2, 'c': 3}, lazy=True).filter_items(lambda k, v: v > 1).map(lambda x: x[1])
+        self.assertEqual(c.list(), [2, 3])
+        self.assertEqual(c.statistics['stages_fused'], 2)
+
+    def test_lazy_items_stage_not_leading(self):
+        c = collect({'a': 1, 'b': 2, 'c': 3}, lazy=True).filter_items(lambda k, v: v > 1).map_items(lambda k, v: v)
+        self.assertEqual(c.list(), [2, 3])
+        self.assertEqual(c.statistics['stages_fused'], 0)
+
+    def test_lazy_not_fused(self):
+        c = collect(range(5), lazy=True).map(lambda x, y: x + y, range(5)).filter(None)
+        self.assertEqual(c.list(), [2, 4, 6, 8])
+        self.assertEqual(c.statistics['stages_fused'], 0)
@@ -0,0 +1,46 @@
+import unittest
+
+from iterable_collections import collect
+from iterable_collections.collection import LazyCollection
+
+
+class TestLazy(unittest.TestCase):
+
+    def test_deferred(self):
+        calls = []
+        c = collect([1, 2, 3], lazy=True).map(lambda x: calls.append(x) or x * 2).filter(lambda x: x > 2).list_()
+        self.assertIsInstance(c, LazyCollection)
+        self.assertEqual([s.name for s in c.plan], ['map', 'filter', 'list_'])
+        self.assertEqual(calls, [])
+        self.assertEqual(c.list(), [4, 6])
+        self.assertEqual(calls, [1, 2, 3])
+        self.assertEqual(len(c.plan), 0)
+
+    def test_lazy_method(self):
+        c = collect([3, 1, 2]).lazy().sorted()
+        self.assertEqual(c.first(), 1)
+
+    def test_terminal_methods(self):
+        c = collect(range(5), lazy=True).map(lambda x: x + 1)
+        self.assertEqual(c.reduce(lambda x, y: x + y), 15)
+        c = collect(['a', 'b'], lazy=True).map(str.upper)
+        self.assertEqual(c.join('-'), 'A-B')
+        self.assertEqual(collect([], lazy=True).list_().len(), 0)
+
+    def test_ret(self):
+        c = collect([1, 2, 3], lazy=True)
+        self.assertEqual(list(c.map(str, ret=True)), ['1', '2', '3'])
+        self.assertIs(c.len(ret=False), c)
+
+    def test_continues_after_execution(self):
+        c = collect([1, 2, 3], lazy=True).map(lambda x: x * 10).list_()
+        self.assertEqual(c.len(), 3)
+        c.filter(lambda x: x > 10)
+        self.assertEqual(c.list(), [20, 30])
+
+    def test_iter(self):
+        self.assertEqual(list(collect([1, 2], lazy=True).map(str)), ['1', '2'])
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            collect([], lazy=True).foo()
@@ -0,0 +1,101 @@
+import tracemalloc
+import unittest
+from array import array
+
+from iterable_collections import collect
+from iterable_collections.factory import default_registry
+from iterable_collections.profiling import Materialisation, MaterialisationTracker, profiled_registry
+from iterable_collections.strategy import PreProcessingStrategy, TrackingPreProcessingStrategy
+
+
+class TestMaterialisationTracker(unittest.TestCase):
+
+    def test_records_conversion(self):
+        tracker = MaterialisationTracker()
+        c = collect({3, 1, 2}, profiler=tracker).reversed()
+        self.assertEqual(sorted(c.list()), [1, 2, 3])
+        self.assertEqual(len(tracker.materialisations), 1)
+        self.assertEqual(tracker.materialisations[0][:3], ('reversed', 'list', 3))
+        self.assertGreater(tracker.materialisations[0].nbytes, 0)
+
+    def test_records_set_conversion(self):
+        tracker = MaterialisationTracker()
+        self.assertEqual(collect([1, 2, 3], profiler=tracker).diff_seq([2]).list(), [1, 3])
+        self.assertEqual([m[:3] for m in tracker.materialisations], [('diff_seq', 'set', 3)])
+
+    def test_skipped_conversion_is_not_recorded(self):
+        tracker = MaterialisationTracker()
+        collect([1, 2, 3], profiler=tracker).reversed()
+        collect(array('i', [1, 2, 3]), profiler=tracker).reversed()
+        self.assertEqual(tracker.materialisations, [])
+
+    def test_views_are_not_recorded(self):
+        tracker = MaterialisationTracker()
+        self.assertEqual(collect(['a', 'b'], profiler=tracker).emap(lambda i, x: i).list(), [0, 1])
+        self.assertEqual(collect({'a': 1}, profiler=tracker).map_items(lambda k, v: v).list(), [1])
+        self.assertEqual([m[:2] for m in tracker.materialisations], [('items', 'dict')])
+
+    def test_lazy_elided_conversion_is_not_recorded(self):
+        tracker = MaterialisationTracker()
+        c = collect({3, 1, 2}, lazy=True, profiler=tracker).sorted().reversed()
+        self.assertEqual(c.list(), [3, 2, 1])
+        self.assertEqual(tracker.materialisations, [])
+        c = collect({3, 1, 2}, lazy=True, profiler=tracker).reversed()
+        self.assertEqual(sorted(c.list()), [1, 2, 3])
+        self.assertEqual([m[:3] for m in tracker.materialisations], [('reversed', 'list', 3)])
+
+    def test_tracemalloc(self):
+        tracker = MaterialisationTracker()
+        tracemalloc.start()
+        try:
+            collect(set(range(10000)), profiler=tracker).reversed()
+        finally:
+            tracemalloc.stop()
+        self.assertGreaterEqual(tracker.materialisations[0].nbytes, 10000 * 8)
+
+    def test_tracemalloc_peak_is_kept(self):
+        tracker = MaterialisationTracker()
+        tracemalloc.start()
+        try:
+            data = list(range(100000))
+            del data
+            peak = tracemalloc.get_traced_memory()[1]
+            collect({1, 2}, profiler=tracker).reversed()
+            self.assertGreaterEqual(tracemalloc.get_traced_memory()[1], peak)
+        finally:
+            tracemalloc.stop()
+
+    def test_logging(self):
+        tracker = MaterialisationTracker()
+        with self.assertLogs('iterable_collections.profiling', 'INFO') as logs:
+            collect({1, 2}, profiler=tracker).reversed()
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('reversed materialised 2 elements', logs.output[0])
+
+    def test_report(self):
+        tracker = MaterialisationTracker()
+        collect({1, 2}, profiler=tracker).reversed()
+        collect(set(range(1000)), profiler=tracker).reversed()
+        collect([1, 2], profiler=tracker).diff_seq([1])
+        lines = tracker.report().splitlines()
+        self.assertEqual(lines[0].split(), ['method', 'operation', 'count', 'elements', 'bytes'])
+        self.assertEqual(lines[1].split()[:4], ['reversed', 'list', '2', '1002'])
+        self.assertEqual(list(tracker.summary()), [('reversed', 'list'), ('diff_seq', 'set')])
+
+    def test_reset(self):
+        tracker = MaterialisationTracker()
+        collect({1, 2}, profiler=tracker).reversed()
+        tracker.reset()
+        self.assertEqual(tracker.materialisations, [])
+        self.assertEqual(tracker.summary(), {})
+
+    def test_profiled_registry(self):
+        tracker = MaterialisationTracker()
+        registry = profiled_registry(default_registry(), tracker)
+        self.assertIs(type(registry['reversed'].pre_process_strategy), TrackingPreProcessingStrategy)
+        self.assertIs(type(registry['map'].pre_process_strategy), PreProcessingStrategy)
+        self.assertIs(type(default_registry()['reversed'].pre_process_strategy), PreProcessingStrategy)
+        self.assertIsNone(registry['reversed'].profiling_hook)
+
+    def test_materialisation(self):
+        self.assertEqual(Materialisation('slice', 'list', 3, 88).operation, 'list')
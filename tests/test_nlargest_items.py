@@ -0,0 +1,18 @@
+import unittest
+
+from iterable_collections import collect
+
+
+class TestNLargestItems(unittest.TestCase):
+
+    def test_dict(self):
+        c = collect({'a': 3, 'b': 1, 'c': 2}).nlargest_items(2, lambda k, v: v)
+        self.assertEqual(c.iterable, [('a', 3), ('c', 2)])
+
+    def test_key_keyword(self):
+        c = collect({'a': 3, 'b': 1, 'c': 2}).nlargest_items(1, key=lambda k, v: -v)
+        self.assertEqual(c.iterable, [('b', 1)])
+
+    def test_no_key(self):
+        c = collect({'a': 3, 'b': 1, 'c': 2}).nlargest_items(1)
+        self.assertEqual(c.iterable, [('c', 2)])
@@ -0,0 +1,10 @@
+import unittest
+
+from iterable_collections import collect
+
+
+class TestNLargestNtItems(unittest.TestCase):
+
+    def test_dict(self):
+        c = collect({'a': 3, 'b': 1, 'c': 2}).nlargest_nt_items(2, key=lambda i: i.value)
+        self.assertEqual([i.key for i in c.iterable], ['a', 'c'])
@@ -0,0 +1,129 @@
+import operator
+import unittest
+from functools import partial
+
+from iterable_collections import collect
+from iterable_collections.numpy_backend import Elementwise, np, VectorisedMethodStrategy
+from iterable_collections.collection import default_collection_type, default_numpy_collection_type
+
+numpy_collect = partial(collect, backend='numpy')
+
+
+class TestBackend(unittest.TestCase):
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            collect([1, 2], backend='fortran')
+
+    @unittest.skipIf(np is not None, 'NumPy is installed.')
+    def test_missing_numpy(self):
+        with self.assertRaises(ImportError):
+            collect([1, 2], backend='numpy')
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed.')
+class TestNumpyBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.array = np.array([3, 1, 4, 1, 5, 9, 2, 6])
+
+    def test_selected_for_arrays(self):
+        self.assertIsInstance(collect(self.array), default_numpy_collection_type())
+        self.assertEqual(collect(self.array).map(lambda x: x - x.min()).list(), [0] * 8)
+        self.assertIs(type(collect([1, 2])), default_collection_type())
+        self.assertIs(type(collect(self.array, backend='python')), default_collection_type())
+
+    def test_backend_argument(self):
+        c = collect(iter([1, 2, 3]), backend='numpy')
+        self.assertIsInstance(c.iterable, np.ndarray)
+        np.testing.assert_array_equal(c.iterable, [1, 2, 3])
+
+    def test_map(self):
+        c = numpy_collect(self.array).map(Elementwise(lambda x: x * 2))
+        self.assertIsInstance(c.iterable, np.ndarray)
+        np.testing.assert_array_equal(c.iterable, self.array * 2)
+        self.assertEqual(numpy_collect(self.array).map(Elementwise(str)).list(), list(map(str, self.array)))
+
+    def test_map_ufunc(self):
+        c = numpy_collect(self.array).map(np.negative)
+        np.testing.assert_array_equal(c.iterable, -self.array)
+
+    def test_map_per_element(self):
+        calls = []
+
+        def record(x):
+            calls.append(x)
+            return x - x.min()
+
+        self.assertEqual(numpy_collect(self.array).map(record).list(), [0] * 8)
+        self.assertEqual(len(calls), 8)
+
+    def test_map_fallback(self):
+        c = numpy_collect(self.array).map(lambda x: x if x > 2 else 0)
+        self.assertEqual(c.list(), [3, 0, 4, 0, 5, 9, 0, 6])
+        self.assertEqual(numpy_collect(self.array).map(str).list(), ['3', '1', '4', '1', '5', '9', '2', '6'])
+
+    def test_filter(self):
+        c = numpy_collect(self.array).filter(Elementwise(lambda x: x > 3))
+        self.assertIsInstance(c.iterable, np.ndarray)
+        np.testing.assert_array_equal(c.iterable, [4, 5, 9, 6])
+        np.testing.assert_array_equal(numpy_collect(np.array([1.0, np.nan])).filter(np.isfinite).iterable, [1.0])
+        self.assertEqual(numpy_collect(self.array).filter(lambda x: x > 3).list(), [4, 5, 9, 6])
+
+    def test_filter_none(self):
+        np.testing.assert_array_equal(numpy_collect(np.array([0, 1, 0, 2])).filter(None).iterable, [1, 2])
+
+    def test_filter_fallback(self):
+        self.assertEqual(numpy_collect(self.array).filter(lambda x: x in (1, 9)).list(), [1, 1, 9])
+
+    def test_reduce(self):
+        self.assertEqual(numpy_collect(self.array).reduce(operator.add), 31)
+        self.assertEqual(numpy_collect(self.array).reduce(operator.add, 10), 41)
+        self.assertEqual(numpy_collect(self.array).reduce(np.maximum), 9)
+        self.assertEqual(numpy_collect(self.array).reduce(lambda x, y: x - y), 3 - 28)
+
+    def test_reduce_empty(self):
+        self.assertEqual(numpy_collect(np.array([])).reduce(operator.add, 0), 0)
+        with self.assertRaises(TypeError):
+            numpy_collect(np.array([])).reduce(operator.add)
+
+    def test_max_min(self):
+        self.assertEqual(numpy_collect(self.array).max(), 9)
+        self.assertEqual(numpy_collect(self.array).min(), 1)
+        self.assertEqual(numpy_collect(self.array).max(key=lambda x: -x), 1)
+        self.assertEqual(numpy_collect(np.array([])).min(default=None), None)
+        with self.assertRaises(ValueError):
+            numpy_collect(np.array([])).max()
+
+    def test_sorted(self):
+        c = numpy_collect(self.array).sorted()
+        self.assertIsInstance(c.iterable, np.ndarray)
+        np.testing.assert_array_equal(c.iterable, sorted(self.array))
+        np.testing.assert_array_equal(numpy_collect(self.array).sorted(reverse=True).iterable, sorted(self.array)[::-1])
+        self.assertEqual(numpy_collect(self.array).sorted(key=lambda x: -x).list(), sorted(self.array, reverse=True))
+
+    def test_unique(self):
+        c = numpy_collect(self.array).unique()
+        self.assertIsInstance(c.iterable, np.ndarray)
+        np.testing.assert_array_equal(c.iterable, [3, 1, 4, 5, 9, 2, 6])
+
+    def test_chain(self):
+        c = numpy_collect(np.arange(10)).map(Elementwise(lambda x: x * x)).filter(Elementwise(lambda x: x % 2 == 0))
+        self.assertIsInstance(c.iterable, np.ndarray)
+        result = c.reduce(operator.add)
+        self.assertEqual(result, sum(x * x for x in range(10) if x % 2 == 0))
+
+    def test_python_methods(self):
+        self.assertEqual(numpy_collect(self.array).len(), 8)
+        self.assertEqual(len(numpy_collect(self.array).chunks(4).list()), 2)
+
+    def test_lazy(self):
+        c = numpy_collect(self.array, lazy=True).map(Elementwise(lambda x: x + 1)).filter(Elementwise(lambda x: x > 5))
+        c = c.sorted()
+        np.testing.assert_array_equal(c.iterable, [6, 7, 10])
+        self.assertEqual(c.statistics['stages_fused'], 0)
+        self.assertEqual(numpy_collect(self.array, lazy=True).sorted().pop(), 9)
+
+    def test_strategy(self):
+        strategy = numpy_collect(self.array)._strategies['map']
+        self.assertIsInstance(strategy, VectorisedMethodStrategy)
@@ -0,0 +1,57 @@
+import pickle
+import unittest
+from operator import sub
+
+from iterable_collections.utils import partial_at_position, rpartial
+
+
+def f(x, y, z=None):
+    return x, y, z
+
+
+class TestRpartial(unittest.TestCase):
+
+    def test_args(self):
+        self.assertEqual(rpartial(f, 2)(1), (1, 2, None))
+        self.assertEqual(rpartial(f, 1, 2)(), (1, 2, None))
+        self.assertEqual(rpartial(sub, 1)(3), 2)
+
+    def test_kwargs(self):
+        self.assertEqual(rpartial(f, y=2)(1), (1, 2, None))
+        self.assertEqual(rpartial(f, 2)(1, z=3), (1, 2, 3))
+        self.assertEqual(rpartial(f, 2, z=3)(1, z=4), (1, 2, 3))
+
+    def test_pickle(self):
+        p = pickle.loads(pickle.dumps(rpartial(sub, 1)))
+        self.assertEqual(p(3), 2)
+
+    def test_repr(self):
+        self.assertEqual(repr(rpartial(sub, 1)), 'rpartial(<built-in function sub>, 1)')
+
+
+class TestPartialAtPosition(unittest.TestCase):
+
+    def test_args(self):
+        self.assertEqual(partial_at_position(f, 1, pos=1)(0, 2), (0, 1, 2))
+        self.assertEqual(partial_at_position(f, 1, pos=1)(0), (0, 1, None))
+        self.assertEqual(partial_at_position(f, 1, 1, pos=0)(2), (1, 1, 2))
+        self.assertEqual(partial_at_position(f, 1, 1, 1, pos=0)(), (1, 1, 1))
+        self.assertEqual(partial_at_position(f, 1, pos=-1)(0, 2), (0, 1, 2))
+
+    def test_short_args(self):
+        self.assertEqual(partial_at_position(f, 2, pos=2)(0), (0, 2, None))
+
+    def test_kwargs(self):
+        self.assertEqual(partial_at_position(f, 1, 1, pos=0, z=1)(), (1, 1, 1))
+        self.assertEqual(partial_at_position(f, 1, pos=1)(0, z=2), (0, 1, 2))
+        self.assertEqual(partial_at_position(f, 1, pos=0, z=2)(0, z=3), (1, 0, 2))
+
+    def test_pickle(self):
+        p = pickle.loads(pickle.dumps(partial_at_position(sub, 1, pos=1)))
+        self.assertEqual(p(3), 2)
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(partial_at_position(sub, 1, pos=1)),
+            'partial_at_position(<built-in function sub>, 1, pos=1)'
+        )
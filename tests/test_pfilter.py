@@ -0,0 +1,18 @@
+import unittest
+
+from iterable_collections import collect
+
+
+class TestPFilter(unittest.TestCase):
+
+    def test_list(self):
+        c = collect([0, 1, '', 'a', None, 2]).pfilter(bool, workers=2)
+        self.assertEqual(c.iterable, [1, 'a', 2])
+
+    def test_iterator(self):
+        c = collect(iter(range(10))).pfilter(bool, workers=2, chunksize=4)
+        self.assertEqual(c.iterable, list(range(1, 10)))
+
+    def test_unordered(self):
+        c = collect(range(100)).pfilter(bool, workers=2, chunksize=9, ordered=False)
+        self.assertEqual(sorted(c.iterable), list(range(1, 100)))
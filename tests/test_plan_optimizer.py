@@ -0,0 +1,88 @@
+import itertools
+import unittest
+from array import array
+
+from iterable_collections import collect
+from iterable_collections.collection import LazyCollection
+from iterable_collections.factory import default_registry
+from iterable_collections.plan import Plan, PlanOptimizer, Step
+
+
+class TestPlanOptimizer(unittest.TestCase):
+
+    def test_elide_set_conversions(self):
+        c = collect(range(10), lazy=True).diff_seq([1]).intersect_seq(range(8)).diff_seq([2])
+        self.assertEqual(c.set(), set(range(10)) - {1} & set(range(8)) - {2})
+        self.assertEqual(c.statistics['conversions_elided'], 2)
+
+    def test_elide_list_conversion(self):
+        c = collect((5, 4, 3, 2, 1), lazy=True).slice(0, 3).reversed()
+        self.assertEqual(c.list(), [3, 4, 5])
+        self.assertEqual(c.statistics['conversions_elided'], 1)
+
+    def test_source_is_not_elided(self):
+        data = [1, 2, 3]
+        c = collect(data, lazy=True).reversed()
+        self.assertEqual(c.pop(), 1)
+        self.assertEqual(data, [1, 2, 3])
+        self.assertEqual(c.statistics['conversions_elided'], 0)
+
+    def test_store_is_not_elided(self):
+        c = collect({1, 2}, lazy=True).sorted(store=False).reversed()
+        self.assertEqual(sorted(c.list()), [1, 2])
+        self.assertEqual(c.statistics['conversions_elided'], 0)
+
+    def test_merge_map(self):
+        c = collect(range(5), lazy=True).map(lambda x: x + 1).map(lambda x: x * 2).map(str)
+        self.assertEqual(c.list(), ['2', '4', '6', '8', '10'])
+        self.assertEqual(c.statistics['stages_merged'], 2)
+
+    def test_merge_filter(self):
+        c = collect([0, 1, 2, 3, 4], lazy=True).filter(None).filter(lambda x: x % 2)
+        self.assertEqual(c.list(), [1, 3])
+        self.assertEqual(c.statistics['stages_merged'], 1)
+
+    def test_map_with_iterables_is_not_merged(self):
+        c = collect([1, 2], lazy=True).map(lambda x, y: x + y, [10, 20]).map(str)
+        self.assertEqual(c.list(), ['11', '22'])
+        self.assertEqual(c.statistics['stages_merged'], 0)
+
+    def test_optimize(self):
+        plan = Plan([Step('map', (abs,)), Step('map', (str,)), Step('list_')])
+        optimized = PlanOptimizer().optimize(plan, default_registry())
+        self.assertEqual([s.name for s in optimized], ['map', 'list_'])
+        self.assertEqual(len(plan), 3)
+
+    def test_array_source_is_not_optimized(self):
+        c = collect(array('q', [3, 1, 2]), lazy=True).sorted().concat_seq([4])
+        self.assertEqual(c.list(), [1, 2, 3, 4])
+        self.assertEqual(c.statistics, {})
+        c = collect(array('q', [1, 2, 3]), lazy=True).map(lambda x: x * 2).filter(lambda x: x > 2)
+        self.assertEqual(c.iterable, array('q', [4, 6]))
+
+    def test_steps_after_array_are_not_optimized(self):
+        plan = Plan([Step('map', (abs,)), Step('map', (str,)), Step('array_', ('u',)), Step('map', (str,)),
+                     Step('map', (str,)), Step('list_')])
+        optimized = PlanOptimizer().optimize(plan, default_registry())
+        self.assertEqual([s.name for s in optimized], ['map', 'array_', 'map', 'map', 'list_'])
+        optimized = PlanOptimizer().optimize(plan, default_registry(), array('q'))
+        self.assertEqual(len(optimized), 6)
+
+    def test_matches_eager(self):
+        methods = (
+            ('sorted', ()), ('reversed', ()), ('slice', (1, None)), ('map', (lambda x: x + 1,)),
+            ('filter', (lambda x: x % 2,)), ('concat_seq', ([4],)), ('diff_seq', ([2],)), ('top_k', (2,)),
+        )
+        for first, second, third in itertools.product(methods, repeat=3):
+            with self.subTest(methods=(first[0], second[0], third[0])):
+                eager = collect(array('q', [3, 1, 2, 5]))
+                lazy = collect(array('q', [3, 1, 2, 5]), lazy=True)
+                for name, args in (first, second, third):
+                    eager = getattr(eager, name)(*args)
+                    lazy = getattr(lazy, name)(*args)
+                self.assertEqual(lazy.list(), eager.list())
+
+    def test_no_rules(self):
+        c = LazyCollection(collect(range(3)), optimizer=PlanOptimizer(rules=()))
+        self.assertEqual(c.map(str).map(int).list(), [0, 1, 2])
+        self.assertEqual(c.statistics['stages_merged'], 0)
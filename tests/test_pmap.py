@@ -0,0 +1,26 @@
+import unittest
+
+from iterable_collections import collect
+
+
+class TestPMap(unittest.TestCase):
+
+    def test_list(self):
+        c = collect(list(range(-5, 5))).pmap(abs, workers=2)
+        self.assertEqual(c.iterable, list(map(abs, range(-5, 5))))
+
+    def test_iterator(self):
+        c = collect(iter(range(-5, 5))).pmap(abs, workers=2, chunksize=3)
+        self.assertEqual(c.iterable, list(map(abs, range(-5, 5))))
+
+    def test_dict(self):
+        c = collect({'a': 1, 'b': 2}).pmap(str.upper, workers=2)
+        self.assertEqual(c.iterable, ['A', 'B'])
+
+    def test_unordered(self):
+        c = collect(range(-50, 50)).pmap(abs, workers=2, chunksize=7, ordered=False)
+        self.assertEqual(sorted(c.iterable), sorted(map(abs, range(-50, 50))))
+
+    def test_error(self):
+        with self.assertRaises(TypeError):
+            collect(['a', 1]).pmap(abs, workers=2)
@@ -0,0 +1,30 @@
+import operator
+import unittest
+from functools import reduce
+
+from iterable_collections import collect
+
+
+class TestPReduce(unittest.TestCase):
+
+    def test_list(self):
+        self.assertEqual(collect(list(range(100))).preduce(operator.add, workers=2), sum(range(100)))
+
+    def test_initializer(self):
+        self.assertEqual(collect(range(10)).preduce(operator.add, 100, workers=2, chunksize=3), 145)
+
+    def test_order(self):
+        c = collect(list('abcdefghij'))
+        self.assertEqual(c.preduce(operator.concat, workers=3, chunksize=2), 'abcdefghij')
+
+    def test_single(self):
+        self.assertEqual(collect([1]).preduce(operator.add), 1)
+        self.assertEqual(collect([]).preduce(operator.add, 0), 0)
+
+    def test_empty(self):
+        with self.assertRaises(TypeError):
+            collect([]).preduce(operator.add)
+
+    def test_matches_reduce(self):
+        c = collect(range(1, 20))
+        self.assertEqual(c.preduce(operator.mul, workers=2), reduce(operator.mul, range(1, 20)))
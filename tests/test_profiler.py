@@ -0,0 +1,102 @@
+import gc
+import threading
+import unittest
+import weakref
+
+from iterable_collections import collect
+from iterable_collections.collection import default_collection_type, profiled_collection_type
+from iterable_collections.factory import default_registry
+from iterable_collections.profiling import Profiler, profiled_registry
+from iterable_collections.strategy import ProfilingHookInterface
+
+
+class RecordingHook(ProfilingHookInterface):
+    def __init__(self):
+        self.calls = []
+
+    def record(self, name, timings, input_size, output_size):
+        self.calls.append((name, len(timings), input_size, output_size))
+
+
+class TestProfiler(unittest.TestCase):
+
+    def test_records_calls(self):
+        profiler = Profiler()
+        c = collect(range(10), profiler=profiler).map(lambda x: x * 2).list_().sorted(reverse=True)
+        self.assertEqual(c.list(), [18, 16, 14, 12, 10, 8, 6, 4, 2, 0])
+        self.assertEqual(sorted(profiler.profiles), ['list', 'list_', 'map', 'sorted'])
+        self.assertEqual(profiler.profiles['sorted'].calls, 1)
+        self.assertEqual(profiler.profiles['sorted'].input_size, 10)
+        self.assertEqual(profiler.profiles['sorted'].output_size, 10)
+        self.assertEqual(profiler.profiles['map'].output_size, 0)
+
+    def test_phases(self):
+        hook = RecordingHook()
+        collect({3, 1, 2}, profiler=hook).reversed()
+        self.assertEqual(hook.calls, [('list', 4, 3, 3), ('reversed', 4, 3, None)])
+
+    def test_uncompiled_call(self):
+        hook = RecordingHook()
+        registry = profiled_registry(default_registry(), hook)
+        registry['len'](collect([1, 2]))
+        self.assertEqual(hook.calls, [('len', 4, 2, None)])
+
+    def test_lazy(self):
+        profiler = Profiler()
+        c = collect([3, 1, 2], lazy=True, profiler=profiler).sorted().reversed()
+        self.assertEqual(c.list(), [3, 2, 1])
+        self.assertEqual(profiler.profiles['sorted'].calls, 1)
+
+    def test_error_is_not_recorded(self):
+        profiler = Profiler()
+        with self.assertRaises(TypeError):
+            collect([1, 'a'], profiler=profiler).sorted()
+        self.assertEqual(profiler.profiles, {})
+
+    def test_report(self):
+        profiler = Profiler()
+        collect(range(1000), profiler=profiler).list_().sorted()
+        lines = profiler.report().splitlines()
+        self.assertEqual(lines[0].split(), ['method', 'calls', 'total', *Profiler.phases, 'in', 'out'])
+        self.assertEqual({line.split()[0] for line in lines[1:]}, {'list_', 'sorted'})
+        self.assertEqual([p.name for p in profiler.summary()], [line.split()[0] for line in lines[1:]])
+
+    def test_reset(self):
+        profiler = Profiler()
+        collect([1], profiler=profiler).len()
+        profiler.reset()
+        self.assertEqual(profiler.summary(), [])
+
+    def test_threads(self):
+        profiler = Profiler()
+        threads = [threading.Thread(target=lambda: collect([1], profiler=profiler).len()) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(profiler.profiles['len'].calls, 8)
+
+    def test_type_is_cached(self):
+        profiler = Profiler()
+        self.assertIs(
+            profiled_collection_type(profiler, default_registry())[0],
+            type(collect([], profiler=profiler))
+        )
+        self.assertIsNot(type(collect([], profiler=Profiler())), type(collect([], profiler=profiler)))
+
+    def test_hook_is_released(self):
+        hooks = []
+        for _ in range(10):
+            profiler = Profiler()
+            collect([1], profiler=profiler).len()
+            hooks.append(weakref.ref(profiler))
+        profiler = Profiler()
+        collect([1], profiler=profiler).len()
+        gc.collect()
+        self.assertEqual([hook() for hook in hooks], [None] * 10)
+        self.assertIs(profiled_collection_type(profiler, default_registry())[1]['len'].profiling_hook, profiler)
+
+    def test_disabled(self):
+        self.assertIs(type(collect([])), default_collection_type())
+        self.assertIsNone(default_registry()['map'].profiling_hook)
+        self.assertNotIn('clock', default_registry().methods['map'].__globals__)
@@ -0,0 +1,53 @@
+import statistics
+import unittest
+
+from iterable_collections.reducers import Aggregate, ArgMax, ArgMin, Count, First, Last, Max, Mean, Min, Sum, \
+    Variance, aggregate
+
+DATA = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+
+
+class TestReducers(unittest.TestCase):
+
+    def test_reduce(self):
+        self.assertEqual(Count().reduce(DATA), len(DATA))
+        self.assertEqual(Sum().reduce(DATA), sum(DATA))
+        self.assertEqual(Sum(start=10).reduce(DATA), sum(DATA, 10))
+        self.assertEqual(Min().reduce(DATA), min(DATA))
+        self.assertEqual(Max().reduce(DATA), max(DATA))
+        self.assertEqual(Mean().reduce(DATA), statistics.mean(DATA))
+        self.assertAlmostEqual(Variance().reduce(DATA), statistics.pvariance(DATA))
+        self.assertAlmostEqual(Variance(ddof=1).reduce(DATA), statistics.variance(DATA))
+        self.assertEqual(First().reduce(DATA), 3)
+        self.assertEqual(Last().reduce(DATA), 3)
+        self.assertEqual(ArgMin(key=lambda x: -x).reduce(DATA), 9)
+        self.assertEqual(ArgMax(key=lambda x: x % 5).reduce(DATA), 4)
+
+    def test_empty(self):
+        for reducer in (Min(), Max(), Mean(), Variance(), First(), Last(), ArgMin(), ArgMax()):
+            self.assertIsNone(reducer.reduce([]))
+        self.assertEqual(Min(default=0).reduce([]), 0)
+
+    def test_combine(self):
+        reducers = dict(
+            count=Count(), sum=Sum(start=1), min=Min(), max=Max(), mean=Mean(), variance=Variance(), first=First(),
+            last=Last(), argmin=ArgMin(), argmax=ArgMax()
+        )
+        expected = aggregate(DATA, **reducers)
+        for split in range(len(DATA) + 1):
+            a = Aggregate(**reducers)
+            result = a.result(a.combine(a.fold(DATA[:split]), a.fold(DATA[split:])))
+            self.assertEqual(result.keys(), expected.keys())
+            for name in expected:
+                self.assertAlmostEqual(result[name], expected[name], msg=name)
+
+    def test_single_pass(self):
+        result = aggregate(iter(DATA), count=Count(), min=Min(), max=Max())
+        self.assertEqual(result, {'count': 10, 'min': 1, 'max': 9})
+
+    def test_step(self):
+        a = Aggregate(count=Count(), max=Max())
+        state = a.initial()
+        for x in DATA:
+            state = a.step(state, x)
+        self.assertEqual(a.result(state), {'count': 10, 'max': 9})
@@ -0,0 +1,38 @@
+import threading
+import unittest
+
+from iterable_collections import collect
+from iterable_collections.factory import DefaultMethodStrategyFactory, StrategyRegistry, default_registry
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_default_registry_is_shared(self):
+        self.assertIs(default_registry(), default_registry())
+        self.assertIs(collect([1])._strategies, collect([2])._strategies)
+
+    def test_default_registry_threads(self):
+        registries = []
+        threads = [threading.Thread(target=lambda: registries.append(default_registry())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertTrue(all(r is default_registry() for r in registries))
+
+    def test_from_factory(self):
+        registry = StrategyRegistry.from_factory(DefaultMethodStrategyFactory())
+        self.assertEqual(set(registry), set(DefaultMethodStrategyFactory().create()))
+        self.assertIn('map', registry)
+        self.assertNotIn('foo', registry)
+
+    def test_immutable(self):
+        registry = StrategyRegistry({'map': default_registry()['map']})
+        with self.assertRaises(TypeError):
+            registry['filter'] = default_registry()['filter']
+        with self.assertRaises(TypeError):
+            registry._strategies['filter'] = default_registry()['filter']
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            collect([]).foo()
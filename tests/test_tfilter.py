@@ -0,0 +1,20 @@
+import unittest
+
+from iterable_collections import collect
+
+
+class TestTFilter(unittest.TestCase):
+
+    def test_list(self):
+        c = collect([0, 1, '', 'a', None, 2]).tfilter(bool, workers=2)
+        self.assertEqual(c.list(), [1, 'a', 2])
+
+    def test_unordered(self):
+        c = collect(range(100)).tfilter(lambda x: x % 2, workers=4, ordered=False)
+        self.assertEqual(sorted(c.list()), list(range(1, 100, 2)))
+
+    def test_collect_errors(self):
+        errors = []
+        c = collect([1, 'a', 2]).tfilter(lambda x: x > 1, errors=errors)
+        self.assertEqual(c.list(), [2])
+        self.assertIsInstance(errors[0], TypeError)
@@ -0,0 +1,100 @@
+import threading
+import time
+import unittest
+from concurrent.futures import TimeoutError
+
+from iterable_collections import collect
+from iterable_collections.factory import default_registry
+from iterable_collections.strategy import ThreadedMethodStrategy, StoreResultStrategy, ReturnInstanceStrategy, \
+    PartialIterableBindingStrategy, UnformattedArgumentFormattingStrategy, PreProcessingStrategy, \
+    GetItemErrorHandlingStrategy
+from iterable_collections.collection import collection_type
+
+
+def slow(x):
+    time.sleep(0.01 * (5 - x))
+    return x * 2
+
+
+class TestTMap(unittest.TestCase):
+
+    def test_list(self):
+        c = collect(list(range(5))).tmap(slow, workers=5)
+        self.assertEqual(c.list(), [0, 2, 4, 6, 8])
+
+    def test_unordered(self):
+        c = collect(range(5)).tmap(slow, workers=5, ordered=False)
+        self.assertEqual(sorted(c.list()), [0, 2, 4, 6, 8])
+
+    def test_dict(self):
+        c = collect({'a': 1, 'b': 2}).tmap(str.upper)
+        self.assertEqual(c.list(), ['A', 'B'])
+
+    def test_backpressure(self):
+        consumed = []
+
+        def source():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        c = collect(source()).tmap(abs, workers=2, max_pending=3)
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(iter(c)), 0)
+        self.assertLessEqual(len(consumed), 3)
+        self.assertEqual(c.list(), list(range(1, 100)))
+
+    def test_error(self):
+        with self.assertRaises(TypeError):
+            collect(['a', 1]).tmap(abs).list()
+
+    def test_collect_errors(self):
+        errors = []
+        c = collect([-1, 'a', -2]).tmap(abs, errors=errors)
+        self.assertEqual(c.list(), [1, 2])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], TypeError)
+
+    def test_timeout(self):
+        errors = []
+        c = collect([0.2, 0, 0]).tmap(lambda x: time.sleep(x) or x, workers=3, timeout=0.05, errors=errors)
+        self.assertEqual(c.list(), [0, 0])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], TimeoutError)
+
+    def test_timeout_excludes_queueing(self):
+        release = threading.Event()
+
+        class Errors(list):
+            def append(self, error):
+                super().append(error)
+                release.set()
+
+        def work(x):
+            if x == 'blocked':
+                release.wait(10)
+            return x
+
+        errors = Errors()
+        c = collect(['blocked', 'a', 'b']).tmap(work, workers=1, timeout=0.5, errors=errors)
+        self.assertEqual(c.list(), ['a', 'b'])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], TimeoutError)
+
+    def test_timeout_unordered(self):
+        with self.assertRaises(TimeoutError):
+            collect([0.2, 0]).tmap(lambda x: time.sleep(x), workers=2, timeout=0.05, ordered=False).list()
+
+    def test_error_strategy(self):
+        strategy = ThreadedMethodStrategy(
+            'tmap',
+            StoreResultStrategy(),
+            ReturnInstanceStrategy(),
+            PartialIterableBindingStrategy(),
+            UnformattedArgumentFormattingStrategy(),
+            PreProcessingStrategy(),
+            GetItemErrorHandlingStrategy()
+        )
+        c = collection_type({'tmap': strategy, 'list': default_registry()['list']})([[1], []], {})
+        with self.assertRaisesRegex(IndexError, 'Index 0 is not set on iterable.'):
+            c.tmap(lambda x: x[0]).list()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+
+from iterable_collections import collect, collect_csv
+
+
+class TestToCsv(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.csv')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def read(self):
+        with open(self.path, newline='') as f:
+            return f.read()
+
+    def test_dicts(self):
+        self.assertEqual(collect([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]).to_csv(self.path), 2)
+        self.assertEqual(self.read(), 'a,b\r\n1,2\r\n3,4\r\n')
+
+    def test_nt_items(self):
+        collect({'x': 1, 'y': 2}).nt_items().to_csv(self.path)
+        self.assertEqual(self.read(), 'key,value\r\nx,1\r\ny,2\r\n')
+
+    def test_sequences(self):
+        collect(iter([(1, 2), (3, 4)])).to_csv(self.path, batch_size=1)
+        self.assertEqual(self.read(), '1,2\r\n3,4\r\n')
+
+    def test_header(self):
+        collect([(1, 2)]).to_csv(self.path, header=('a', 'b'))
+        self.assertEqual(self.read(), 'a,b\r\n1,2\r\n')
+
+    def test_no_header(self):
+        collect([{'a': 1}]).to_csv(self.path, header=False)
+        self.assertEqual(self.read(), '1\r\n')
+
+    def test_round_trip(self):
+        rows = [{'id': str(i), 'name': 'n, {}'.format(i)} for i in range(2500)]
+        collect(rows).to_csv(self.path)
+        self.assertEqual(collect_csv(self.path).list(), rows)
+
+    def test_empty(self):
+        self.assertEqual(collect([]).to_csv(self.path), 0)
+        self.assertEqual(self.read(), '')
@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from iterable_collections import collect, collect_jsonl
+
+
+class TestToJsonl(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.jsonl')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def read(self):
+        with open(self.path) as f:
+            return f.read()
+
+    def test_values(self):
+        self.assertEqual(collect([{'a': 1}, [2], 'x']).to_jsonl(self.path), 3)
+        self.assertEqual(self.read(), '{"a": 1}\n[2]\n"x"\n')
+
+    def test_nt_items(self):
+        collect({'x': 1}).nt_items().to_jsonl(self.path)
+        self.assertEqual(self.read(), '{"key": "x", "value": 1}\n')
+
+    def test_encoder_options(self):
+        collect([{'b': 1, 'a': 2}]).to_jsonl(self.path, sort_keys=True, separators=(',', ':'))
+        self.assertEqual(self.read(), '{"a":2,"b":1}\n')
+
+    def test_round_trip(self):
+        values = ({'id': i, 'even': i % 2 == 0} for i in range(3000))
+        collect(values).to_jsonl(self.path, batch_size=100)
+        self.assertEqual(collect_jsonl(self.path).map(lambda x: x['id']).list(), list(range(3000)))
+
+    def test_empty(self):
+        self.assertEqual(collect([]).to_jsonl(self.path), 0)
+        self.assertEqual(self.read(), '')
@@ -0,0 +1,27 @@
+import unittest
+
+from iterable_collections import collect
+
+
+class TestTopK(unittest.TestCase):
+
+    def test_list(self):
+        c = collect([3, 1, 4, 1, 5, 9, 2, 6]).top_k(3)
+        self.assertEqual(c.iterable, [9, 6, 5])
+
+    def test_iterator(self):
+        c = collect(iter(range(100))).top_k(2)
+        self.assertEqual(c.iterable, [99, 98])
+
+    def test_key(self):
+        c = collect(['aaa', 'b', 'cc']).top_k(2, key=len)
+        self.assertEqual(c.iterable, ['aaa', 'cc'])
+
+    def test_more_than_length(self):
+        c = collect([1, 2]).top_k(5)
+        self.assertEqual(c.iterable, [2, 1])
+
+    def test_lazy(self):
+        c = collect(range(10), lazy=True).top_k(3).reversed()
+        self.assertEqual(c.list(), [7, 8, 9])
+        self.assertEqual(c.statistics['conversions_elided'], 1)
@@ -1,34 +1,97 @@
 import unittest
 
 from iterable_collections import collect
+from iterable_collections.utils import BloomFilter
 
 
 class TestUnique(unittest.TestCase):
 
     def test_list(self):
-        c = collect(list(range(10))).unique()
-        self.assertEqual(c.iterable, set(range(10)))
+        c = collect(list(range(10)) * 2).unique()
+        self.assertEqual(c.list(), list(range(10)))
 
     def test_set(self):
         c = collect(set(range(10))).unique()
-        self.assertEqual(c.iterable, set(range(10)))
+        self.assertEqual(c.list(), list(set(range(10))))
 
     def test_tuple(self):
         c = collect(tuple(range(10))).unique()
-        self.assertEqual(c.iterable, set(range(10)))
+        self.assertEqual(c.list(), list(range(10)))
 
     def test_iterator(self):
         c = collect(iter(range(10))).unique()
-        self.assertEqual(c.iterable, set(range(10)))
+        self.assertEqual(c.list(), list(range(10)))
 
     def test_dict(self):
         c = collect({'a': 1, 'b': 2}).unique()
-        self.assertEqual(c.iterable, set({'a': 1, 'b': 2}))
+        self.assertEqual(c.list(), ['a', 'b'])
 
     def test_dict_items(self):
         c = collect({'a': 1, 'b': 2}.items()).unique()
-        self.assertEqual(c.iterable, set({'a': 1, 'b': 2}.items()))
+        self.assertEqual(c.list(), [('a', 1), ('b', 2)])
 
     def test_enumerate(self):
         c = collect(list(range(10))).enumerate().unique()
-        self.assertEqual(c.iterable, set(enumerate(range(10))))
+        self.assertEqual(c.list(), list(enumerate(range(10))))
+
+    def test_order(self):
+        c = collect([3, 1, 3, 2, 1]).unique()
+        self.assertEqual(c.list(), [3, 1, 2])
+
+    def test_lazy(self):
+        consumed = []
+
+        def source():
+            for i in [1, 1, 2, 3]:
+                consumed.append(i)
+                yield i
+
+        c = collect(source()).unique()
+        self.assertEqual(next(iter(c)), 1)
+        self.assertEqual(consumed, [1])
+
+    def test_key(self):
+        c = collect([{'id': 1}, {'id': 2}, {'id': 1, 'x': 0}]).unique(key=lambda d: d['id'])
+        self.assertEqual(c.list(), [{'id': 1}, {'id': 2}])
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            collect([[1], [1]]).unique().list()
+        self.assertEqual(collect([[1], [2], [1]]).unique(key=tuple).list(), [[1], [2]])
+
+    def test_window(self):
+        self.assertEqual(collect([1, 2, 1, 3, 1]).unique(window=1).list(), [1, 2, 1, 3, 1])
+        self.assertEqual(collect([1, 2, 1, 3, 1]).unique(window=2).list(), [1, 2, 3])
+        self.assertEqual(collect([1, 2, 3, 1]).unique(window=2).list(), [1, 2, 3, 1])
+
+    def test_window_recently_seen(self):
+        c = collect([1, 2, 1, 3, 1, 2]).unique(window=2)
+        self.assertEqual(c.list(), [1, 2, 3, 2])
+
+    def test_capacity(self):
+        c = collect(list(range(100)) * 2).unique(capacity=100, error_rate=0.0001)
+        self.assertEqual(c.list(), list(range(100)))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            collect([]).unique(window=0)
+        with self.assertRaises(ValueError):
+            collect([]).unique(window=1, capacity=1)
+        with self.assertRaises(ValueError):
+            collect([]).unique(capacity=1, error_rate=1)
+
+
+class TestBloomFilter(unittest.TestCase):
+
+    def test_add(self):
+        bloom = BloomFilter(100)
+        self.assertTrue(bloom.add('a'))
+        self.assertFalse(bloom.add('a'))
+        self.assertIn('a', bloom)
+
+    def test_error_rate(self):
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(i)
+        false_positives = sum(i in bloom for i in range(1000, 11000))
+        self.assertLess(false_positives, 300)
@@ -0,0 +1,84 @@
+import unittest
+from array import array
+
+from iterable_collections import collect
+from iterable_collections.utils import SequenceView
+
+
+class TestView(unittest.TestCase):
+
+    def test_list(self):
+        data = list(range(10))
+        c = collect(data).view(2, 8, 2)
+        self.assertIsInstance(c.iterable, SequenceView)
+        self.assertEqual(c.list(), data[2:8:2])
+
+    def test_reads_source(self):
+        data = [1, 2, 3]
+        c = collect(data).view(1)
+        data[2] = 4
+        self.assertEqual(c.list(), [2, 4])
+
+    def test_iterator(self):
+        c = collect(iter(range(5))).view(-2)
+        self.assertEqual(c.list(), [3, 4])
+
+    def test_set(self):
+        c = collect({1, 2, 3}).view()
+        self.assertEqual(sorted(c.list()), [1, 2, 3])
+
+    def test_slice(self):
+        data = bytes(range(100))
+        c = collect(data).view(10).slice(5, 20, 3)
+        self.assertIsInstance(c.iterable, SequenceView)
+        self.assertEqual(c.list(), list(data[10:][5:20:3]))
+
+    def test_chunks(self):
+        data = memoryview(bytes(range(10)))
+        c = collect(data).view().slice(1).chunks(4)
+        self.assertTrue(all(isinstance(chunk, SequenceView) for chunk in c.iterable))
+        self.assertEqual([list(chunk) for chunk in c.iterable], [[1, 2, 3, 4], [5, 6, 7, 8], [9]])
+
+    def test_chunks_container(self):
+        c = collect(array('q', range(5))).view().chunks(2, tuple)
+        self.assertEqual(c.iterable, [(0, 1), (2, 3), (4,)])
+
+    def test_reversed(self):
+        c = collect([1, 2, 3, 4]).view(1).reversed()
+        self.assertEqual(c.list(), [4, 3, 2])
+
+    def test_lazy(self):
+        c = collect([1, 2, 3, 4], lazy=True).view().slice(1).pop()
+        self.assertEqual(c, 4)
+
+
+class TestSequenceView(unittest.TestCase):
+
+    def test_getitem(self):
+        view = SequenceView(list(range(10)), 2, 8)
+        self.assertEqual(view[0], 2)
+        self.assertEqual(view[-1], 7)
+        with self.assertRaises(IndexError):
+            view[6]
+
+    def test_nested_slice(self):
+        data = list(range(20))
+        view = SequenceView(data, 1, 19, 2)[::-1][1:5]
+        self.assertEqual(view, data[1:19:2][::-1][1:5])
+        self.assertEqual(SequenceView(view, 1), data[1:19:2][::-1][1:5][1:])
+
+    def test_reversed(self):
+        view = SequenceView('abcdef', 1, 4)
+        self.assertEqual(list(reversed(view)), ['d', 'c', 'b'])
+
+    def test_contains(self):
+        self.assertIn(3, SequenceView([1, 2, 3], 1))
+        self.assertNotIn(1, SequenceView([1, 2, 3], 1))
+
+    def test_materialise(self):
+        self.assertEqual(SequenceView([1, 2, 3, 4], None, None, -2).materialise(), [4, 2])
+        self.assertEqual(SequenceView(array('i', range(5)), 1, 3).materialise(), array('i', [1, 2]))
+        self.assertEqual(SequenceView(memoryview(b'abcdef'), 2)[::-1].materialise(), b'fedc')
+
+    def test_repr(self):
+        self.assertEqual(repr(SequenceView(b'abc', 1)), 'SequenceView(bytes, range(1, 3))')